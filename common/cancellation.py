@@ -0,0 +1,95 @@
+"""
+크롤링 협조적 취소(cancellation) 토큰
+
+GUI나 호출자가 cancel()을 호출하면 목록 페이지 루프, 상세 크롤링 worker,
+요청 간 대기(sleep)가 토큰을 확인하고 가능한 빨리 멈춘다.
+이미 수집된 항목은 부분 결과로 반환된다.
+"""
+
+import concurrent.futures
+import logging
+import threading
+from typing import Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlCancelled(Exception):
+    """취소 토큰에 의해 작업이 중단됨"""
+
+
+class CancellationToken:
+    """스레드 간에 공유하는 취소 신호"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """취소 요청 (여러 번 호출해도 콜백은 한 번만 실행)"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug(f"취소 콜백 실행 오류: {str(e)}")
+
+    def register(self, callback: Callable[[], None]) -> None:
+        """
+        취소 시 실행할 콜백 등록 (세션 종료 등)
+        이미 취소된 상태라면 즉시 실행
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise CrawlCancelled("사용자 요청으로 작업이 취소되었습니다.")
+
+    def wait(self, seconds: float) -> bool:
+        """
+        최대 seconds 동안 대기 (취소되면 즉시 반환)
+
+        Returns:
+            취소되었으면 True
+        """
+        return self._event.wait(seconds)
+
+
+def iter_completed(
+    futures: Dict[concurrent.futures.Future, object],
+    cancel_token: Optional[CancellationToken] = None,
+    poll_interval: float = 0.2,
+) -> Iterator[concurrent.futures.Future]:
+    """
+    as_completed 대체: 완료된 future를 순서대로 반환하되,
+    취소 토큰이 설정되면 남은 future를 취소하고 즉시 종료
+    """
+    if cancel_token is None:
+        yield from concurrent.futures.as_completed(futures)
+        return
+
+    pending = set(futures)
+    while pending:
+        if cancel_token.cancelled:
+            for future in pending:
+                future.cancel()
+            return
+        done, pending = concurrent.futures.wait(
+            pending, timeout=poll_interval, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            yield future
@@ -0,0 +1,128 @@
+"""
+컬럼 단위 결과 누적기
+
+크롤링이 끝난 항목을 행(dict) 목록으로 모았다가 pd.DataFrame(...)에서 타입을 추론하는 대신,
+항목이 완료될 때마다 필드 값을 컬럼별 버퍼에 바로 추가하고
+마지막에 한 번 지정된 dtype으로 데이터프레임(또는 Arrow 테이블)을 만든다.
+
+- 정수 컬럼: array('q') 버퍼 → int64 (항목당 8바이트, 변환 시 한 번만 복사)
+  정수가 아닌 값이 들어오면 해당 컬럼만 object 버퍼로 전환
+- 그 외 컬럼: list 버퍼 → object (None을 그대로 유지, Harmonizer의 결측 처리와 동일)
+
+사용 예:
+    builder = ColumnarBuilder.for_record(CombinedItem)
+    for item in items:
+        builder.append(item)
+    df = builder.to_dataframe()
+"""
+
+import typing
+from array import array
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Type, Union
+
+import numpy as np
+import pandas as pd
+
+INT64 = "int64"
+OBJECT = "object"
+
+
+def _dtype_for_annotation(annotation: Any) -> str:
+    """필드 타입 힌트에 대응하는 컬럼 dtype (int만 int64, 나머지는 object)"""
+    return INT64 if annotation is int else OBJECT
+
+
+class ColumnarBuilder:
+    """컬럼별 버퍼에 값을 누적하는 결과 빌더 (한 스레드에서 append)"""
+
+    def __init__(self, columns: Sequence[str], dtypes: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            columns: 컬럼명 (순서 유지)
+            dtypes: 컬럼별 dtype ('int64' 또는 'object', 지정하지 않은 컬럼은 object)
+        """
+        self.columns = tuple(columns)
+        dtypes = dtypes or {}
+        self.dtypes: Dict[str, str] = {name: dtypes.get(name, OBJECT) for name in self.columns}
+        self._buffers: List[Union[array, list]] = [
+            array("q") if self.dtypes[name] == INT64 else [] for name in self.columns
+        ]
+        self._length = 0
+
+    @classmethod
+    def for_record(cls, record_class: Type) -> "ColumnarBuilder":
+        """Record 데이터클래스의 필드/타입 힌트로 빌더 생성"""
+        hints = typing.get_type_hints(record_class)
+        columns = record_class.columns()
+        return cls(columns, {name: _dtype_for_annotation(hints.get(name)) for name in columns})
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _demote(self, position: int) -> None:
+        """정수 버퍼를 object 버퍼로 전환 (정수가 아닌 값이 들어온 경우)"""
+        self._buffers[position] = list(self._buffers[position])
+        self.dtypes[self.columns[position]] = OBJECT
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        """columns 순서의 값 시퀀스 추가"""
+        for position, value in enumerate(row):
+            buffer = self._buffers[position]
+            try:
+                buffer.append(value)
+            except (TypeError, OverflowError):
+                self._demote(position)
+                self._buffers[position].append(value)
+        self._length += 1
+
+    def append(self, item: Any) -> None:
+        """Record 항목 추가 (to_row 값 순서 = columns 순서)"""
+        self.append_row(item.to_row())
+
+    def append_mapping(self, mapping: Mapping[str, Any]) -> None:
+        """dict 행 추가 (없는 키는 None)"""
+        self.append_row([mapping.get(name) for name in self.columns])
+
+    def extend(self, items: Iterable[Any]) -> "ColumnarBuilder":
+        for item in items:
+            self.append(item)
+        return self
+
+    def _column_array(self, position: int) -> np.ndarray:
+        buffer = self._buffers[position]
+        if isinstance(buffer, array):
+            # 버퍼를 참조하는 view가 남아 있으면 이후 append가 막히므로 복사
+            return np.frombuffer(buffer, dtype=np.int64).copy() if len(buffer) else np.empty(0, dtype=np.int64)
+        values = np.empty(len(buffer), dtype=object)
+        values[:] = buffer
+        return values
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """지정된 dtype으로 데이터프레임 생성"""
+        # dtype을 명시해야 pandas의 문자열 dtype 자동 추론을 건너뜀
+        data = {
+            name: pd.Series(self._column_array(position), dtype=self.dtypes[name], copy=False)
+            for position, name in enumerate(self.columns)
+        }
+        return pd.DataFrame(data, columns=list(self.columns), copy=False)
+
+    def to_arrow(self):
+        """pyarrow Table로 변환 (pyarrow 필요)"""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow()에는 pyarrow가 필요합니다: pip install pyarrow") from e
+
+        arrays = []
+        for position, name in enumerate(self.columns):
+            buffer = self._buffers[position]
+            if isinstance(buffer, array):
+                # _column_array와 같이 복사본 사용 (버퍼를 공유하면 이후 append에서 BufferError)
+                arrays.append(pa.array(self._column_array(position), type=pa.int64()))
+            else:
+                # 문자열 컬럼은 string, 그 외(dict 등)는 pyarrow 추론
+                try:
+                    arrays.append(pa.array(buffer, type=pa.string()))
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    arrays.append(pa.array(buffer))
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
@@ -0,0 +1,325 @@
+"""
+크롤링 지표(metrics) 레지스트리
+
+여러 worker 스레드가 동시에 갱신하는 카운터, 게이지, 지연시간 히스토그램,
+실패 기록을 한 곳에서 관리한다. 모든 갱신은 지표별 lock 안에서 이뤄지므로
+`+= 1` 경합으로 건수가 누락되지 않는다.
+
+- 모든 유닛은 프로세스 전역 레지스트리(get_registry)에 `{유닛}.{단계}.{지표}` 이름으로 기록
+  (처리 건수, 실패 건수, 요청 지연시간, 진행 중인 작업 수 등), 누적 값은 초기화하지 않으므로
+  외부에서 수집/알림에 그대로 사용 가능
+- 실행 단위 건수는 RunMetrics가 실행 시작 시점 스냅샷과의 차이로 계산
+  (같은 프로세스에서 여러 크롤러가 차례로 실행되어도 전역 값을 지우지 않음)
+
+사용 예:
+    from common.metrics import RunMetrics, get_registry
+
+    with get_registry().histogram("late.detail.request_seconds").time():
+        ...
+    run = RunMetrics("late.detail")
+    processed = run.counter("processed")
+    run.start()
+    processed.inc()
+    run.count(processed)  # 이번 실행에서 증가한 값
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# 지연시간 히스토그램 기본 구간 (초)
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    __slots__ = ("name", "_value", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0
+
+    def snapshot(self) -> int:
+        return self._value
+
+
+class Gauge:
+    """현재 값을 나타내는 게이지 (진행 중인 작업 수, 남은 작업 수 등)"""
+
+    __slots__ = ("name", "_value", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self._value -= amount
+
+    @contextmanager
+    def track(self):
+        """with 블록 실행 중에만 1 증가 (진행 중인 작업 수)"""
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def reset(self) -> None:
+        self.set(0.0)
+
+    def snapshot(self) -> float:
+        return self._value
+
+
+class Histogram:
+    """고정 구간 히스토그램 (지연시간 측정용)"""
+
+    __slots__ = ("name", "buckets", "_counts", "_count", "_sum", "_max", "_lock")
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.name = name
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._reset_values()
+
+    def _reset_values(self) -> None:
+        # 마지막 칸은 가장 큰 구간을 넘는 값(+Inf)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        position = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[position] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    @contextmanager
+    def time(self):
+        """with 블록 실행 시간을 관측값으로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """구간 상한 기준 근사 분위수 (관측값이 없으면 None)"""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            max_value = self._max
+        if total == 0:
+            return None
+        threshold = q * total
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            if cumulative >= threshold:
+                return bound
+        return max_value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset_values()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total, max_value = self._count, self._sum, self._max
+            counts = list(self._counts)
+        bounds = [str(b) for b in self.buckets] + ["+Inf"]
+        return {
+            "count": count,
+            "sum": total,
+            "avg": total / count if count else 0.0,
+            "max": max_value,
+            "buckets": dict(zip(bounds, counts)),
+        }
+
+
+class FailureLog:
+    """실패 항목 기록 (건수 + 상세 내역)"""
+
+    __slots__ = ("name", "_items", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._items: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def record(self, *entry: Any) -> None:
+        with self._lock:
+            self._items.append(entry)
+
+    @property
+    def count(self) -> int:
+        return len(self._items)
+
+    @property
+    def items(self) -> List[tuple]:
+        """기록된 실패 항목의 사본"""
+        with self._lock:
+            return list(self._items)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._items = []
+
+    def snapshot(self) -> int:
+        return len(self._items)
+
+
+class MetricsRegistry:
+    """이름으로 지표를 조회/생성하는 레지스트리"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, metric_type: type, *args: Any):
+        # 이미 등록된 지표는 lock 없이 바로 반환 (hot path)
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = metric_type(name, *args)
+                    self._metrics[name] = metric
+        if not isinstance(metric, metric_type):
+            raise TypeError(f"지표 '{name}'은(는) 이미 {type(metric).__name__} 유형으로 등록되어 있습니다.")
+        return metric
+
+    def counter(self, name: str) -> Counter:
+        return self._get_or_create(name, Counter)
+
+    def gauge(self, name: str) -> Gauge:
+        return self._get_or_create(name, Gauge)
+
+    def histogram(self, name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(name, Histogram, buckets)
+
+    def failures(self, name: str) -> FailureLog:
+        return self._get_or_create(name, FailureLog)
+
+    def reset(self, prefix: str = "") -> None:
+        """prefix로 시작하는 지표 값 초기화 (등록은 유지)"""
+        for name, metric in list(self._metrics.items()):
+            if name.startswith(prefix):
+                metric.reset()
+
+    def metrics(self, prefix: str = "") -> Dict[str, Any]:
+        """prefix로 시작하는 지표 객체"""
+        return {name: metric for name, metric in sorted(self._metrics.items()) if name.startswith(prefix)}
+
+    def snapshot(self, prefix: str = "") -> Dict[str, Any]:
+        """prefix로 시작하는 지표의 현재 값"""
+        return {
+            name: metric.snapshot()
+            for name, metric in sorted(self._metrics.items())
+            if name.startswith(prefix)
+        }
+
+
+# 프로세스 전역 레지스트리
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """프로세스 전역 metrics 레지스트리 반환"""
+    return _registry
+
+
+class RunMetrics:
+    """
+    전역 레지스트리의 `{prefix}.*` 지표와 실행 단위 집계
+
+    지표 자체는 전역 레지스트리에 누적되고, count/failure_items는 start() 이후
+    (finish()를 호출했으면 그 시점까지) 증가분만 반환한다.
+    같은 prefix로 동시에 실행되는 크롤러가 있으면 실행 단위 값에는 서로의 증가분이 섞인다.
+    """
+
+    def __init__(self, prefix: str, registry: Optional[MetricsRegistry] = None):
+        self.prefix = prefix
+        self.registry = registry or get_registry()
+        self._baseline: Dict[str, Any] = {}
+        self._final: Optional[Dict[str, Any]] = None
+        self.start()
+
+    def counter(self, name: str) -> Counter:
+        return self.registry.counter(f"{self.prefix}.{name}")
+
+    def gauge(self, name: str) -> Gauge:
+        return self.registry.gauge(f"{self.prefix}.{name}")
+
+    def histogram(self, name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self.registry.histogram(f"{self.prefix}.{name}", buckets)
+
+    def failures(self, name: str) -> FailureLog:
+        return self.registry.failures(f"{self.prefix}.{name}")
+
+    def start(self) -> None:
+        """실행 시작: 현재 값을 기준점으로 저장"""
+        self._baseline = self.registry.snapshot(f"{self.prefix}.")
+        self._final = None
+
+    def finish(self) -> None:
+        """실행 종료: 이후 다른 실행의 증가분이 이번 실행 값에 섞이지 않도록 현재 값을 고정"""
+        self._final = self.registry.snapshot(f"{self.prefix}.")
+
+    def _current(self, metric: Union[Counter, FailureLog]) -> int:
+        if self._final is not None:
+            return self._final.get(metric.name, 0)
+        return metric.snapshot()
+
+    def count(self, metric: Union[Counter, FailureLog]) -> int:
+        """이번 실행에서 증가한 카운터 값 / 실패 건수"""
+        return self._current(metric) - self._baseline.get(metric.name, 0)
+
+    def failure_items(self, failures: FailureLog) -> List[tuple]:
+        """이번 실행에서 기록된 실패 항목"""
+        return failures.items[self._baseline.get(failures.name, 0):self._current(failures)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """이번 실행 값 (카운터/실패 건수는 증가분, 게이지/히스토그램은 현재 값)"""
+        return {
+            name: self.count(metric) if isinstance(metric, (Counter, FailureLog)) else metric.snapshot()
+            for name, metric in self.registry.metrics(f"{self.prefix}.").items()
+        }
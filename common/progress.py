@@ -0,0 +1,223 @@
+"""
+구조화된 진행 상황 이벤트
+
+크롤러가 stdout/tqdm 출력 대신 ProgressEvent(유닛, 단계, 완료 수, 전체 수, 처리 속도, 오류 수)를
+listener 콜백으로 전달한다. 여러 worker 스레드가 update를 호출해도 이벤트는 min_interval
+(기본 0.25초)마다 최대 한 번만 전달되므로 GUI가 초당 몇 번만 다시 그리면 된다.
+이벤트마다 증가하는 seq가 붙고 이전 seq 이벤트는 전달하지 않으므로 listener는 순서대로 받는다
+(큐를 거쳐 받는 쪽도 seq가 작은 이벤트는 버리면 됨).
+
+사용 예:
+    with ProgressReporter("late", "detail", total=len(items), listener=print) as progress:
+        for item in items:
+            ...
+            progress.update(errors=failures.count)
+"""
+
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 최소 전달 간격 (초), 초당 최대 4회
+DEFAULT_MIN_INTERVAL = 0.25
+# 처리 속도 지수 이동 평균 가중치 (tqdm smoothing과 같은 의미)
+DEFAULT_SMOOTHING = 0.3
+
+# 이벤트 순번 (모든 reporter 공통, 새 reporter의 이벤트도 이전 이벤트보다 큼)
+_event_sequence = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """진행 상황 스냅샷"""
+
+    unit: str
+    phase: str
+    done: int
+    total: Optional[int]
+    rate: float
+    errors: int = 0
+    elapsed: float = 0.0
+    finished: bool = False
+    seq: int = 0
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """진행률 0~1 (전체 수를 모르면 None)"""
+        if not self.total:
+            return None
+        return min(1.0, self.done / self.total)
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """남은 예상 시간 (초), 전체 수나 속도를 모르면 None"""
+        if not self.total or self.rate <= 0:
+            return None
+        return max(0, self.total - self.done) / self.rate
+
+
+ProgressListener = Callable[[ProgressEvent], None]
+
+
+class ProgressReporter:
+    """
+    진행 상황 집계 후 일정 간격으로 listener에 ProgressEvent 전달 (스레드 안전)
+
+    listener가 None이면 집계만 하고 아무것도 전달하지 않는다.
+    """
+
+    def __init__(self, unit: str, phase: str, total: Optional[int] = None,
+                 listener: Optional[ProgressListener] = None,
+                 min_interval: float = DEFAULT_MIN_INTERVAL,
+                 smoothing: float = DEFAULT_SMOOTHING,
+                 clock: Callable[[], float] = time.monotonic):
+        self.unit = unit
+        self.phase = phase
+        self.total = total
+        self.listener = listener
+        self.min_interval = min_interval
+        self.smoothing = smoothing
+        self.clock = clock
+        self.done = 0
+        self.errors = 0
+        self.rate = 0.0
+        self._lock = threading.Lock()
+        self._start = clock()
+        self._last_emit_time = self._start
+        self._last_emit_done = 0
+        self._rate_measured = False
+        self._closed = False
+        self._emit_lock = threading.Lock()
+        self._last_emitted_seq = 0
+
+    def start(self) -> None:
+        """시작 이벤트 전달 (완료 0건)"""
+        now = self.clock()
+        with self._lock:
+            event = self._snapshot(now)
+        self._emit(event)
+
+    def set_total(self, total: Optional[int]) -> None:
+        with self._lock:
+            self.total = total
+
+    def update(self, amount: int = 1, errors: Optional[int] = None) -> None:
+        """
+        완료 수 증가 (간격이 지났으면 이벤트 전달)
+
+        Args:
+            amount: 이번에 완료한 항목 수
+            errors: 현재까지의 누적 오류 수 (None이면 유지)
+        """
+        if self.listener is None:
+            with self._lock:
+                self.done += amount
+                if errors is not None:
+                    self.errors = errors
+            return
+
+        event = None
+        now = self.clock()
+        with self._lock:
+            self.done += amount
+            if errors is not None:
+                self.errors = errors
+            if not self._closed and now - self._last_emit_time >= self.min_interval:
+                self._update_rate(now)
+                event = self._snapshot(now)
+        if event is not None:
+            self._emit(event)
+
+    def close(self) -> None:
+        """마지막 상태를 finished 이벤트로 전달 (한 번만)"""
+        now = self.clock()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            elapsed = now - self._start
+            # 완료 이벤트의 속도는 전체 평균
+            self.rate = self.done / elapsed if elapsed > 0 else self.rate
+            event = self._snapshot(now, finished=True)
+        self._emit(event)
+
+    def _update_rate(self, now: float) -> None:
+        interval = now - self._last_emit_time
+        current = (self.done - self._last_emit_done) / interval if interval > 0 else 0.0
+        # 첫 측정은 그대로, 이후는 지수 이동 평균
+        if self._rate_measured:
+            self.rate = self.smoothing * current + (1 - self.smoothing) * self.rate
+        else:
+            self.rate = current
+            self._rate_measured = True
+        self._last_emit_time = now
+        self._last_emit_done = self.done
+
+    def _snapshot(self, now: float, finished: bool = False) -> ProgressEvent:
+        """현재 상태 이벤트 (self._lock 안에서 호출, seq 증가)"""
+        return ProgressEvent(
+            unit=self.unit,
+            phase=self.phase,
+            done=self.done,
+            total=self.total,
+            rate=self.rate,
+            errors=self.errors,
+            elapsed=now - self._start,
+            finished=finished,
+            seq=next(_event_sequence),
+        )
+
+    def _emit(self, event: ProgressEvent) -> None:
+        if self.listener is None:
+            return
+        # 스냅샷 이후 다른 스레드가 더 최근 이벤트를 먼저 전달했으면 버림 (완료 수가 뒤로 가지 않게)
+        with self._emit_lock:
+            if event.seq <= self._last_emitted_seq:
+                return
+            self._last_emitted_seq = event.seq
+            # listener 오류가 크롤링을 중단시키지 않도록 기록만 함
+            try:
+                self.listener(event)
+            except Exception as e:
+                logger.warning(f"진행 상황 listener 실행 오류: {str(e)}")
+
+    def __enter__(self) -> "ProgressReporter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """초 → 'H:MM:SS' / 'M:SS' (None이면 '--:--')"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def format_progress(event: ProgressEvent) -> str:
+    """진행 상황 한 줄 요약 (완료 수 / 전체 수, 진행률, 처리 속도, 남은 시간 또는 소요 시간, 오류 수)"""
+    if event.total:
+        parts = [f"{event.done:,} / {event.total:,} ({event.fraction * 100:.1f}%)"]
+    else:
+        parts = [f"{event.done:,}건"]
+    if event.finished:
+        parts.append(f"평균 {event.rate:.1f}건/s")
+        parts.append(f"소요 {format_duration(event.elapsed)}")
+    else:
+        parts.append(f"{event.rate:.1f}건/s")
+        parts.append(f"남은 시간 {format_duration(event.eta_seconds)}")
+    if event.errors:
+        parts.append(f"오류 {event.errors:,}")
+    return " · ".join(parts)
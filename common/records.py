@@ -0,0 +1,59 @@
+"""
+slots 데이터클래스 공통 행(row) 인터페이스
+
+모델 인스턴스는 인스턴스별 __dict__ 없이 slots로 저장하고,
+데이터프레임 변환 시에는 항목마다 dict를 만들지 않고 필드 순서대로 값 튜플을 넘긴다.
+
+사용 예:
+    @dataclass(slots=True)
+    class ListItem(Record):
+        ...
+
+    df = records_to_dataframe(items, ListItem)
+"""
+
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Tuple, Type
+
+import pandas as pd
+
+from common.columnar import ColumnarBuilder
+
+# 클래스별 컬럼명/값 추출기 캐시
+_COLUMNS: Dict[type, Tuple[str, ...]] = {}
+_GETTERS: Dict[type, Callable[[Any], tuple]] = {}
+
+
+class Record:
+    """slots 데이터클래스용 mixin (자체 슬롯 없음)"""
+
+    __slots__ = ()
+
+    @classmethod
+    def columns(cls) -> Tuple[str, ...]:
+        """데이터프레임 컬럼명 (필드 선언 순서)"""
+        columns = _COLUMNS.get(cls)
+        if columns is None:
+            columns = _COLUMNS[cls] = tuple(f.name for f in fields(cls))
+        return columns
+
+    def to_row(self) -> tuple:
+        """columns() 순서의 필드 값 튜플"""
+        cls = type(self)
+        getter = _GETTERS.get(cls)
+        if getter is None:
+            columns = cls.columns()
+            if len(columns) == 1:
+                # attrgetter는 이름이 하나면 튜플이 아닌 값을 반환
+                single = attrgetter(columns[0])
+                getter = lambda item: (single(item),)
+            else:
+                getter = attrgetter(*columns)
+            _GETTERS[cls] = getter
+        return getter(self)
+
+
+def records_to_dataframe(items: Iterable[Record], record_class: Type[Record]) -> pd.DataFrame:
+    """Record 목록을 데이터프레임으로 변환 (항목이 없어도 컬럼은 유지)"""
+    return ColumnarBuilder.for_record(record_class).extend(items).to_dataframe()
@@ -0,0 +1,112 @@
+"""
+상세 크롤링 작업 우선순위 스케줄링
+
+목록 API가 돌려준 순서 대신 등록일/회신일 기준 최신 문서부터 상세 작업을 제출하여
+(ThreadPoolExecutor, 작업 큐 모두 제출 순서대로 처리) 최신 문서가 먼저 수집되도록 한다.
+처음 수집된 일부 결과는 first results 콜백으로 전달하여 GUI 미리보기 등에 바로 표시할 수 있다.
+(count개가 모이거나 첫 결과 후 timeout초가 지나면 호출, 그 전에 수집이 끝나면 flush로 남은 결과 전달)
+"""
+
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# first results 콜백을 호출하는 기본 수집 건수
+DEFAULT_FIRST_RESULTS_COUNT = 50
+# 첫 결과 후 이 시간(초)이 지나면 count개가 모이지 않아도 콜백 호출
+DEFAULT_FIRST_RESULTS_TIMEOUT = 10.0
+
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def _sort_value(value: Any) -> str:
+    """날짜 문자열을 숫자만 남긴 비교용 값으로 변환 ('2024.01.02' == '2024-01-02')"""
+    if value is None:
+        return ""
+    return _NON_DIGIT_RE.sub("", str(value))
+
+
+def prioritize(items: Iterable[Any], key_field: Optional[str], descending: bool = True) -> List[Any]:
+    """
+    key_field 값 기준으로 항목 정렬 (기본: 내림차순 = 최신순)
+
+    값이 없는 항목은 항상 마지막에 두고, 같은 값끼리는 원래 순서를 유지한다.
+    key_field가 None이면 원래 순서 그대로 반환.
+    """
+    items = list(items)
+    if not key_field:
+        return items
+
+    present, missing = [], []
+    for item in items:
+        value = _sort_value(getattr(item, key_field, None))
+        (present if value else missing).append((value, item))
+    present.sort(key=lambda pair: pair[0], reverse=descending)
+    # reverse=True 정렬도 같은 값의 상대 순서는 유지됨 (stable)
+    return [item for _, item in present] + [item for _, item in missing]
+
+
+class FirstResultsNotifier:
+    """
+    처음 결과들을 모아 콜백을 한 번 호출
+
+    - count개가 모이면 호출
+    - 첫 결과 후 timeout초가 지난 뒤 결과가 들어오면 그때까지 모인 결과로 호출
+    - 수집이 끝났을 때 flush()를 부르면 count개 미만이어도 호출 (결과가 적은 실행)
+    - callback이 None이면 결과를 모으지 않음
+    """
+
+    def __init__(self, callback: Optional[Callable[[List[Any]], None]],
+                 count: int = DEFAULT_FIRST_RESULTS_COUNT,
+                 timeout: Optional[float] = DEFAULT_FIRST_RESULTS_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic):
+        self.callback = callback
+        self.count = max(1, count)
+        self.timeout = timeout
+        self.clock = clock
+        self._items: List[Any] = []
+        self._first_time: Optional[float] = None
+        self._notified = callback is None
+        self._lock = threading.Lock()
+
+    def add(self, item: Any) -> None:
+        if self._notified:
+            return
+        with self._lock:
+            if self._notified:
+                return
+            self._items.append(item)
+            now = self.clock()
+            if self._first_time is None:
+                self._first_time = now
+            timed_out = self.timeout is not None and now - self._first_time >= self.timeout
+            if len(self._items) < self.count and not timed_out:
+                return
+            items = self._take_locked()
+        self._call(items)
+
+    def flush(self) -> None:
+        """아직 호출 전이면 지금까지 모인 결과로 호출 (수집 완료 시)"""
+        if self._notified:
+            return
+        with self._lock:
+            if self._notified or not self._items:
+                return
+            items = self._take_locked()
+        self._call(items)
+
+    def _take_locked(self) -> List[Any]:
+        items, self._items = self._items, []
+        self._notified = True
+        return items
+
+    def _call(self, items: List[Any]) -> None:
+        # 콜백 오류가 크롤링을 중단시키지 않도록 기록만 함
+        try:
+            self.callback(items)
+        except Exception as e:
+            logger.warning(f"first results 콜백 실행 오류: {str(e)}")
@@ -0,0 +1,159 @@
+"""
+idx 해시 기반 샤드(shard) 분할 및 병합
+
+전체 기간 크롤링을 여러 프로세스/머신에 나눠 실행하기 위한 도구.
+각 유닛 main()의 --shard i/N 옵션은 필터링된 목록 항목 중
+idx 해시가 i 번째 샤드에 해당하는 항목만 상세 크롤링하고,
+결과를 샤드별 pickle 파일로 저장한다.
+
+병합:
+    python -m common.sharding merge late --shard-dir data/shards --output data/late_df.pkl
+"""
+
+import argparse
+import importlib
+import logging
+import re
+import zlib
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_DIR = "data/shards"
+
+Shard = Tuple[int, int]
+
+
+def parse_shard(value: str) -> Shard:
+    """
+    'i/N' 형식 문자열을 (i, N) 튜플로 변환 (i는 0부터 N-1)
+
+    argparse type으로도 사용 가능
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value or "")
+    if not match:
+        raise argparse.ArgumentTypeError(f"샤드 형식이 올바르지 않습니다: '{value}' (예: 0/4)")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count <= 0 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"샤드 번호는 0 이상 {count - 1} 이하여야 합니다: '{value}'")
+    return index, count
+
+
+def shard_key(item: Any, key_fields: Sequence[str]) -> str:
+    """항목의 키 필드 값을 이어 붙인 샤드 키"""
+    return "|".join(str(getattr(item, field)) for field in key_fields)
+
+
+def shard_of(key: str, shard_count: int) -> int:
+    """키가 속하는 샤드 번호 (프로세스/머신과 무관하게 항상 같은 값)"""
+    return zlib.crc32(key.encode("utf-8")) % shard_count
+
+
+def filter_shard(items: Iterable[Any], shard: Optional[Shard], key_fields: Sequence[str]) -> List[Any]:
+    """shard에 해당하는 항목만 반환 (shard가 None이면 전체)"""
+    items = list(items)
+    if shard is None:
+        return items
+    index, count = shard
+    return [item for item in items if shard_of(shard_key(item, key_fields), count) == index]
+
+
+def shard_output_path(shard_dir: str, unit: str, shard: Shard) -> Path:
+    """샤드 결과 파일 경로"""
+    index, count = shard
+    return Path(shard_dir) / f"{unit}_shard_{index}_of_{count}.pkl"
+
+
+def write_shard_output(df: pd.DataFrame, shard_dir: str, unit: str, shard: Shard) -> Path:
+    """샤드 결과를 pickle 파일로 저장"""
+    path = shard_output_path(shard_dir, unit, shard)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_pickle(path)
+    logger.info(f"샤드 결과 저장 완료: {path} ({len(df)}개 항목)")
+    return path
+
+
+def find_shard_outputs(shard_dir: str, unit: str) -> List[Path]:
+    """shard_dir에서 unit의 샤드 결과 파일 목록 (샤드 번호 순)"""
+    pattern = re.compile(rf"{re.escape(unit)}_shard_(\d+)_of_(\d+)\.pkl")
+    found = []
+    for path in Path(shard_dir).glob(f"{unit}_shard_*_of_*.pkl"):
+        match = pattern.fullmatch(path.name)
+        if match:
+            found.append(((int(match.group(2)), int(match.group(1))), path))
+    return [path for _, path in sorted(found)]
+
+
+def merge_shards(paths: Sequence[Path], key_fields: Sequence[str]) -> pd.DataFrame:
+    """
+    샤드 결과 파일을 하나의 결과 데이터프레임으로 병합
+
+    키 필드 기준으로 중복을 제거하고, 목록 순서(rownumber)로 정렬한다.
+    """
+    frames = [pd.read_pickle(path) for path in paths]
+    frames = [df for df in frames if not df.empty]
+    if not frames:
+        return pd.DataFrame()
+
+    merged = pd.concat(frames, ignore_index=True)
+    key_columns = [field for field in key_fields if field in merged.columns]
+    if key_columns:
+        before = len(merged)
+        merged = merged.drop_duplicates(subset=key_columns, keep="first")
+        if len(merged) != before:
+            logger.warning(f"샤드 간 중복 항목 {before - len(merged)}개를 제거했습니다.")
+    if "rownumber" in merged.columns:
+        merged = merged.sort_values("rownumber", kind="stable")
+    return merged.reset_index(drop=True)
+
+
+def _check_complete(paths: Sequence[Path], unit: str) -> None:
+    """모든 샤드 결과가 있는지 확인 (누락 시 경고)"""
+    counts = {}
+    for path in paths:
+        index, count = map(int, re.findall(r"\d+", path.name)[-2:])
+        counts.setdefault(count, set()).add(index)
+    for count, indexes in counts.items():
+        missing = sorted(set(range(count)) - indexes)
+        if missing:
+            logger.warning(f"{unit}: {count}개 샤드 중 {missing} 결과가 없습니다.")
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="샤드 결과 병합")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    merge_parser = subparsers.add_parser("merge", help="샤드 결과를 하나의 데이터프레임으로 병합")
+    merge_parser.add_argument("unit", choices=["late", "past", "integ"], help="크롤링 유닛")
+    merge_parser.add_argument("--shard-dir", type=str, default=DEFAULT_SHARD_DIR,
+                              help="샤드 결과 파일 디렉토리")
+    merge_parser.add_argument("--output", type=str, default=None,
+                              help="병합 결과 pickle 경로 (기본값: data/<unit>_df.pkl)")
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    key_fields = importlib.import_module(f"{args.unit}.config").SHARD_KEY_FIELDS
+    paths = find_shard_outputs(args.shard_dir, args.unit)
+    if not paths:
+        logger.error(f"병합할 샤드 결과가 없습니다: {args.shard_dir}/{args.unit}_shard_*.pkl")
+        return
+    _check_complete(paths, args.unit)
+
+    merged = merge_shards(paths, key_fields)
+    output = Path(args.output or f"data/{args.unit}_df.pkl")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    merged.to_pickle(output)
+    logger.info(f"병합 완료: {len(paths)}개 샤드 → {output} ({len(merged)}개 항목)")
+
+
+if __name__ == "__main__":
+    main()
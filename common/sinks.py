@@ -0,0 +1,160 @@
+"""
+크롤링 결과 스트리밍 sink
+
+상세 크롤링이 끝난 항목을 데이터프레임으로 모으는 것과 별도로, 완료되는 대로 파일에 기록한다.
+JsonlSink는 항목 하나를 JSON 한 줄(NDJSON)로 버퍼에 쌓았다가 일정 건수/시간마다 한 번에 기록하므로
+긴 크롤링 중에도 다른 프로세스가 파일을 tail 하며 결과를 읽을 수 있다.
+(시간 기준 기록은 백그라운드 타이머 스레드가 하므로 새 항목이 뜸해도 버퍼가 오래 남지 않음)
+
+사용 예:
+    with JsonlSink("data/late_items.jsonl") as sink:
+        crawler = DetailCrawler(sink=sink)
+        crawler.get_combined_dataframe(list_items)
+
+    for chunk in iter_jsonl_chunks("data/late_items.jsonl", chunk_size=50_000):
+        ...
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterator, List, Mapping, Optional, Type, Union
+
+import pandas as pd
+
+from common.columnar import ColumnarBuilder
+
+# 버퍼를 파일에 기록하는 기준 (둘 중 먼저 도달하는 쪽)
+DEFAULT_FLUSH_ITEMS = 100
+DEFAULT_FLUSH_SECONDS = 1.0
+
+
+def _to_mapping(item: Any) -> Mapping[str, Any]:
+    """Record(slots 데이터클래스) 또는 dict → dict"""
+    if isinstance(item, Mapping):
+        return item
+    return dict(zip(item.columns(), item.to_row()))
+
+
+class JsonlSink:
+    """JSONL 파일 sink (여러 스레드에서 write 가능)"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_items: int = DEFAULT_FLUSH_ITEMS,
+        flush_seconds: float = DEFAULT_FLUSH_SECONDS,
+        append: bool = True,
+    ):
+        """
+        Args:
+            path: 출력 파일 경로
+            flush_items: 버퍼 항목 수가 이 값에 도달하면 기록
+            flush_seconds: 버퍼에 남은 항목을 기록하는 최대 간격 (write가 없어도 타이머 스레드가 기록, 0 이하면 타이머 없음)
+            append: 기존 파일 뒤에 이어서 기록 (False면 새로 씀)
+        """
+        self.path = Path(path)
+        self.flush_items = flush_items
+        self.flush_seconds = flush_seconds
+        self.items_written = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if append else "w", encoding="utf-8")
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        
+        # 시간 기준 기록: 다음 write를 기다리지 않고 flush_seconds마다 버퍼 확인
+        self._closing = threading.Event()
+        self._timer: Optional[threading.Thread] = None
+        if flush_seconds > 0:
+            self._timer = threading.Thread(target=self._flush_periodically, name="jsonl-sink-flush", daemon=True)
+            self._timer.start()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def write(self, item: Any) -> None:
+        """항목 하나를 버퍼에 추가 (기준에 도달하면 파일에 기록)"""
+        line = json.dumps(_to_mapping(item), ensure_ascii=False, default=str)
+        with self._lock:
+            self._buffer.append(line)
+            if (len(self._buffer) >= self.flush_items
+                    or time.monotonic() - self._last_flush >= self.flush_seconds):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """버퍼에 남은 항목을 파일에 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_periodically(self) -> None:
+        """타이머 스레드: 마지막 기록 후 flush_seconds가 지난 버퍼를 기록 (close까지 반복)"""
+        wait = self.flush_seconds
+        while not self._closing.wait(wait):
+            with self._lock:
+                if self._file.closed:
+                    return
+                elapsed = time.monotonic() - self._last_flush
+                if elapsed >= self.flush_seconds:
+                    self._flush_locked()
+                    elapsed = 0.0
+            wait = max(self.flush_seconds - elapsed, 0.01)
+
+    def _flush_locked(self) -> None:
+        if self._buffer:
+            # 완전한 줄 단위로만 기록 (읽는 쪽이 중간까지 쓴 줄을 보지 않도록 한 번에 write)
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._file.flush()
+            self.items_written += len(self._buffer)
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """남은 항목 기록 후 파일 닫기"""
+        self._closing.set()
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join()
+        with self._lock:
+            if self._file.closed:
+                return
+            self._flush_locked()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+
+def iter_jsonl(path: Union[str, Path]) -> Iterator[dict]:
+    """JSONL 파일의 항목을 한 줄씩 반환 (기록 중인 파일의 마지막 미완성 줄은 건너뜀)"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_jsonl_chunks(path: Union[str, Path], chunk_size: int = 50_000,
+                      record_class: Optional[Type] = None) -> Iterator[pd.DataFrame]:
+    """
+    JSONL 파일을 chunk_size 행씩 데이터프레임으로 반환 (Harmonizer.run_chunked 입력용)
+
+    Args:
+        path: JSONL 파일 경로
+        chunk_size: 청크 행 수
+        record_class: 컬럼/dtype 기준 Record 클래스 (None이면 첫 항목의 키)
+    """
+    builder: Optional[ColumnarBuilder] = None
+    for row in iter_jsonl(path):
+        if builder is None:
+            builder = ColumnarBuilder.for_record(record_class) if record_class else ColumnarBuilder(list(row))
+        builder.append_mapping(row)
+        if len(builder) >= chunk_size:
+            yield builder.to_dataframe()
+            builder = ColumnarBuilder(builder.columns, builder.dtypes)
+    if builder is not None and len(builder):
+        yield builder.to_dataframe()
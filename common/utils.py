@@ -20,6 +20,17 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# html_to_text_preserve_p_br 에서 항목마다 반복 사용하는 정규식 (모듈 로드 시 1회 컴파일)
+_P_OPEN_RE = re.compile(r'<p[^>]*>', re.IGNORECASE)
+_P_CLOSE_RE = re.compile(r'</p\s*>', re.IGNORECASE)
+_BR_RE = re.compile(r'<br[^>]*>', re.IGNORECASE)
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_CDATA_RE = re.compile(r'<!\[CDATA\[.*?\]\]>', re.DOTALL)
+_STYLE_SCRIPT_RE = re.compile(r'<(style|script)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'</?[^>]+>')
+_NBSP_RE = re.compile(r'&nbsp;?')
+_MULTI_NEWLINE_RE = re.compile(r'\n+')
+
 def html_to_text_preserve_p_br(html_snippet):
     """
     <p>와 <br>만 개행(\n)으로 치환하고,
@@ -33,31 +44,31 @@ def html_to_text_preserve_p_br(html_snippet):
         html_snippet = html_snippet.replace('\r', '').replace('\n', '')
 
         # 1) <p ...> → '\n'
-        text = re.sub(r'<p[^>]*>', '\n', html_snippet, flags=re.IGNORECASE)
+        text = _P_OPEN_RE.sub('\n', html_snippet)
         # 2) </p> → ''
-        text = re.sub(r'</p\s*>', '', text, flags=re.IGNORECASE)
+        text = _P_CLOSE_RE.sub('', text)
 
         # 3) <br ...> → '\n'
-        text = re.sub(r'<br[^>]*>', '\n', text, flags=re.IGNORECASE)
+        text = _BR_RE.sub('\n', text)
 
         # 4) 주석 및 CDATA 제거
-        text = re.sub(r'<!--.*?-->', '', text, flags=re.DOTALL)
-        text = re.sub(r'<!\[CDATA\[.*?\]\]>', '', text, flags=re.DOTALL)
+        text = _COMMENT_RE.sub('', text)
+        text = _CDATA_RE.sub('', text)
 
         # 5) <style>, <script> 블록 제거
-        text = re.sub(r'<(style|script)[^>]*>.*?</\1>', '', text, flags=re.DOTALL | re.IGNORECASE)
+        text = _STYLE_SCRIPT_RE.sub('', text)
 
         # 6) 나머지 모든 태그 제거
-        text = re.sub(r'</?[^>]+>', '', text)
+        text = _TAG_RE.sub('', text)
 
         # 7) HTML 엔티티 정리
-        text = re.sub(r'&nbsp;?', ' ', text)
+        text = _NBSP_RE.sub(' ', text)
 
         # 8) 중복 개행 줄이기 전, 개행 사이 공백 제거
         # text = re.sub(r'\n\s+\n', '\n', text)
         
         # 9) 연속 개행 \n\n\n... → \n
-        text = re.sub(r'\n+', '\n', text)
+        text = _MULTI_NEWLINE_RE.sub('\n', text)
 
         return text.strip()
     except Exception as e:
@@ -70,12 +81,16 @@ def html_to_text_preserve_p_br(html_snippet):
             # 완전히 실패한 경우
             return "[HTML 변환 오류]"
 
-def random_sleep(min_seconds=1, max_seconds=3):
+def random_sleep(min_seconds=1, max_seconds=3, cancel_token=None):
     """
     요청 간 랜덤 지연 시간을 추가하여 서버 부하 및 차단 방지
+    cancel_token이 주어지면 취소 시 대기를 즉시 중단
     """
     sleep_time = random.uniform(min_seconds, max_seconds)
-    time.sleep(sleep_time)
+    if cancel_token is not None:
+        cancel_token.wait(sleep_time)
+    else:
+        time.sleep(sleep_time)
     
 def get_td_html_after_th(soup, th_text):
     """
@@ -0,0 +1,364 @@
+"""
+상세 크롤링 작업 큐(work queue)
+
+DetailCrawler가 처리할 idx 작업을 큐에 넣고, worker가 작업을 가져가(lease)
+처리 후 완료(ack)하거나 실패(nack) 시 재시도하는 구조.
+
+- InProcessWorkQueue: 한 프로세스 안에서만 사용하는 메모리 큐.
+  DetailCrawler(work_queue=InProcessWorkQueue())로 지정하면 파일 없이 lease/재시도 흐름을 사용
+  (work_queue를 지정하지 않은 기본 경로는 큐 없이 ThreadPoolExecutor로 직접 처리)
+- SQLiteWorkQueue: SQLite 파일을 브로커로 사용하는 큐.
+  여러 worker 프로세스/노드가 같은 파일을 공유하여 작업을 나눠 처리하고,
+  worker가 중간에 죽으면 lease 만료 후 다른 worker가 작업을 다시 가져간다.
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from common.cancellation import CancellationToken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+@dataclass
+class Job:
+    """큐에서 가져온 작업"""
+    job_id: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class WorkQueue(ABC):
+    """작업 큐 인터페이스"""
+
+    @abstractmethod
+    def put(self, jobs: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        (job_id, payload) 작업 등록 (이미 있는 job_id는 무시)
+
+        Returns:
+            새로 등록된 작업 수
+        """
+
+    @abstractmethod
+    def get(self, worker_id: str) -> Optional[Job]:
+        """처리할 작업 하나를 lease (없으면 None)"""
+
+    @abstractmethod
+    def ack(self, job_id: str, result: Dict[str, Any]) -> None:
+        """작업 완료 및 결과 저장"""
+
+    @abstractmethod
+    def nack(self, job_id: str, error: str) -> None:
+        """작업 실패 (최대 시도 횟수 전이면 재시도 대기열로 되돌림)"""
+
+    @abstractmethod
+    def unfinished_count(self) -> int:
+        """대기 중이거나 처리 중인 작업 수"""
+
+    @abstractmethod
+    def results(self) -> List[Dict[str, Any]]:
+        """완료된 작업 결과 (등록 순서)"""
+
+    @abstractmethod
+    def failed(self) -> List[Tuple[Dict[str, Any], str]]:
+        """최종 실패한 작업의 (payload, 오류)"""
+
+    def close(self) -> None:
+        """리소스 정리"""
+
+
+class InProcessWorkQueue(WorkQueue):
+    """프로세스 내부 메모리 큐 (lease 만료 후 도착한 ack도 결과로 인정, 완료된 작업의 결과는 덮어쓰지 않음)"""
+
+    def __init__(self, lease_seconds: float = DEFAULT_LEASE_SECONDS, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._order: List[str] = []
+        self._payloads: Dict[str, Dict[str, Any]] = {}
+        self._attempts: Dict[str, int] = {}
+        self._queued: deque = deque()
+        self._leases: Dict[str, float] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._failed: Dict[str, str] = {}
+
+    def put(self, jobs: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        added = 0
+        with self._lock:
+            for job_id, payload in jobs:
+                if job_id in self._payloads:
+                    continue
+                self._order.append(job_id)
+                self._payloads[job_id] = payload
+                self._attempts[job_id] = 0
+                self._queued.append(job_id)
+                added += 1
+        return added
+
+    def _reclaim_expired(self, now: float) -> None:
+        for job_id, expires in list(self._leases.items()):
+            if expires < now:
+                del self._leases[job_id]
+                self._requeue_or_fail(job_id, "lease 만료")
+
+    def _requeue_or_fail(self, job_id: str, error: str) -> None:
+        if self._attempts[job_id] >= self.max_attempts:
+            self._failed[job_id] = error
+        else:
+            self._queued.append(job_id)
+
+    def get(self, worker_id: str) -> Optional[Job]:
+        now = time.time()
+        with self._lock:
+            self._reclaim_expired(now)
+            if not self._queued:
+                return None
+            job_id = self._queued.popleft()
+            self._attempts[job_id] += 1
+            self._leases[job_id] = now + self.lease_seconds
+            return Job(job_id, self._payloads[job_id], self._attempts[job_id])
+
+    def ack(self, job_id: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            if job_id in self._results:
+                return
+            self._leases.pop(job_id, None)
+            self._results[job_id] = result
+            # lease 만료로 다시 대기열에 들어갔거나 실패 처리된 작업이면 정리 (다시 실행되지 않도록)
+            self._failed.pop(job_id, None)
+            try:
+                self._queued.remove(job_id)
+            except ValueError:
+                pass
+
+    def nack(self, job_id: str, error: str) -> None:
+        with self._lock:
+            if self._leases.pop(job_id, None) is None:
+                return
+            self._requeue_or_fail(job_id, error)
+
+    def unfinished_count(self) -> int:
+        with self._lock:
+            return len(self._queued) + len(self._leases)
+
+    def results(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self._results[job_id] for job_id in self._order if job_id in self._results]
+
+    def failed(self) -> List[Tuple[Dict[str, Any], str]]:
+        with self._lock:
+            return [(self._payloads[job_id], self._failed[job_id]) for job_id in self._order if job_id in self._failed]
+
+
+class SQLiteWorkQueue(WorkQueue):
+    """SQLite 파일 기반 작업 큐 (여러 프로세스/노드 공유)"""
+
+    def __init__(self, path: str, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+            lease_seconds: 작업 lease 유효 시간 (초), 만료되면 다른 worker가 다시 가져감
+            max_attempts: 작업당 최대 시도 횟수
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker_id TEXT,
+                lease_expires REAL,
+                result TEXT,
+                error TEXT
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, seq)")
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # 연결은 만든 스레드에서만 사용, close()에서 한꺼번에 닫을 수 있도록 스레드 검사는 끔
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def put(self, jobs: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        conn = self._conn()
+        rows = [(job_id, json.dumps(payload, ensure_ascii=False)) for job_id, payload in jobs]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO jobs (job_id, payload) VALUES (?, ?)", rows)
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def get(self, worker_id: str) -> Optional[Job]:
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # lease가 만료된 작업 중 시도 횟수를 다 쓴 작업은 실패 처리
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'lease 만료' "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, self.max_attempts),
+            )
+            row = conn.execute(
+                "SELECT job_id, payload, attempts FROM jobs "
+                "WHERE status = 'queued' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY seq LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            job_id, payload, attempts = row
+            conn.execute(
+                "UPDATE jobs SET status = 'leased', worker_id = ?, lease_expires = ?, attempts = attempts + 1 "
+                "WHERE job_id = ?",
+                (worker_id, now + self.lease_seconds, job_id),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return Job(job_id, json.loads(payload), attempts + 1)
+
+    def ack(self, job_id: str, result: Dict[str, Any]) -> None:
+        # lease 만료 후 늦게 도착한 ack도 결과로 인정하되, 이미 완료된 결과는 덮어쓰지 않음
+        self._conn().execute(
+            "UPDATE jobs SET status = 'done', result = ?, lease_expires = NULL WHERE job_id = ? AND status != 'done'",
+            (json.dumps(result, ensure_ascii=False), job_id),
+        )
+
+    def nack(self, job_id: str, error: str) -> None:
+        self._conn().execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'queued' END, "
+            "error = ?, lease_expires = NULL WHERE job_id = ? AND status = 'leased'",
+            (self.max_attempts, error, job_id),
+        )
+
+    def unfinished_count(self) -> int:
+        row = self._conn().execute(
+            "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'leased')"
+        ).fetchone()
+        return row[0]
+
+    def status_counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
+
+    def results(self) -> List[Dict[str, Any]]:
+        rows = self._conn().execute("SELECT result FROM jobs WHERE status = 'done' ORDER BY seq").fetchall()
+        return [json.loads(result) for (result,) in rows]
+
+    def failed(self) -> List[Tuple[Dict[str, Any], str]]:
+        rows = self._conn().execute(
+            "SELECT payload, error FROM jobs WHERE status = 'failed' ORDER BY seq"
+        ).fetchall()
+        return [(json.loads(payload), error or "") for payload, error in rows]
+
+    def close(self) -> None:
+        """모든 스레드에서 만든 연결 닫기 (이후 호출 시 새 연결 생성)"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+
+def default_worker_id() -> str:
+    """호스트명:PID 형식 worker 식별자"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_workers(
+    work_queue: WorkQueue,
+    handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+    worker_count: int,
+    cancel_token: Optional[CancellationToken] = None,
+    poll_interval: float = 1.0,
+    worker_id: Optional[str] = None,
+) -> int:
+    """
+    worker_count개의 스레드로 큐가 빌 때까지 작업 처리
+
+    다른 worker가 lease 중인 작업이 남아 있으면, lease가 끝나거나 만료될 때까지
+    poll_interval 간격으로 기다린다 (죽은 worker의 작업을 이어받기 위함).
+
+    Args:
+        handler: payload를 받아 결과 dict를 반환 (예외 발생 시 nack)
+
+    Returns:
+        이 호출에서 완료(ack)한 작업 수
+    """
+    cancel_token = cancel_token or CancellationToken()
+    base_id = worker_id or default_worker_id()
+    completed = [0]
+    completed_lock = threading.Lock()
+
+    def worker_loop(thread_no: int) -> None:
+        thread_worker_id = f"{base_id}:{thread_no}"
+        while not cancel_token.cancelled:
+            job = work_queue.get(thread_worker_id)
+            if job is None:
+                if work_queue.unfinished_count() == 0:
+                    return
+                cancel_token.wait(poll_interval)
+                continue
+            try:
+                result = handler(job.payload)
+            except Exception as e:
+                work_queue.nack(job.job_id, str(e))
+                continue
+            work_queue.ack(job.job_id, result)
+            with completed_lock:
+                completed[0] += 1
+
+    threads = [
+        threading.Thread(target=worker_loop, args=(i,), daemon=True)
+        for i in range(max(1, worker_count))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        # 취소되면 처리 중인 작업을 기다리지 않음 (lease 만료 후 다른 worker가 재처리)
+        while thread.is_alive() and not cancel_token.cancelled:
+            thread.join(poll_interval)
+    return completed[0]
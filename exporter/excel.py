@@ -0,0 +1,131 @@
+"""
+Excel 스트리밍 내보내기
+------------------------
+openpyxl write-only 워크북으로 행을 만들어지는 대로 기록하는 writer (메모리 사용량이 행 수에 거의 비례하지 않음)
+
+- 셀 글자 수가 Excel 한도(32,767자)를 넘으면 앞부분만 남기고 표시 문구를 붙여 자름 (항상 같은 결과)
+- Excel 셀에 넣을 수 없는 제어 문자는 제거
+
+사용 예:
+    with ExcelStreamWriter("data/db_i.xlsx") as writer:
+        for chunk in harmonizer.run_chunked(...):
+            writer.write_frame(chunk)
+"""
+
+import logging
+import math
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Excel 셀 최대 글자 수
+EXCEL_MAX_CELL_CHARS = 32_767
+
+# 잘린 셀 끝에 붙이는 표시 (잘린 결과도 한도 이내)
+TRUNCATION_MARKER = "…(이하 생략)"
+
+DEFAULT_SHEET_NAME = "Sheet1"
+
+
+def _require_openpyxl():
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    except ImportError as e:
+        raise ImportError("Excel 내보내기에는 openpyxl이 필요합니다: pip install openpyxl") from e
+    return Workbook, ILLEGAL_CHARACTERS_RE
+
+
+def truncate_cell_text(text: str, limit: int = EXCEL_MAX_CELL_CHARS, marker: str = TRUNCATION_MARKER) -> str:
+    """limit자를 넘는 문자열을 앞부분 + marker로 자름 (limit자 이하면 그대로)"""
+    if len(text) <= limit:
+        return text
+    return text[:limit - len(marker)] + marker
+
+
+class ExcelStreamWriter:
+    """write-only 워크북에 행을 이어 쓰는 Excel writer (헤더는 첫 데이터 기준)"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        columns: Optional[Sequence[str]] = None,
+        sheet_name: str = DEFAULT_SHEET_NAME,
+        max_cell_chars: int = EXCEL_MAX_CELL_CHARS,
+    ):
+        """
+        Args:
+            path: 출력 파일 경로
+            columns: 헤더 컬럼 (None이면 첫 write_frame의 컬럼)
+            sheet_name: 시트 이름
+            max_cell_chars: 셀 최대 글자 수 (넘으면 잘라서 기록)
+        """
+        Workbook, self._illegal_characters = _require_openpyxl()
+        self.path = Path(path)
+        self.max_cell_chars = max_cell_chars
+        self.columns: Optional[List[str]] = list(columns) if columns is not None else None
+        self.rows_written = 0
+        self.truncated_cells = 0
+
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet(title=sheet_name)
+        if self.columns is not None:
+            self._sheet.append(self.columns)
+
+    def __enter__(self) -> "ExcelStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _cell_value(self, value: Any) -> Any:
+        """pandas/numpy 값 → openpyxl 셀 값 (결측은 빈 셀)"""
+        if value is None or value is pd.NA or value is pd.NaT:
+            return None
+        if isinstance(value, str):
+            if self._illegal_characters.search(value):
+                value = self._illegal_characters.sub("", value)
+            if len(value) > self.max_cell_chars:
+                self.truncated_cells += 1
+                value = truncate_cell_text(value, self.max_cell_chars)
+            return value
+        if isinstance(value, float):
+            return None if math.isnan(value) else value
+        if isinstance(value, pd.Timestamp):
+            return value.to_pydatetime()
+        if isinstance(value, (datetime, date, int, bool)):
+            return value
+        if isinstance(value, np.generic):
+            return self._cell_value(value.item())
+        return self._cell_value(str(value))
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """columns 순서의 값 시퀀스 기록"""
+        cell_value = self._cell_value
+        append = self._sheet.append
+        for row in rows:
+            append([cell_value(value) for value in row])
+            self.rows_written += 1
+
+    def write_frame(self, df: pd.DataFrame) -> None:
+        """데이터프레임 청크 기록 (인덱스 제외)"""
+        if self.columns is None:
+            self.columns = [str(column) for column in df.columns]
+            self._sheet.append(self.columns)
+        self.write_rows(df.itertuples(index=False, name=None))
+
+    def close(self) -> None:
+        """파일 저장 (write-only 워크북은 한 번만 저장 가능)"""
+        if self._workbook is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook.save(str(self.path))
+        self._workbook = None
+        if self.truncated_cells:
+            logger.warning(f"Excel 셀 글자 수 한도({self.max_cell_chars}자) 초과로 {self.truncated_cells}개 셀을 잘랐습니다.")
+        logger.info(f"✓ Excel 파일 생성 완료: {self.path} ({self.rows_written}행)")
@@ -1,7 +1,7 @@
 """
 Exporter
 ------------------------
-DataFrame을 Pickle 또는 Excel 파일로 내보내는 클래스
+DataFrame을 Pickle, Excel, Parquet, JSONL, SQLite(전문 검색) 파일로 내보내는 클래스 (여러 형식 동시 저장 가능)
 
 작성자: kinphw
 작성일: 2025-03-31
@@ -10,12 +10,68 @@ DataFrame을 Pickle 또는 Excel 파일로 내보내는 클래스
 
 import pandas as pd
 import os
+import json
+import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from exporter.manifest import (build_manifest, content_hashes, file_entry, file_matches,
+                               manifest_path, read_manifest)
 
 logger = logging.getLogger(__name__)
 
+# 지원 형식 → 파일 확장자
+EXPORT_FORMATS: Dict[str, str] = {
+    "pickle": ".pkl",
+    "excel": ".xlsx",
+    "parquet": ".parquet",
+    "jsonl": ".jsonl",
+    "sqlite": ".db",
+}
+
+# export(format_choice) 번호 → 형식 (3=js는 JSONL로 저장)
+FORMAT_CHOICES: Dict[int, Tuple[str, ...]] = {
+    1: ("pickle",),
+    2: ("excel",),
+    3: ("jsonl",),
+    4: tuple(EXPORT_FORMATS),
+}
+
+# export_format 문자열 별칭
+FORMAT_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "all": tuple(EXPORT_FORMATS),
+    "js": ("jsonl",),
+    "json": ("jsonl",),
+    "db": ("sqlite",),
+}
+
+
+def resolve_formats(export_format: Union[str, Sequence[str]]) -> Tuple[str, ...]:
+    """
+    형식 지정값 → 형식 목록 ('pickle', 'all', 'pickle,excel', ['pickle', 'parquet'] 등)
+    
+    Raises:
+        ValueError: 지원하지 않는 형식
+    """
+    names = export_format.split(",") if isinstance(export_format, str) else list(export_format)
+    formats: List[str] = []
+    for name in names:
+        name = name.strip().lower()
+        if not name:
+            continue
+        for fmt in FORMAT_ALIASES.get(name, (name,)):
+            if fmt not in EXPORT_FORMATS:
+                raise ValueError(f"지원하지 않는 내보내기 형식입니다: {name} (선택: {', '.join(EXPORT_FORMATS)}, all)")
+            if fmt not in formats:
+                formats.append(fmt)
+    if not formats:
+        raise ValueError("내보내기 형식이 지정되지 않았습니다.")
+    return tuple(formats)
+
+
 class Exporter:
     """데이터 내보내기 클래스"""
     
@@ -23,74 +79,229 @@ class Exporter:
         self,
         df: pd.DataFrame,
         output_dir: str = "data",
-        export_format: str = "pickle",
+        export_format: Union[str, Sequence[str]] = "pickle",
         output_name: str = "db_i",
+        partition_by: Optional[Sequence[str]] = None,
+        excel_streaming: bool = True,
+        crawl_params: Optional[Mapping[str, Any]] = None,
+        manifest: bool = True,
+        skip_unchanged: bool = True,
     ):
         """
         Args:
             df: 변환할 DataFrame
             output_dir: 출력 파일을 저장할 디렉토리
-            export_format: 내보내기 형식 ('pickle' 또는 'excel')
+            export_format: 내보내기 형식 ('pickle', 'excel', 'parquet', 'jsonl', 'sqlite', 'all',
+                쉼표로 구분한 여러 형식 또는 형식 목록 ['pickle', 'parquet'])
             output_name: 출력 파일명(확장자 제외)
+            partition_by: Parquet 파티션 컬럼 (예: ('source', 'year'), 지정 시 {output_name}_parquet 디렉토리에 저장)
+            excel_streaming: Excel을 write-only 워크북으로 행 단위 기록 (False면 df.to_excel)
+            crawl_params: manifest에 기록할 크롤링 파라미터 (조회 기간, worker 수 등)
+            manifest: {output_name}.manifest.json 기록 여부
+            skip_unchanged: manifest의 내용 해시가 같고 파일이 그대로 있으면 해당 형식을 다시 쓰지 않음
         """
         self.df = df
         self.output_dir = Path(output_dir)
-        self.export_format = export_format.lower()
+        # 문자열은 소문자로, 형식 목록은 항목별 소문자 튜플로 (검증은 export 시 resolve_formats)
+        if isinstance(export_format, str):
+            self.export_format: Union[str, Tuple[str, ...]] = export_format.lower()
+        else:
+            self.export_format = tuple(str(name).lower() for name in export_format)
         self.output_name = output_name
+        self.partition_by = tuple(partition_by) if partition_by else None
+        if self.partition_by:
+            # 다른 형식을 쓰기 전에 확인 (source 파티션은 keep_source=True 결과 필요)
+            from exporter.parquet import missing_partition_columns
+            
+            missing = missing_partition_columns(df, self.partition_by)
+            if missing:
+                raise ValueError(f"파티션 컬럼이 없습니다: {', '.join(missing)} "
+                                 f"(source는 Harmonizer(keep_source=True) 결과에 있음)")
+        self.excel_streaming = excel_streaming
+        self.crawl_params = dict(crawl_params or {})
+        self.manifest = manifest
+        self.skip_unchanged = skip_unchanged
         
         self.pickle_file = self.output_dir / f"{self.output_name}.pkl"
         self.excel_file = self.output_dir / f"{self.output_name}.xlsx"
+        self.parquet_file = self.output_dir / f"{self.output_name}.parquet"
+        self.parquet_dir = self.output_dir / f"{self.output_name}_parquet"
+        self.jsonl_file = self.output_dir / f"{self.output_name}.jsonl"
+        self.sqlite_file = self.output_dir / f"{self.output_name}.db"
+        self.manifest_file = manifest_path(self.output_dir, self.output_name)
         
         # 출력 디렉토리 생성
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-    def export(self, format_choice: int = 4) -> None:
+    def export(self, format_choice: Optional[int] = None) -> List[Path]:
         """전체 내보내기 프로세스 실행
         
+        형식이 여러 개면 같은 DataFrame(복사 없이 공유)을 형식별 스레드에서 동시에 기록한다.
+        각 파일은 임시 파일에 쓴 뒤 이름을 바꿔(os.replace) 교체하므로
+        실패하거나 중간에 멈춰도 기존 파일이 깨지지 않고, 다른 형식의 파일은 건드리지 않는다.
+        manifest의 내용 해시가 같고 파일이 그대로 있는 형식은 다시 쓰지 않는다.
+        
         Args:
-            format_choice: 1=pickle, 2=excel, 3=js, 4=all
+            format_choice: 1=pickle, 2=excel, 3=js(JSONL), 4=all (None이면 export_format 사용)
+            
+        Returns:
+            List[Path]: 저장된(또는 변경 없어 유지된) 파일(또는 파티션 디렉토리) 경로
         """
         try:
-            if self.export_format == "excel":
-                self._to_excel()
+            if format_choice is None:
+                formats = resolve_formats(self.export_format)
+            elif format_choice in FORMAT_CHOICES:
+                formats = FORMAT_CHOICES[format_choice]
             else:
-                self._to_pickle()
+                raise ValueError(f"지원하지 않는 format_choice입니다: {format_choice} (1=pickle, 2=excel, 3=js, 4=all)")
+            
+            writers: Dict[str, Callable[[], Path]] = {
+                "pickle": self._to_pickle,
+                "excel": self._to_excel,
+                "parquet": self._to_parquet,
+                "jsonl": self._to_jsonl,
+                "sqlite": self._to_sqlite,
+            }
+            
+            hashes = content_hashes(self.df) if self.manifest else None
+            previous = read_manifest(self.output_dir, self.output_name) if self.manifest else None
+            # 이전 manifest와 내용이 같을 때만 기존 파일 정보를 이어서 사용
+            previous_files: Dict[str, Dict[str, Any]] = {}
+            if previous is not None and previous.get("content_hash") == hashes["content_hash"]:
+                previous_files = previous.get("files", {})
+            
+            pending = [fmt for fmt in formats if not self._is_unchanged(fmt, previous_files)]
+            skipped = [fmt for fmt in formats if fmt not in pending]
+            if skipped:
+                logger.info(f"변경 없음, 다시 쓰지 않음: {', '.join(skipped)}")
+            
+            if len(pending) == 1:
+                writers[pending[0]]()
+            elif pending:
+                with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="export") as executor:
+                    futures = [executor.submit(writers[fmt]) for fmt in pending]
+                # 모든 형식이 끝난 뒤 첫 오류를 다시 발생
+                for future in futures:
+                    future.result()
+            saved_paths = [self._target_path(fmt) for fmt in formats]
+            
+            if self.manifest:
+                self._write_manifest(hashes, previous, previous_files, formats, pending)
                 
-            logger.info(f"✅ 내보내기 완료: {self.export_format}")
+            logger.info(f"✅ 내보내기 완료: {', '.join(formats)}")
+            return saved_paths
         except Exception as e:
             logger.error(f"내보내기 중 오류 발생: {str(e)}")
             raise
 
-    def _to_pickle(self) -> None:
+    def _target_path(self, fmt: str) -> Path:
+        """형식별 출력 경로"""
+        if fmt == "parquet" and self.partition_by:
+            return self.parquet_dir
+        return {
+            "pickle": self.pickle_file,
+            "excel": self.excel_file,
+            "parquet": self.parquet_file,
+            "jsonl": self.jsonl_file,
+            "sqlite": self.sqlite_file,
+        }[fmt]
+
+    def _is_unchanged(self, fmt: str, previous_files: Mapping[str, Mapping[str, Any]]) -> bool:
+        """같은 내용으로 저장된 파일이 그대로 있는지 (skip_unchanged=False면 항상 False)"""
+        entry = previous_files.get(fmt)
+        return (self.skip_unchanged and entry is not None
+                and entry.get("path") == self._target_path(fmt).name
+                and file_matches(self.output_dir, entry))
+
+    def _write_manifest(self, hashes: Mapping[str, Any], previous: Optional[Mapping[str, Any]],
+                        previous_files: Mapping[str, Mapping[str, Any]],
+                        formats: Sequence[str], written: Sequence[str]) -> None:
+        """manifest 갱신 (내용/파일/크롤링 파라미터가 모두 같으면 그대로 둠)"""
+        # 다시 쓰지 않은 형식은 이전 항목 유지 (크기/수정 시각이 같으면 sha256을 다시 계산하지 않음)
+        files = {fmt: entry for fmt, entry in previous_files.items()
+                 if fmt not in written and file_matches(self.output_dir, entry)}
+        for fmt in formats:
+            if fmt in written or fmt not in files:
+                files[fmt] = file_entry(self._target_path(fmt))
+        if (not written and previous is not None and previous.get("files") == files
+                and previous.get("crawl_params") == self.crawl_params):
+            return
+        
+        manifest = build_manifest(self.df, self.output_name, hashes, files, self.crawl_params)
+        
+        def write(path: Path) -> None:
+            path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        
+        self._write_atomic(self.manifest_file, write)
+        logger.info(f"✓ manifest 기록: {self.manifest_file}")
+
+    def _temp_path(self, target: Path) -> Path:
+        """target과 같은 디렉토리의 임시 경로 (확장자 유지: 확장자로 형식을 판단하는 writer 대비)"""
+        return target.with_name(f".{target.stem}.{os.getpid()}.tmp{target.suffix}")
+
+    def _write_atomic(self, target: Path, write: Callable[[Path], None]) -> Path:
+        """임시 파일에 기록한 뒤 target으로 교체"""
+        temp_path = self._temp_path(target)
+        try:
+            write(temp_path)
+            os.replace(temp_path, target)
+        except BaseException:
+            if temp_path.is_dir():
+                shutil.rmtree(temp_path, ignore_errors=True)
+            elif temp_path.exists():
+                temp_path.unlink()
+            raise
+        return target
+
+    def _write_atomic_dir(self, target: Path, write: Callable[[Path], None]) -> Path:
+        """임시 디렉토리에 기록한 뒤 target 디렉토리와 교체 (기존 디렉토리는 교체 후 삭제)"""
+        temp_dir = self._temp_path(target)
+        backup_dir = target.with_name(f".{target.name}.{os.getpid()}.old")
+        try:
+            write(temp_dir)
+            if target.exists():
+                os.replace(target, backup_dir)
+            os.replace(temp_dir, target)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            if backup_dir.exists() and not target.exists():
+                os.replace(backup_dir, target)
+            raise
+        shutil.rmtree(backup_dir, ignore_errors=True)
+        return target
+
+    def _to_pickle(self) -> Path:
         """DataFrame을 pickle 파일로 저장"""
         logger.info(f"Pickle 파일 생성 중: {self.pickle_file}")
         
         try:
-            self.df.to_pickle(self.pickle_file)
+            self._write_atomic(self.pickle_file, self.df.to_pickle)
             logger.info(f"✓ Pickle 파일 생성 완료: {self.pickle_file}")
-            
-            # Excel 파일이 존재하면 삭제 (cleanup)
-            if self.excel_file.exists():
-                self.excel_file.unlink()
-                logger.info(f"이전 Excel 파일 삭제됨: {self.excel_file}")
+            return self.pickle_file
                 
         except Exception as e:
             logger.error(f"Pickle 파일 생성 실패: {str(e)}")
             raise
 
-    def _to_excel(self) -> None:
+    def _to_excel(self) -> Path:
         """DataFrame을 Excel 파일로 저장"""
         logger.info(f"Excel 파일 생성 중: {self.excel_file}")
         
+        def write(path: Path) -> None:
+            if self.excel_streaming:
+                # write-only 워크북에 행 단위 기록 (행 수와 거의 무관한 메모리, 한도 초과 셀은 잘라서 기록)
+                from exporter.excel import ExcelStreamWriter
+                
+                with ExcelStreamWriter(path) as writer:
+                    writer.write_frame(self.df)
+            else:
+                # Excel 파일 저장 (index=False로 인덱스 제외)
+                self.df.to_excel(path, index=False)
+        
         try:
-            # Excel 파일 저장 (index=False로 인덱스 제외)
-            self.df.to_excel(self.excel_file, index=False)
+            self._write_atomic(self.excel_file, write)
             logger.info(f"✓ Excel 파일 생성 완료: {self.excel_file}")
-            
-            # Pickle 파일이 존재하면 삭제 (cleanup)
-            if self.pickle_file.exists():
-                self.pickle_file.unlink()
-                logger.info(f"이전 Pickle 파일 삭제됨: {self.pickle_file}")
+            return self.excel_file
 
         except Exception as e:
             logger.error(f"Excel 파일 생성 실패: {str(e)}")
@@ -99,24 +310,86 @@ class Exporter:
                  logger.error("openpyxl 모듈이 필요합니다. 'pip install openpyxl'을 실행하세요.")
             raise
 
+    def _to_parquet(self) -> Path:
+        """DataFrame을 zstd 압축 Parquet 파일(또는 파티션 데이터셋)로 저장"""
+        from exporter.parquet import ParquetStreamWriter, write_partitioned
+        
+        def write(path: Path) -> None:
+            with ParquetStreamWriter(path) as writer:
+                writer.write_frame(self.df)
+        
+        try:
+            if self.partition_by:
+                logger.info(f"Parquet 파티션 데이터셋 생성 중: {self.parquet_dir}")
+                return self._write_atomic_dir(
+                    self.parquet_dir, lambda path: write_partitioned(self.df, path, partition_by=self.partition_by)
+                )
+            
+            logger.info(f"Parquet 파일 생성 중: {self.parquet_file}")
+            return self._write_atomic(self.parquet_file, write)
+                
+        except Exception as e:
+            logger.error(f"Parquet 파일 생성 실패: {str(e)}")
+            raise
+
+    def _to_jsonl(self) -> Path:
+        """DataFrame을 JSONL(한 줄에 문서 하나) 파일로 저장"""
+        logger.info(f"JSONL 파일 생성 중: {self.jsonl_file}")
+        
+        def write(path: Path) -> None:
+            self.df.to_json(path, orient="records", lines=True, force_ascii=False, date_format="iso")
+        
+        try:
+            self._write_atomic(self.jsonl_file, write)
+            logger.info(f"✓ JSONL 파일 생성 완료: {self.jsonl_file}")
+            return self.jsonl_file
+        
+        except Exception as e:
+            logger.error(f"JSONL 파일 생성 실패: {str(e)}")
+            raise
+
+    def _to_sqlite(self) -> Path:
+        """DataFrame을 SQLite 파일로 저장 (제목/질의요지/회답/이유 FTS5 trigram 색인 포함)"""
+        from exporter.sqlite_fts import write_sqlite
+        
+        logger.info(f"SQLite 파일 생성 중: {self.sqlite_file}")
+        
+        try:
+            self._write_atomic(self.sqlite_file, lambda path: write_sqlite(self.df, path))
+            logger.info(f"✓ SQLite 파일 생성 완료: {self.sqlite_file}")
+            return self.sqlite_file
+        
+        except Exception as e:
+            logger.error(f"SQLite 파일 생성 실패: {str(e)}")
+            raise
+
 def export_dataframe(
     df: pd.DataFrame,
     output_dir: str = "data",
-    export_format: str = "pickle",
+    export_format: Union[str, Sequence[str]] = "pickle",
     output_name: str = "db_i",
-) -> None:
+    partition_by: Optional[Sequence[str]] = None,
+    crawl_params: Optional[Mapping[str, Any]] = None,
+) -> List[Path]:
     """
     DataFrame을 지정된 형식으로 내보내는 편의 함수
     
     Args:
         df: 변환할 DataFrame
         output_dir: 출력 파일을 저장할 디렉토리
-        export_format: 내보내기 형식 ('pickle' 또는 'excel')
+        export_format: 내보내기 형식 ('pickle', 'excel', 'parquet', 'jsonl', 'sqlite', 'all',
+            쉼표로 구분한 여러 형식 또는 형식 목록)
         output_name: 출력 파일명(확장자 제외)
+        partition_by: Parquet 파티션 컬럼 (예: ('source', 'year'))
+        crawl_params: manifest에 기록할 크롤링 파라미터
+        
+    Returns:
+        List[Path]: 저장된 파일 경로
     """
-    exporter = Exporter(df, output_dir, export_format, output_name)
-    exporter.export()
-    print(f"{export_format} 형식으로 저장이 완료되었습니다.")
+    exporter = Exporter(df, output_dir, export_format, output_name, partition_by, crawl_params=crawl_params)
+    saved_paths = exporter.export()
+    print(f"{', '.join(resolve_formats(exporter.export_format))} 형식으로 저장이 완료되었습니다.")
+    return saved_paths
 
 
 if __name__ == "__main__":
@@ -137,3 +410,9 @@ if __name__ == "__main__":
         export_dataframe(test_df, export_format="excel")
     except Exception as e:
         print(f"Excel 오류: {e}")
+
+    print("\n--- 전체 형식 내보내기 테스트 ---")
+    try:
+        export_dataframe(test_df, export_format="all")
+    except Exception as e:
+        print(f"전체 형식 오류: {e}")
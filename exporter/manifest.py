@@ -0,0 +1,154 @@
+"""
+내보내기 manifest
+------------------------
+내보낸 파일 옆에 `{output_name}.manifest.json` 으로 행 수, 스키마, 내용 해시(전체/소스별),
+크롤링 파라미터, 저장된 파일 목록을 기록한다.
+
+- Exporter는 내용 해시가 같고 파일이 그대로 있으면 해당 형식을 다시 쓰지 않음
+  (파일 크기 + 수정 시각, 수정 시각만 바뀐 파일은 sha256으로 확인)
+- 데이터 파일을 읽는 쪽은 파일 전체를 해시하지 않고 manifest의 content_hash만 비교하면 됨
+
+사용 예:
+    manifest = read_manifest("data", "db_i")
+    if manifest is None or manifest["content_hash"] != last_loaded_hash:
+        df = pd.read_pickle("data/db_i.pkl")
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+MANIFEST_VERSION = 2
+MANIFEST_SUFFIX = ".manifest.json"
+
+# 소스별 해시 기준 컬럼 (Harmonizer keep_source=True 결과, GUI 결과 포함), 없으면 전체를 하나로 계산
+SOURCE_COLUMN = "source"
+ALL_SOURCES = "all"
+
+# 파일 sha256 계산 시 읽는 블록 크기
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def manifest_path(output_dir: Union[str, Path], output_name: str) -> Path:
+    """manifest 파일 경로"""
+    return Path(output_dir) / f"{output_name}{MANIFEST_SUFFIX}"
+
+
+def _schema(df: pd.DataFrame) -> List[Dict[str, str]]:
+    return [{"name": str(column), "dtype": str(dtype)} for column, dtype in df.dtypes.items()]
+
+
+def _row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """행별 64비트 해시 (인덱스 제외, 값 기준)"""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _digest(schema: List[Dict[str, str]], row_hashes: np.ndarray) -> str:
+    """스키마 + 행 해시 배열 → sha256 (행 순서 포함)"""
+    hasher = hashlib.sha256(json.dumps(schema, ensure_ascii=False).encode("utf-8"))
+    hasher.update(np.ascontiguousarray(row_hashes).tobytes())
+    return "sha256:" + hasher.hexdigest()
+
+
+def content_hashes(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    데이터프레임 내용 해시
+
+    Returns:
+        {"content_hash": 전체 해시, "sources": {소스: {"rows": 행 수, "hash": 해시}}}
+    """
+    schema = _schema(df)
+    row_hashes = _row_hashes(df)
+    sources: Dict[str, Dict[str, Any]] = {}
+    if SOURCE_COLUMN in df.columns:
+        labels = df[SOURCE_COLUMN].astype(object).fillna("").to_numpy()
+        for source in sorted(set(labels)):
+            mask = labels == source
+            sources[str(source)] = {"rows": int(mask.sum()), "hash": _digest(schema, row_hashes[mask])}
+    else:
+        sources[ALL_SOURCES] = {"rows": len(df), "hash": _digest(schema, row_hashes)}
+    return {"content_hash": _digest(schema, row_hashes), "sources": sources}
+
+
+def build_manifest(
+    df: pd.DataFrame,
+    output_name: str,
+    hashes: Mapping[str, Any],
+    files: Mapping[str, Mapping[str, Any]],
+    crawl_params: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """manifest 내용 생성 (hashes는 content_hashes 결과)"""
+    return {
+        "manifest_version": MANIFEST_VERSION,
+        "output_name": output_name,
+        "exported_at": datetime.now().isoformat(timespec="seconds"),
+        "row_count": len(df),
+        "schema": _schema(df),
+        "content_hash": hashes["content_hash"],
+        "sources": hashes["sources"],
+        "crawl_params": dict(crawl_params or {}),
+        "files": {fmt: dict(entry) for fmt, entry in files.items()},
+    }
+
+
+def _file_sha256(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            hasher.update(block)
+    return "sha256:" + hasher.hexdigest()
+
+
+def _directory_stat(path: Path) -> Dict[str, int]:
+    """파티션 디렉토리 요약 (파일 수, 전체 크기, 가장 최근 수정 시각)"""
+    stats = [item.stat() for item in path.rglob("*") if item.is_file()]
+    return {
+        "files": len(stats),
+        "bytes": sum(stat.st_size for stat in stats),
+        "mtime_ns": max((stat.st_mtime_ns for stat in stats), default=0),
+    }
+
+
+def file_entry(path: Path) -> Dict[str, Any]:
+    """manifest files 항목 (파일: 크기/수정 시각/sha256, 파티션 디렉토리: 파일 수/전체 크기/최근 수정 시각)"""
+    if path.is_dir():
+        return {"path": path.name, **_directory_stat(path)}
+    stat = path.stat()
+    return {"path": path.name, "bytes": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": _file_sha256(path)}
+
+
+def file_matches(output_dir: Union[str, Path], entry: Mapping[str, Any]) -> bool:
+    """
+    manifest에 기록된 파일이 그대로 있는지
+
+    크기가 다르면 변경, 크기와 수정 시각이 같으면 그대로, 수정 시각만 다르면 sha256으로 판단한다.
+    파티션 디렉토리는 파일 수/전체 크기/최근 수정 시각을 비교한다.
+    """
+    path = Path(output_dir) / entry["path"]
+    if path.is_dir():
+        return all(entry.get(key) == value for key, value in _directory_stat(path).items())
+    if not path.is_file():
+        return False
+    stat = path.stat()
+    if stat.st_size != entry.get("bytes"):
+        return False
+    if stat.st_mtime_ns == entry.get("mtime_ns"):
+        return True
+    return entry.get("sha256") is not None and _file_sha256(path) == entry["sha256"]
+
+
+def read_manifest(output_dir: Union[str, Path], output_name: str) -> Optional[Dict[str, Any]]:
+    """manifest 읽기 (없거나 읽을 수 없으면 None)"""
+    path = manifest_path(output_dir, output_name)
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("manifest_version") != MANIFEST_VERSION:
+        return None
+    return manifest
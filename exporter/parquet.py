@@ -0,0 +1,207 @@
+"""
+Parquet 내보내기
+------------------------
+zstd 압축 Parquet 파일을 row group 단위로 이어 쓰는 writer와
+source/연도 파티션(hive 형식 디렉터리) 저장 함수 (pyarrow 필요)
+
+사용 예:
+    with ParquetStreamWriter("data/db_i.parquet") as writer:
+        for chunk in harmonizer.run_chunked(...):
+            writer.write_frame(chunk)
+
+    write_partitioned(df, "data/db_i_parquet", partition_by=("source", "year"))
+"""
+
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Type, Union
+
+import pandas as pd
+
+from common.columnar import ColumnarBuilder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSION = "zstd"
+DEFAULT_ROW_GROUP_SIZE = 50_000
+
+# 파티션 컬럼: 'year'는 회신일자에서 계산 (회신일자 없는 행은 null 파티션)
+PARTITION_DATE_COLUMN = "회신일자"
+PARTITION_YEAR = "year"
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet 내보내기에는 pyarrow가 필요합니다: pip install pyarrow") from e
+    return pa, pq
+
+
+def _stable_schema(schema):
+    """청크마다 달라질 수 있는 dictionary(category) 인덱스 타입을 int32로 고정"""
+    pa, _ = _require_pyarrow()
+    fields = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+        fields.append(field)
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+class ParquetStreamWriter:
+    """Parquet 파일에 row group 단위로 이어 쓰는 writer (스키마는 첫 데이터 기준)"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        compression: str = DEFAULT_COMPRESSION,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        """
+        Args:
+            path: 출력 파일 경로
+            compression: 압축 방식 (기본값: zstd)
+            row_group_size: row group 행 수 (항목 단위 쓰기 시 이 크기마다 기록)
+        """
+        self.pa, self.pq = _require_pyarrow()
+        self.path = Path(path)
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.rows_written = 0
+        self._writer = None
+        self._schema = None
+        self._builder: Optional[ColumnarBuilder] = None
+
+    def __enter__(self) -> "ParquetStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _write_table(self, table) -> None:
+        if table.num_rows == 0:
+            return
+        if self._writer is None:
+            self._schema = _stable_schema(table.schema)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = self.pq.ParquetWriter(str(self.path), self._schema, compression=self.compression)
+        self._writer.write_table(table.cast(self._schema), row_group_size=self.row_group_size)
+        self.rows_written += table.num_rows
+
+    def write_frame(self, df: pd.DataFrame) -> None:
+        """데이터프레임 청크 기록 (row_group_size보다 크면 여러 row group으로 나뉨)"""
+        self._write_table(self.pa.Table.from_pandas(df, preserve_index=False))
+
+    def write_items(self, items: Iterable[Any], record_class: Optional[Type] = None) -> None:
+        """
+        항목(Record 또는 dict) 스트림 기록: row_group_size개가 모일 때마다 row group 하나를 기록
+
+        Args:
+            items: Record 인스턴스 또는 dict 항목
+            record_class: Record 클래스 (dict 항목이면 None, 첫 항목의 키를 컬럼으로 사용)
+        """
+        for item in items:
+            if self._builder is None:
+                if record_class is not None:
+                    self._builder = ColumnarBuilder.for_record(record_class)
+                else:
+                    self._builder = ColumnarBuilder(list(item))
+            if isinstance(item, dict):
+                self._builder.append_mapping(item)
+            else:
+                self._builder.append(item)
+            if len(self._builder) >= self.row_group_size:
+                self._flush_items()
+
+    def _flush_items(self) -> None:
+        if self._builder is None or not len(self._builder):
+            return
+        table = self._builder.to_arrow()
+        self._builder = ColumnarBuilder(self._builder.columns, self._builder.dtypes)
+        self._write_table(table)
+
+    def close(self) -> None:
+        """남은 항목 기록 후 파일 닫기"""
+        self._flush_items()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            logger.info(f"✓ Parquet 파일 생성 완료: {self.path} ({self.rows_written}행)")
+
+
+def missing_partition_columns(df: pd.DataFrame, partition_by: Sequence[str]) -> List[str]:
+    """데이터프레임에서 만들 수 없는 파티션 컬럼 ('year'는 회신일자가 있으면 계산)"""
+    return [
+        column for column in partition_by
+        if column not in df.columns
+        and not (column == PARTITION_YEAR and PARTITION_DATE_COLUMN in df.columns)
+    ]
+
+
+def write_partitioned(
+    df: pd.DataFrame,
+    root: Union[str, Path],
+    partition_by: Sequence[str] = ("source", PARTITION_YEAR),
+    compression: str = DEFAULT_COMPRESSION,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> Path:
+    """
+    파티션(hive 형식: root/source=late/year=2024/*.parquet) Parquet 데이터셋으로 저장
+
+    기존 root 디렉터리는 새로 씀 (이전 실행의 파티션 파일이 남지 않도록).
+    source 파티션에는 source 컬럼이 있는 Harmonizer(keep_source=True) 결과가 필요하다.
+
+    Args:
+        df: 통합 DataFrame
+        root: 데이터셋 디렉터리
+        partition_by: 파티션 컬럼 ('year'는 회신일자에서 계산)
+        compression: 압축 방식
+        row_group_size: row group 최대 행 수
+
+    Returns:
+        Path: 데이터셋 디렉터리
+
+    Raises:
+        ValueError: 데이터프레임에 없는 파티션 컬럼
+    """
+    pa, _ = _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    missing = missing_partition_columns(df, partition_by)
+    if missing:
+        raise ValueError(f"파티션 컬럼이 없습니다: {', '.join(missing)} "
+                         f"(source는 Harmonizer(keep_source=True) 결과에 있음)")
+
+    root = Path(root)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    columns = []
+    for column in partition_by:
+        if column == PARTITION_YEAR and PARTITION_YEAR not in df.columns and PARTITION_DATE_COLUMN in df.columns:
+            dates = pd.to_datetime(df[PARTITION_DATE_COLUMN], errors="coerce")
+            table = table.append_column(PARTITION_YEAR, pa.array(dates.dt.year, type=pa.int32(), from_pandas=True))
+        columns.append(column)
+
+    # 파티션 값은 디렉터리 이름이 되므로 category(dictionary)는 일반 문자열로
+    for column in columns:
+        index = table.schema.get_field_index(column)
+        if pa.types.is_dictionary(table.schema.field(index).type):
+            table = table.set_column(index, column, table.column(index).cast(pa.string()))
+
+    if root.exists():
+        shutil.rmtree(root)
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=columns or None,
+        partitioning_flavor="hive" if columns else None,
+        file_options=ds.ParquetFileFormat().make_write_options(compression=compression),
+        max_rows_per_group=row_group_size,
+        existing_data_behavior="overwrite_or_ignore",
+    )
+    logger.info(f"✓ Parquet 파티션 데이터셋 생성 완료: {root} (파티션: {', '.join(columns) or '없음'})")
+    return root
@@ -0,0 +1,250 @@
+"""
+SQLite 전문 검색 내보내기
+------------------------
+통합 데이터프레임을 SQLite 파일에 저장하고 제목/질의요지/회답/이유에 FTS5 색인을 만든다.
+색인은 trigram 토크나이저를 사용하므로 띄어쓰기/조사와 관계없이 한글 부분 문자열로 검색된다.
+
+- 3글자 이상 검색어: FTS5 색인 (bm25 순위)
+- 2글자 이하 검색어(예: '보험'): trigram으로 색인할 수 없어 LIKE 검색 (전체 스캔)
+
+사용 예:
+    write_sqlite(df, "data/db_i.db")
+
+    with DocumentSearch("data/db_i.db") as search:
+        hits = search.search("전자금융 보험", columns=("제목", "회답"), limit=50)
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 문서 테이블 / FTS5 색인 테이블
+DOCUMENT_TABLE = "documents"
+FTS_TABLE = "documents_fts"
+
+# 전문 검색 대상 컬럼
+FTS_COLUMNS: Tuple[str, ...] = ("제목", "질의요지", "회답", "이유")
+
+# 조건 검색용 일반 색인 컬럼
+INDEX_COLUMNS: Tuple[str, ...] = ("회신일자", "구분", "분야")
+
+# trigram 토크나이저가 색인할 수 있는 최소 글자 수
+MIN_TRIGRAM_CHARS = 3
+
+DEFAULT_BATCH_SIZE = 5_000
+DEFAULT_SEARCH_LIMIT = 100
+
+# 날짜 컬럼 저장 형식 (문자열 비교 = 날짜 비교)
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def _quote(identifier: str) -> str:
+    """SQL 식별자 인용 (한글 컬럼명)"""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _column_values(series: pd.Series) -> List:
+    """컬럼 → SQLite 값 목록 (날짜는 YYYY-MM-DD 문자열, 결측은 NULL)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.dt.strftime(DATE_FORMAT)
+    elif pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series.tolist()
+    else:
+        values = series
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+def _column_type(series: pd.Series) -> str:
+    if pd.api.types.is_integer_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(series):
+        return "REAL"
+    return "TEXT"
+
+
+def write_sqlite(
+    df: pd.DataFrame,
+    path: Union[str, Path],
+    fts_columns: Sequence[str] = FTS_COLUMNS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Path:
+    """
+    데이터프레임을 SQLite 파일(문서 테이블 + FTS5 색인)로 저장 (기존 파일은 덮어씀)
+
+    Args:
+        df: 통합 데이터프레임 ('id' 컬럼이 있으면 rowid로 사용)
+        path: 출력 파일 경로
+        fts_columns: 전문 검색 색인 컬럼 (df에 없는 컬럼은 제외)
+        batch_size: 한 번에 INSERT 하는 행 수
+
+    Returns:
+        Path: 저장된 파일 경로
+    """
+    path = Path(path)
+    if path.exists():
+        path.unlink()
+    columns = [str(column) for column in df.columns]
+    fts_columns = [column for column in fts_columns if column in columns]
+
+    definitions = []
+    for column in columns:
+        if column == "id" and pd.api.types.is_integer_dtype(df[column]):
+            definitions.append(f"{_quote(column)} INTEGER PRIMARY KEY")
+        else:
+            definitions.append(f"{_quote(column)} {_column_type(df[column])}")
+    column_list = ", ".join(_quote(column) for column in columns)
+    placeholders = ", ".join("?" for _ in columns)
+
+    connection = sqlite3.connect(path)
+    try:
+        # 새 파일을 한 번에 만드는 용도이므로 저널/동기화 생략 (실패 시 파일째 버림)
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute(f"CREATE TABLE {DOCUMENT_TABLE} ({', '.join(definitions)})")
+
+        values = [_column_values(df[column]) for column in df.columns]
+        insert = f"INSERT INTO {DOCUMENT_TABLE} ({column_list}) VALUES ({placeholders})"
+        for start in range(0, len(df), batch_size):
+            connection.executemany(insert, zip(*(column[start:start + batch_size] for column in values)))
+
+        for column in INDEX_COLUMNS:
+            if column in columns:
+                connection.execute(
+                    f"CREATE INDEX {_quote(f'idx_{DOCUMENT_TABLE}_{column}')} ON {DOCUMENT_TABLE} ({_quote(column)})"
+                )
+
+        if fts_columns:
+            # 외부 콘텐츠 FTS5 테이블: 본문은 문서 테이블에만 저장하고 색인만 별도로 보관
+            connection.execute(
+                f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+                f"{', '.join(_quote(column) for column in fts_columns)}, "
+                f"content='{DOCUMENT_TABLE}', content_rowid='rowid', tokenize='trigram')"
+            )
+            connection.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+            connection.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+        connection.commit()
+    finally:
+        connection.close()
+    logger.info(f"✓ SQLite 파일 생성 완료: {path} ({len(df)}행, 전문 검색 컬럼: {', '.join(fts_columns)})")
+    return path
+
+
+def _fts_phrase(term: str) -> str:
+    """검색어 → FTS5 문구 (따옴표 이스케이프, 연산자로 해석되지 않음)"""
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+class DocumentSearch:
+    """write_sqlite로 만든 파일의 검색 API (읽기 전용)"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"SQLite 파일이 없습니다: {self.path}")
+        self._connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        self.columns: List[str] = [row[1] for row in self._connection.execute(f"PRAGMA table_info({DOCUMENT_TABLE})")]
+        self.fts_columns: List[str] = [row[1] for row in self._connection.execute(f"PRAGMA table_info({FTS_TABLE})")]
+
+    def __enter__(self) -> "DocumentSearch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _where(self, query: str, columns: Optional[Sequence[str]]) -> Tuple[Optional[str], List[str], List]:
+        """검색어 → (FTS5 MATCH 식, LIKE 조건 목록, LIKE 파라미터)"""
+        columns = list(columns) if columns else self.fts_columns
+        unknown = [column for column in columns if column not in self.fts_columns]
+        if unknown:
+            raise ValueError(f"전문 검색 컬럼이 아닙니다: {', '.join(unknown)} (선택: {', '.join(self.fts_columns)})")
+
+        terms = query.split()
+        long_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_CHARS]
+        short_terms = [term for term in terms if len(term) < MIN_TRIGRAM_CHARS]
+
+        match = None
+        if long_terms:
+            match = " AND ".join(_fts_phrase(term) for term in long_terms)
+            if len(columns) < len(self.fts_columns):
+                match = "{" + " ".join(_fts_phrase(column) for column in columns) + "} : (" + match + ")"
+
+        conditions, params = [], []
+        for term in short_terms:
+            pattern = _like_pattern(term)
+            conditions.append("(" + " OR ".join(f"d.{_quote(column)} LIKE ? ESCAPE '\\'" for column in columns) + ")")
+            params.extend([pattern] * len(columns))
+        return match, conditions, params
+
+    def _select(self, select: str, query: str, columns: Optional[Sequence[str]],
+                start_date: Optional[str], end_date: Optional[str]) -> Tuple[str, List, bool]:
+        """검색 조건 → (SQL, 파라미터, FTS5 사용 여부)"""
+        match, conditions, params = self._where(query, columns)
+        if start_date:
+            conditions.append('d."회신일자" >= ?')
+            params.append(start_date)
+        if end_date:
+            conditions.append('d."회신일자" <= ?')
+            params.append(end_date)
+
+        if match is not None:
+            conditions.insert(0, f"f.{FTS_TABLE} MATCH ?")
+            params.insert(0, match)
+            sql = f"SELECT {select} FROM {FTS_TABLE} f JOIN {DOCUMENT_TABLE} d ON d.rowid = f.rowid"
+        else:
+            sql = f"SELECT {select} FROM {DOCUMENT_TABLE} d"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        return sql, params, match is not None
+
+    def search(
+        self,
+        query: str,
+        columns: Optional[Sequence[str]] = None,
+        limit: Optional[int] = DEFAULT_SEARCH_LIMIT,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        검색어(공백으로 구분, 모두 포함)가 들어 있는 문서 반환
+
+        Args:
+            query: 검색어 (예: '전자금융 보험')
+            columns: 검색 대상 컬럼 (None이면 제목/질의요지/회답/이유 전체)
+            limit: 최대 반환 행 수 (None이면 전체)
+            start_date: 회신일자 시작 (YYYY-MM-DD, 포함)
+            end_date: 회신일자 종료 (YYYY-MM-DD, 포함)
+
+        Returns:
+            pd.DataFrame: 검색 결과 (3글자 이상 검색어가 있으면 관련도순, 아니면 최신 회신일자순)
+        """
+        sql, params, ranked = self._select("d.*", query, columns, start_date, end_date)
+        if ranked:
+            sql += " ORDER BY f.rank"
+        elif "회신일자" in self.columns:
+            sql += ' ORDER BY d."회신일자" DESC, d.rowid'
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        result = pd.read_sql_query(sql, self._connection, params=params)
+        if "회신일자" in result.columns:
+            result["회신일자"] = pd.to_datetime(result["회신일자"], format=DATE_FORMAT)
+        return result
+
+    def count(self, query: str, columns: Optional[Sequence[str]] = None,
+              start_date: Optional[str] = None, end_date: Optional[str] = None) -> int:
+        """검색어가 들어 있는 문서 수"""
+        sql, params, _ = self._select("COUNT(*)", query, columns, start_date, end_date)
+        return self._connection.execute(sql, params).fetchone()[0]
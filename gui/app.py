@@ -7,21 +7,30 @@ import pandas as pd
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 
+from common.cancellation import CancellationToken
+from common.progress import ProgressEvent
 from gui.preview import open_preview_window
-from gui.runtime import capture_runtime_output
+from gui.runtime import LogFile, capture_runtime_output, drain_queue
 from gui.services import collect_result_dataframe, export_result_dataframe
 from gui.settings import (
     APP_HEIGHT,
     APP_WIDTH,
     DEFAULT_OUTPUT_DIR,
     DEFAULT_OUTPUT_NAME,
+    EXPORT_FORMAT_OPTIONS,
+    LOG_DIR,
+    LOG_MAX_LINES,
+    LOG_MAX_MESSAGES_PER_TICK,
+    LOG_POLL_INTERVAL_MS,
+    PROGRESS_UNITS,
     RunConfig,
     get_output_extension,
+    get_output_extensions,
     load_last_config,
     normalize_output_name,
     save_last_config,
 )
-from gui.widgets import DatePicker
+from gui.widgets import DatePicker, ProgressPanel
 
 
 class FRCrawlerApp:
@@ -32,10 +41,17 @@ class FRCrawlerApp:
         self.root.minsize(1180, 860)
 
         self.log_queue: queue.Queue[str] = queue.Queue()
+        self.progress_queue: queue.Queue[ProgressEvent] = queue.Queue()
         self.running = False
+        self.cancel_token: Optional[CancellationToken] = None
+        self.close_requested = False
         self.last_preview_df: Optional[pd.DataFrame] = None
         self.last_preview_signature: Optional[tuple] = None
         self.last_counts: dict[str, int] = {}
+        try:
+            self.log_file: Optional[LogFile] = LogFile(LOG_DIR)
+        except OSError:
+            self.log_file = None
 
         self.initial_config = load_last_config()
         self.summary_var = tk.StringVar(value="preview 데이터가 아직 없습니다.")
@@ -44,7 +60,7 @@ class FRCrawlerApp:
         self._build_ui()
         self._load_initial_values()
         self._update_output_path_preview()
-        self.root.after(100, self._poll_log_queue)
+        self.root.after(LOG_POLL_INTERVAL_MS, self._poll_log_queue)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def _build_ui(self) -> None:
@@ -72,8 +88,8 @@ class FRCrawlerApp:
         format_frame = ttk.LabelFrame(options_row, text="출력 형식", padding=10)
         format_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 8))
         self.export_format_var = tk.StringVar(value=self.initial_config.export_format)
-        ttk.Radiobutton(format_frame, text="Pickle (.pkl)", variable=self.export_format_var, value="pickle").pack(anchor="w")
-        ttk.Radiobutton(format_frame, text="Excel (.xlsx)", variable=self.export_format_var, value="excel").pack(anchor="w")
+        for value, label in EXPORT_FORMAT_OPTIONS:
+            ttk.Radiobutton(format_frame, text=label, variable=self.export_format_var, value=value).pack(anchor="w")
 
         runtime_frame = ttk.LabelFrame(options_row, text="실행 옵션", padding=10)
         runtime_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -117,6 +133,8 @@ class FRCrawlerApp:
         self.preview_button.pack(side=tk.LEFT, padx=(8, 0))
         self.save_button = ttk.Button(action_frame, text="SAVE", command=self._start_save, state=tk.DISABLED)
         self.save_button.pack(side=tk.LEFT, padx=(8, 0))
+        self.stop_button = ttk.Button(action_frame, text="중지", command=self._stop_run, state=tk.DISABLED)
+        self.stop_button.pack(side=tk.LEFT, padx=(8, 0))
         self.close_button = ttk.Button(action_frame, text="닫기", command=self._on_close)
         self.close_button.pack(side=tk.RIGHT)
 
@@ -124,6 +142,9 @@ class FRCrawlerApp:
         summary_frame.pack(fill=tk.X)
         ttk.Label(summary_frame, textvariable=self.summary_var, justify="left").pack(anchor="w")
 
+        self.progress_panel = ProgressPanel(log_frame, PROGRESS_UNITS)
+        self.progress_panel.pack(fill=tk.X, pady=(0, 8))
+
         log_box_frame = ttk.LabelFrame(log_frame, text="실행 로그", padding=8)
         log_box_frame.pack(fill=tk.BOTH, expand=True)
         self.log_text = scrolledtext.ScrolledText(log_box_frame, wrap=tk.WORD, font=("Consolas", 10))
@@ -136,11 +157,25 @@ class FRCrawlerApp:
 
     def _load_initial_values(self) -> None:
         self._append_log("GUI가 준비되었습니다.")
+        if self.log_file is not None:
+            self._append_log(f"전체 로그 파일: {self.log_file.path}")
         self._update_summary_panel()
 
     def _append_log(self, message: str) -> None:
+        self._append_log_lines([message])
+
+    def _append_log_lines(self, messages: list[str]) -> None:
+        if not messages:
+            return
+        if self.log_file is not None:
+            self.log_file.write_lines(messages)
+        # 위젯에는 최근 LOG_MAX_LINES 줄만 유지: 한 번에 삽입한 뒤 넘치는 앞부분 삭제
+        text = "".join(f"{message}\n" for message in messages[-LOG_MAX_LINES:])
         self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
+        self.log_text.insert(tk.END, text)
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES + 1}.0")
         self.log_text.see(tk.END)
         self.log_text.configure(state=tk.DISABLED)
 
@@ -148,19 +183,25 @@ class FRCrawlerApp:
         self.log_queue.put(message)
 
     def _poll_log_queue(self) -> None:
-        while True:
-            try:
-                message = self.log_queue.get_nowait()
-            except queue.Empty:
-                break
-            self._append_log(message)
-        self.root.after(100, self._poll_log_queue)
+        messages = drain_queue(self.log_queue, LOG_MAX_MESSAGES_PER_TICK)
+        self._append_log_lines(messages)
+        # 진행 이벤트는 유닛별 가장 최근(seq가 가장 큰) 상태만 그림
+        latest_events: dict[str, ProgressEvent] = {}
+        for event in drain_queue(self.progress_queue, LOG_MAX_MESSAGES_PER_TICK):
+            if event.unit not in latest_events or event.seq > latest_events[event.unit].seq:
+                latest_events[event.unit] = event
+        for event in latest_events.values():
+            self.progress_panel.update_event(event)
+        # 한도까지 꺼냈으면 아직 남은 메시지가 있으므로 다음 tick을 바로 예약
+        delay = 1 if len(messages) >= LOG_MAX_MESSAGES_PER_TICK else LOG_POLL_INTERVAL_MS
+        self.root.after(delay, self._poll_log_queue)
 
     def _set_running(self, running: bool) -> None:
         self.running = running
         state = tk.DISABLED if running else tk.NORMAL
         self.run_button.config(state=state)
-        self.close_button.config(state=state)
+        stop_state = tk.NORMAL if (running and self.cancel_token is not None) else tk.DISABLED
+        self.stop_button.config(state=stop_state)
         preview_state = tk.NORMAL if (not running and self.last_preview_df is not None and not self.last_preview_df.empty) else tk.DISABLED
         save_state = tk.NORMAL if (not running and self.last_preview_df is not None and not self.last_preview_df.empty) else tk.DISABLED
         self.preview_button.config(state=preview_state)
@@ -189,7 +230,9 @@ class FRCrawlerApp:
 
     def _browse_output_file(self) -> None:
         extension = get_output_extension(self.export_format_var.get())
-        filetypes = [("Excel 파일", "*.xlsx")] if extension == ".xlsx" else [("Pickle 파일", "*.pkl")]
+        filetypes = [(f"{label} 파일", f"*{ext}") for label, ext in (
+            ("Pickle", ".pkl"), ("Excel", ".xlsx"), ("Parquet", ".parquet"), ("JSONL", ".jsonl")
+        ) if ext in get_output_extensions(self.export_format_var.get())]
         initialdir = self.output_dir_var.get() or str(Path.cwd())
         initialfile = f"{normalize_output_name(self.output_name_var.get()) or DEFAULT_OUTPUT_NAME}{extension}"
         selected = filedialog.asksaveasfilename(
@@ -207,9 +250,10 @@ class FRCrawlerApp:
     def _update_output_path_preview(self) -> None:
         output_name = normalize_output_name(self.output_name_var.get()) or DEFAULT_OUTPUT_NAME
         output_dir = self.output_dir_var.get().strip() or DEFAULT_OUTPUT_DIR
-        extension = get_output_extension(self.export_format_var.get())
-        output_path = Path(output_dir) / f"{output_name}{extension}"
-        self.output_path_var.set(str(output_path))
+        extensions = get_output_extensions(self.export_format_var.get())
+        output_path = Path(output_dir) / f"{output_name}{extensions[0]}"
+        # 여러 형식이면 나머지 확장자를 함께 표시 (예: data/db_i.pkl, .xlsx, .parquet, .jsonl, .db)
+        self.output_path_var.set(", ".join([str(output_path)] + extensions[1:]))
 
     def _build_config(self) -> Optional[RunConfig]:
         try:
@@ -285,6 +329,8 @@ class FRCrawlerApp:
             return
 
         save_last_config(config)
+        cancel_token = CancellationToken()
+        self.cancel_token = cancel_token
         self._set_running(True)
         self._append_log("")
         self._append_log(f"[{action_name}] 시작")
@@ -292,16 +338,30 @@ class FRCrawlerApp:
         def background() -> None:
             with capture_runtime_output(self._queue_log):
                 try:
-                    worker_func(config)
+                    worker_func(config, cancel_token)
                 except Exception as exc:
                     self.root.after(0, lambda: self._finish_run(False, f"{action_name} 실패: {type(exc).__name__}: {exc}"))
                 else:
-                    self.root.after(0, lambda: self._finish_run(True, f"{action_name} 완료"))
+                    if cancel_token.cancelled:
+                        self.root.after(0, lambda: self._finish_run(True, f"{action_name} 중지됨 (부분 결과)"))
+                    else:
+                        self.root.after(0, lambda: self._finish_run(True, f"{action_name} 완료"))
 
         threading.Thread(target=background, daemon=True).start()
 
+    def _stop_run(self) -> None:
+        if not self.running or self.cancel_token is None or self.cancel_token.cancelled:
+            return
+        self._append_log("중지 요청: 새 요청을 보내지 않으며, 진행 중인 요청이 끝나거나 시간 초과되면 부분 결과를 반환합니다.")
+        self.stop_button.config(state=tk.DISABLED)
+        self.cancel_token.cancel()
+
     def _finish_run(self, success: bool, message: str) -> None:
         self._append_log(message)
+        self.cancel_token = None
+        if self.close_requested:
+            self.root.destroy()
+            return
         self._set_running(False)
         self._update_summary_panel()
         if success:
@@ -309,9 +369,30 @@ class FRCrawlerApp:
             self.save_button.config(state=tk.NORMAL if self.last_preview_df is not None and not self.last_preview_df.empty else tk.DISABLED)
 
     def _start_run(self) -> None:
-        def worker(config: RunConfig) -> None:
+        def worker(config: RunConfig, cancel_token: CancellationToken) -> None:
             self._queue_log("결과 수집과 미리보기를 실행합니다.")
-            counts, notes, preview_df = collect_result_dataframe(config, progress_callback=self._queue_log)
+            first_preview_shown = threading.Event()
+
+            def show_first_preview(first_df: pd.DataFrame) -> None:
+                # 실행당 한 번만: 최신 문서가 먼저 모이면 나머지 수집 중에 중간 미리보기 표시
+                if first_df.empty or first_preview_shown.is_set():
+                    return
+                first_preview_shown.set()
+
+                def open_first_preview() -> None:
+                    if self.close_requested or not self.running:
+                        return
+                    open_preview_window(self.root, first_df, title="중간 미리보기 - 최신 문서 (수집 진행 중)")
+
+                self.root.after(0, open_first_preview)
+
+            counts, notes, preview_df = collect_result_dataframe(
+                config,
+                progress_callback=self._queue_log,
+                cancel_token=cancel_token,
+                first_preview_callback=show_first_preview,
+                progress_listener=self.progress_queue.put,
+            )
 
             total = sum(counts.values())
             summary_lines = [f"조회 기간: {config.start_date} ~ {config.end_date}"]
@@ -324,6 +405,8 @@ class FRCrawlerApp:
             summary = "\n".join(summary_lines)
 
             def finish_preview() -> None:
+                if self.close_requested:
+                    return
                 self.last_preview_df = preview_df
                 self.last_preview_signature = self._config_signature(config)
                 self.last_counts = counts
@@ -336,6 +419,10 @@ class FRCrawlerApp:
 
             self.root.after(0, finish_preview)
 
+        if not self.running:
+            # 이전 실행의 진행 상황 정리
+            drain_queue(self.progress_queue, self.progress_queue.qsize())
+            self.progress_panel.reset()
         self._run_worker("RUN", worker)
 
     def _start_save(self) -> None:
@@ -367,12 +454,12 @@ class FRCrawlerApp:
         def background() -> None:
             with capture_runtime_output(self._queue_log):
                 try:
-                    saved_path = export_result_dataframe(self.last_preview_df.copy(), config)
+                    saved_paths = export_result_dataframe(self.last_preview_df.copy(), config)
                 except Exception as exc:
                     self.root.after(0, lambda: self._finish_run(False, f"SAVE 실패: {type(exc).__name__}: {exc}"))
                     return
 
-                summary_lines = [f"저장 완료: {saved_path}"]
+                summary_lines = [f"저장 완료: {', '.join(str(path) for path in saved_paths)}"]
                 for key, count in self.last_counts.items():
                     summary_lines.append(f"- {key}: {count}건")
                 summary_lines.append(f"최종 결과: {len(self.last_preview_df)}건")
@@ -393,12 +480,29 @@ class FRCrawlerApp:
 
     def _on_close(self) -> None:
         if self.running:
-            messagebox.showinfo("실행 중", "현재 작업이 진행 중입니다. 완료 후 닫아주세요.", parent=self.root)
+            if self.cancel_token is None:
+                messagebox.showinfo("실행 중", "현재 작업이 진행 중입니다. 완료 후 닫아주세요.", parent=self.root)
+                return
+            answer = messagebox.askyesno(
+                "실행 중",
+                "현재 작업이 진행 중입니다.\n작업을 중지하고 닫을까요?",
+                parent=self.root,
+            )
+            if not answer:
+                return
+            self.close_requested = True
+            self._stop_run()
             return
         self.root.destroy()
 
     def run(self) -> None:
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            # 닫히기 전에 남은 로그까지 파일에 기록
+            if self.log_file is not None:
+                self.log_file.write_lines(drain_queue(self.log_queue, self.log_queue.qsize()))
+                self.log_file.close()
 
 
 def main() -> None:
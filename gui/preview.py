@@ -1,21 +1,65 @@
+import threading
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, ttk
 
+import numpy as np
 import pandas as pd
 
-from gui.settings import DETAIL_TEXT_COLUMNS, PREVIEW_LIST_COLUMNS
+from gui.preview_index import PreviewIndex
+from gui.settings import DETAIL_TEXT_COLUMNS, FILTER_CATEGORY_COLUMNS, PREVIEW_LIST_COLUMNS, PREVIEW_SEARCH_DELAY_MS
+from gui.widgets import VirtualTreeview
 
 
-def open_preview_window(root: tk.Misc, preview_df: pd.DataFrame) -> None:
+ALL_CATEGORIES = "전체"
+
+
+def _cell_text(value) -> str:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    return str(value)
+
+
+def open_preview_window(root: tk.Misc, preview_df: pd.DataFrame, title: str = "테스트 미리보기") -> None:
     if preview_df is None or preview_df.empty:
         messagebox.showinfo("미리보기", "표시할 테스트 데이터가 없습니다.", parent=root)
         return
 
     window = tk.Toplevel(root)
-    window.title(f"테스트 미리보기 ({len(preview_df)}건)")
+    window.title(f"{title} ({len(preview_df)}건)")
     window.geometry("1500x900")
     window.minsize(1200, 700)
 
+    # 검색/필터 (색인은 백그라운드에서 생성, 완료 전에는 비활성)
+    filter_frame = ttk.Frame(window)
+    filter_frame.pack(fill=tk.X, padx=12, pady=(12, 0))
+    query_var = tk.StringVar()
+    category_vars = {column: tk.StringVar(value=ALL_CATEGORIES) for column in FILTER_CATEGORY_COLUMNS}
+    start_date_var = tk.StringVar()
+    end_date_var = tk.StringVar()
+    count_var = tk.StringVar(value="색인 생성 중...")
+
+    ttk.Label(filter_frame, text="검색").pack(side=tk.LEFT)
+    query_entry = ttk.Entry(filter_frame, textvariable=query_var, width=36)
+    query_entry.pack(side=tk.LEFT, padx=(4, 12))
+    category_boxes: dict[str, ttk.Combobox] = {}
+    for column, variable in category_vars.items():
+        ttk.Label(filter_frame, text=column).pack(side=tk.LEFT)
+        box = ttk.Combobox(filter_frame, textvariable=variable, values=[ALL_CATEGORIES], state="readonly", width=16)
+        box.pack(side=tk.LEFT, padx=(4, 12))
+        category_boxes[column] = box
+    ttk.Label(filter_frame, text="회신일자").pack(side=tk.LEFT)
+    start_entry = ttk.Entry(filter_frame, textvariable=start_date_var, width=12)
+    start_entry.pack(side=tk.LEFT, padx=(4, 2))
+    ttk.Label(filter_frame, text="~").pack(side=tk.LEFT)
+    end_entry = ttk.Entry(filter_frame, textvariable=end_date_var, width=12)
+    end_entry.pack(side=tk.LEFT, padx=(2, 12))
+    reset_button = ttk.Button(filter_frame, text="초기화")
+    reset_button.pack(side=tk.LEFT)
+    ttk.Label(filter_frame, textvariable=count_var).pack(side=tk.RIGHT)
+    filter_controls = [query_entry, start_entry, end_entry, reset_button, *category_boxes.values()]
+    for control in filter_controls:
+        control.state(["disabled"])
+
     paned = ttk.Panedwindow(window, orient=tk.HORIZONTAL)
     paned.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
 
@@ -24,8 +68,18 @@ def open_preview_window(root: tk.Misc, preview_df: pd.DataFrame) -> None:
     paned.add(left_frame, weight=3)
     paned.add(right_frame, weight=4)
 
-    tree = ttk.Treeview(left_frame, columns=PREVIEW_LIST_COLUMNS, show="headings")
-    tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    # 목록 컬럼 값 배열 (행 위치로 바로 조회, 화면에 보이는 행만 Treeview에 채움)
+    list_values = [
+        preview_df[column].to_numpy(dtype=object) if column in preview_df.columns else np.full(len(preview_df), "", dtype=object)
+        for column in PREVIEW_LIST_COLUMNS
+    ]
+
+    def row_values(position: int) -> list[str]:
+        return [_cell_text(values[position]) for values in list_values]
+
+    table = VirtualTreeview(left_frame, PREVIEW_LIST_COLUMNS, row_values)
+    table.pack(fill=tk.BOTH, expand=True)
+    tree = table.tree
 
     tree.column("구분", width=120, anchor="center")
     tree.column("분야", width=140, anchor="w")
@@ -36,10 +90,6 @@ def open_preview_window(root: tk.Misc, preview_df: pd.DataFrame) -> None:
     for column in PREVIEW_LIST_COLUMNS:
         tree.heading(column, text=column)
 
-    tree_scroll = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=tree.yview)
-    tree_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-    tree.configure(yscrollcommand=tree_scroll.set)
-
     meta_frame = ttk.LabelFrame(right_frame, text="기본 정보")
     meta_frame.pack(fill=tk.X, padx=4, pady=(0, 8))
     meta_text = tk.StringVar(value="행을 선택하면 상세 내용이 표시됩니다.")
@@ -54,12 +104,8 @@ def open_preview_window(root: tk.Misc, preview_df: pd.DataFrame) -> None:
         widget.configure(state=tk.DISABLED)
         detail_widgets[column] = widget
 
-    for idx, row in preview_df.iterrows():
-        values = [row.get(column, "") for column in PREVIEW_LIST_COLUMNS]
-        tree.insert("", tk.END, iid=str(idx), values=values)
-
-    def render_detail(index: int) -> None:
-        row = preview_df.iloc[index]
+    def render_detail(position: int) -> None:
+        row = preview_df.iloc[position]
         meta_lines = [
             f"구분: {row.get('구분', '')}",
             f"분야: {row.get('분야', '')}",
@@ -72,19 +118,83 @@ def open_preview_window(root: tk.Misc, preview_df: pd.DataFrame) -> None:
         for column, widget in detail_widgets.items():
             widget.configure(state=tk.NORMAL)
             widget.delete("1.0", tk.END)
-            widget.insert("1.0", row.get(column, ""))
+            widget.insert("1.0", _cell_text(row.get(column, "")))
             widget.configure(state=tk.DISABLED)
 
-    def on_select(_event=None) -> None:
-        selection = tree.selection()
-        if not selection:
-            return
-        render_detail(int(selection[0]))
+    def clear_detail() -> None:
+        meta_text.set("조건에 맞는 항목이 없습니다.")
+        for widget in detail_widgets.values():
+            widget.configure(state=tk.NORMAL)
+            widget.delete("1.0", tk.END)
+            widget.configure(state=tk.DISABLED)
 
-    tree.bind("<<TreeviewSelect>>", on_select)
+    index: dict[str, PreviewIndex] = {}
+    pending_filter: dict[str, str] = {}
 
-    first_items = tree.get_children()
-    if first_items:
-        tree.selection_set(first_items[0])
-        tree.focus(first_items[0])
-        render_detail(0)
+    def apply_filter() -> None:
+        pending_filter.pop("after_id", None)
+        if "index" not in index:
+            return
+        categories = {column: variable.get() for column, variable in category_vars.items() if variable.get() != ALL_CATEGORIES}
+        try:
+            positions = index["index"].filter(
+                query_var.get(),
+                categories,
+                start_date_var.get().strip() or None,
+                end_date_var.get().strip() or None,
+            )
+        except ValueError:
+            count_var.set("회신일자 형식: YYYY-MM-DD")
+            return
+        table.set_positions(positions)
+        count_var.set(f"{len(positions)} / {len(preview_df)}건")
+        if not len(positions):
+            clear_detail()
+        elif table.selected_index is None:
+            table.select_index(0)
+
+    def schedule_filter(_event=None) -> None:
+        # 입력 중에는 마지막 입력 후 PREVIEW_SEARCH_DELAY_MS 동안 변화가 없을 때 한 번만 적용
+        if "after_id" in pending_filter:
+            window.after_cancel(pending_filter["after_id"])
+        pending_filter["after_id"] = window.after(PREVIEW_SEARCH_DELAY_MS, apply_filter)
+
+    def reset_filter() -> None:
+        query_var.set("")
+        for variable in category_vars.values():
+            variable.set(ALL_CATEGORIES)
+        start_date_var.set("")
+        end_date_var.set("")
+        apply_filter()
+
+    def on_index_ready(built: PreviewIndex) -> None:
+        if not window.winfo_exists():
+            return
+        index["index"] = built
+        for column, box in category_boxes.items():
+            box.configure(values=[ALL_CATEGORIES, *built.categories(column)])
+        for control in filter_controls:
+            control.state(["!disabled"])
+        for box in category_boxes.values():
+            box.state(["readonly"])
+        count_var.set(f"{len(preview_df)} / {len(preview_df)}건")
+        apply_filter()
+
+    def build_index() -> None:
+        built = PreviewIndex(preview_df)
+        try:
+            window.after(0, lambda: on_index_ready(built))
+        except (RuntimeError, tk.TclError):
+            pass
+
+    for entry in (query_entry, start_entry, end_entry):
+        entry.bind("<KeyRelease>", schedule_filter)
+        entry.bind("<Return>", lambda _event: apply_filter())
+    for box in category_boxes.values():
+        box.bind("<<ComboboxSelected>>", lambda _event: apply_filter())
+    reset_button.configure(command=reset_filter)
+
+    table.on_select = render_detail
+    table.set_positions(np.arange(len(preview_df)))
+    table.select_index(0)
+    threading.Thread(target=build_index, daemon=True).start()
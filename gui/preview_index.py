@@ -0,0 +1,150 @@
+import re
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from gui.settings import FILTER_CATEGORY_COLUMNS, SEARCH_TEXT_COLUMNS
+
+# 토큰 경계: 글자/숫자/밑줄 이외의 문자 (pyarrow RE2의 \w는 ASCII만 포함하므로 유니코드 클래스로 지정)
+_ARROW_SEPARATOR_PATTERN = r"[^\p{L}\p{N}_]+"
+_SEPARATOR_PATTERN = r"[^\w]+"
+
+
+def _tokenize_columns_arrow(columns: list[pd.Series]) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """pyarrow compute로 (토큰 코드, 행 위치, 어휘) 생성"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    tokens, parents = [], []
+    for values in columns:
+        text = pc.replace_substring_regex(pc.utf8_lower(pa.array(values.fillna("").astype(str))), _ARROW_SEPARATOR_PATTERN, " ")
+        lists = pc.utf8_split_whitespace(text)
+        # 앞뒤 구분자 자리에서 생기는 빈 토큰 제외
+        flat = pc.list_flatten(lists)
+        keep = pc.not_equal(flat, "")
+        tokens.append(pc.filter(flat, keep))
+        parents.append(pc.list_parent_indices(lists).to_numpy()[keep.to_numpy(zero_copy_only=False)])
+    encoded = pc.dictionary_encode(pa.chunked_array(tokens, type=tokens[0].type)).combine_chunks()
+    return encoded.indices.to_numpy().astype(np.int64), np.concatenate(parents), encoded.dictionary.to_pylist()
+
+
+def _tokenize_columns_pandas(columns: list[pd.Series]) -> tuple[np.ndarray, np.ndarray, list[str]]:
+    """pyarrow가 없을 때 pandas 문자열 메서드로 (토큰 코드, 행 위치, 어휘) 생성"""
+    frames = []
+    for values in columns:
+        # object dtype로 변환하여 유니코드 \w를 지원하는 re 엔진 사용
+        tokens = values.fillna("").astype(str).astype(object).str.lower().str.replace(_SEPARATOR_PATTERN, " ", regex=True).str.split()
+        exploded = pd.Series(tokens.to_numpy(), index=np.arange(len(values))).explode().dropna()
+        frames.append(exploded)
+    exploded = pd.concat(frames)
+    codes, vocabulary = pd.factorize(exploded.to_numpy())
+    return codes.astype(np.int64), exploded.index.to_numpy(), list(vocabulary)
+
+
+def _query_tokens(query: str) -> list[str]:
+    return [token for token in re.split(_SEPARATOR_PATTERN, query.lower()) if token]
+
+
+class PreviewIndex:
+    """미리보기 검색/필터용 색인 (결과 데이터프레임마다 한 번 생성, 결과는 행 위치 배열)
+
+    - 본문 검색: 제목/질의요지/회답/이유 토큰의 역색인 (검색어가 토큰의 일부이면 일치, 여러 검색어는 모두 포함)
+    - 회신일자: 정렬된 날짜 배열 + 행 위치 (기간 조건은 이진 탐색)
+    - 구분/분야: 값별 행 bitmap
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        text_columns: Sequence[str] = SEARCH_TEXT_COLUMNS,
+        category_columns: Sequence[str] = FILTER_CATEGORY_COLUMNS,
+        date_column: str = "회신일자",
+    ):
+        self.row_count = len(df)
+        self._build_text_index(df, [column for column in text_columns if column in df.columns])
+        self._build_date_index(df, date_column)
+        self.category_bitmaps: dict[str, dict[str, np.ndarray]] = {}
+        for column in category_columns:
+            if column in df.columns:
+                codes, values = pd.factorize(df[column].astype(object).fillna("").astype(str).to_numpy())
+                self.category_bitmaps[column] = {value: codes == code for code, value in enumerate(values) if value}
+
+    def _build_text_index(self, df: pd.DataFrame, columns: list[str]) -> None:
+        if not columns or not self.row_count:
+            self.vocabulary = pd.Series([], dtype=str)
+            self.postings = np.zeros(0, dtype=np.int64)
+            self.posting_tokens = np.zeros(0, dtype=np.int64)
+            return
+        try:
+            codes, positions, vocabulary = _tokenize_columns_arrow([df[column] for column in columns])
+        except ImportError:
+            codes, positions, vocabulary = _tokenize_columns_pandas([df[column] for column in columns])
+        # (토큰, 행) 쌍 중복 제거 후 토큰 순 → 행 순 정렬 (토큰별 posting list가 연속 구간)
+        pairs = np.unique(codes * self.row_count + positions)
+        self.posting_tokens = pairs // self.row_count
+        self.postings = pairs % self.row_count
+        self.vocabulary = pd.Series(vocabulary, dtype=str)
+
+    def _build_date_index(self, df: pd.DataFrame, column: str) -> None:
+        if column in df.columns:
+            dates = pd.to_datetime(df[column], errors="coerce", format="mixed")
+            days = dates.to_numpy(dtype="datetime64[D]")
+            valid = np.flatnonzero(~np.isnat(days))
+        else:
+            days = np.zeros(0, dtype="datetime64[D]")
+            valid = np.zeros(0, dtype=np.int64)
+        order = valid[np.argsort(days[valid], kind="stable")]
+        self.date_positions = order
+        self.sorted_dates = days[order]
+
+    def categories(self, column: str) -> list[str]:
+        return sorted(self.category_bitmaps.get(column, {}))
+
+    def _term_mask(self, term: str) -> np.ndarray:
+        """term을 포함하는 토큰이 있는 행"""
+        matched_tokens = self.vocabulary.str.contains(term, regex=False).to_numpy(dtype=bool)
+        mask = np.zeros(self.row_count, dtype=bool)
+        if matched_tokens.any():
+            mask[self.postings[matched_tokens[self.posting_tokens]]] = True
+        return mask
+
+    def _date_mask(self, start_date: Optional[str], end_date: Optional[str]) -> np.ndarray:
+        lower = 0 if not start_date else np.searchsorted(self.sorted_dates, np.datetime64(start_date, "D"), side="left")
+        upper = len(self.sorted_dates) if not end_date else np.searchsorted(
+            self.sorted_dates, np.datetime64(end_date, "D"), side="right"
+        )
+        mask = np.zeros(self.row_count, dtype=bool)
+        mask[self.date_positions[lower:upper]] = True
+        return mask
+
+    def filter(
+        self,
+        query: str = "",
+        categories: Optional[Mapping[str, Optional[str]]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        조건을 모두 만족하는 행 위치 (오름차순)
+
+        Args:
+            query: 검색어 (공백으로 구분, 모두 포함)
+            categories: {컬럼: 값} (값이 None/빈 문자열이면 조건 없음)
+            start_date / end_date: 회신일자 기간 (YYYY-MM-DD, 포함, 지정 시 회신일자 없는 행 제외)
+
+        Raises:
+            ValueError: 날짜 형식 오류
+        """
+        mask = np.ones(self.row_count, dtype=bool)
+        for column, value in (categories or {}).items():
+            if value:
+                bitmap = self.category_bitmaps.get(column, {}).get(value)
+                if bitmap is None:
+                    return np.zeros(0, dtype=np.int64)
+                mask &= bitmap
+        if start_date or end_date:
+            mask &= self._date_mask(start_date, end_date)
+        for term in _query_tokens(query):
+            mask &= self._term_mask(term)
+        return np.flatnonzero(mask)
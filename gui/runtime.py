@@ -1,7 +1,10 @@
 import logging
+import queue
 import sys
 from contextlib import contextmanager
-from typing import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional, TextIO
 
 
 class GuiLogHandler(logging.Handler):
@@ -16,6 +19,37 @@ class GuiLogHandler(logging.Handler):
             self.handleError(record)
 
 
+def drain_queue(message_queue: queue.Queue, max_items: int) -> list[str]:
+    """대기 중인 메시지를 최대 max_items개까지 한 번에 꺼냄"""
+    messages = []
+    while len(messages) < max_items:
+        try:
+            messages.append(message_queue.get_nowait())
+        except queue.Empty:
+            break
+    return messages
+
+
+class LogFile:
+    """실행 로그 전체를 파일에 기록 (화면에는 최근 줄만 유지하므로 전체 기록은 파일로 확인)"""
+
+    def __init__(self, log_dir: Path):
+        log_dir.mkdir(parents=True, exist_ok=True)
+        self.path = log_dir / f"frcrawler_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        self.file: Optional[TextIO] = open(self.path, "a", encoding="utf-8")
+
+    def write_lines(self, lines: list[str]) -> None:
+        if self.file is None or not lines:
+            return
+        self.file.write("".join(f"{line}\n" for line in lines))
+        self.file.flush()
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
 class QueueWriter:
     def __init__(self, callback: Callable[[str], None]):
         self.callback = callback
@@ -3,22 +3,28 @@ from typing import Callable, Optional
 
 import pandas as pd
 
-from gui.settings import DETAIL_TEXT_COLUMNS, PREVIEW_LIST_COLUMNS, RunConfig, build_common_params, get_output_extension
+from common.cancellation import CancellationToken
+from common.progress import ProgressListener
+from gui.settings import DETAIL_TEXT_COLUMNS, PREVIEW_LIST_COLUMNS, RunConfig, build_common_params
 
 
 def build_preview_dataframe(past_df, late_df, integ_df) -> pd.DataFrame:
     from harmonizer.main import Harmonizer
 
+    # 내보내기 결과에도 쓰이므로 source 컬럼 유지 (소스별 Parquet 파티션, manifest 소스별 해시)
+    # 소스 간 같은 문서는 한 건만 표시/저장 (우선순위 late > integ > past)
     preview_df = Harmonizer(
         past_df=past_df,
         late_df=late_df,
         integ_df=integ_df,
+        keep_source=True,
+        dedup=True,
     ).run()
 
     if preview_df.empty:
         return preview_df
 
-    preview_df = preview_df.copy().reset_index(drop=True)
+    # Harmonizer 결과는 새 RangeIndex 데이터프레임이므로 복사 없이 제자리에서 가공
     if "회신일자" in preview_df.columns:
         preview_df["회신일자"] = pd.to_datetime(preview_df["회신일자"], errors="coerce").dt.strftime("%Y-%m-%d")
         preview_df["회신일자"] = preview_df["회신일자"].fillna("")
@@ -26,7 +32,14 @@ def build_preview_dataframe(past_df, late_df, integ_df) -> pd.DataFrame:
     for column in PREVIEW_LIST_COLUMNS + DETAIL_TEXT_COLUMNS:
         if column not in preview_df.columns:
             preview_df[column] = ""
-        preview_df[column] = preview_df[column].fillna("").astype(str)
+        values = preview_df[column]
+        # Harmonizer 출력의 category/문자열 dtype은 그대로 유지 (astype(str) 전체 변환/복사 생략)
+        if isinstance(values.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            continue
+        values = values.fillna("")
+        if pd.api.types.infer_dtype(values, skipna=False) != "string":
+            values = values.astype(str)
+        preview_df[column] = values
 
     return preview_df
 
@@ -34,8 +47,14 @@ def build_preview_dataframe(past_df, late_df, integ_df) -> pd.DataFrame:
 def collect_result_dataframe(
     config: RunConfig,
     progress_callback: Optional[Callable[[str], None]] = None,
+    cancel_token: Optional[CancellationToken] = None,
+    first_preview_callback: Optional[Callable[[pd.DataFrame], None]] = None,
+    progress_listener: Optional[ProgressListener] = None,
 ) -> tuple[dict[str, int], list[str], pd.DataFrame]:
+    cancel_token = cancel_token or CancellationToken()
     common_params = build_common_params(config)
+    common_params["cancel_token"] = cancel_token
+    common_params["progress_listener"] = progress_listener
     counts: dict[str, int] = {}
     notes: list[str] = ["테스트/실행은 건수 확인과 상세 수집을 한 번에 수행합니다."]
 
@@ -43,36 +62,53 @@ def collect_result_dataframe(
     late_df = None
     integ_df = None
 
-    if config.run_past:
+    def first_results_callback(unit: str) -> Optional[Callable[[pd.DataFrame], None]]:
+        """unit의 최신 문서 일부가 수집되면 이미 완료된 유닛 결과와 합쳐 중간 미리보기 전달"""
+        if first_preview_callback is None:
+            return None
+
+        def callback(first_df: pd.DataFrame) -> None:
+            frames = {"past_df": past_df, "late_df": late_df, "integ_df": integ_df, f"{unit}_df": first_df}
+            preview_df = build_preview_dataframe(**frames)
+            if progress_callback:
+                progress_callback(f"{unit} 최신 문서 {len(first_df)}건 먼저 수집: 중간 미리보기 {len(preview_df)}건")
+            first_preview_callback(preview_df)
+
+        return callback
+
+    if config.run_past and not cancel_token.cancelled:
         from past.main import main as past_main
 
         if progress_callback:
             progress_callback("past 수집 시작")
-        past_df = past_main(**common_params)
+        past_df = past_main(**common_params, first_results_callback=first_results_callback("past"))
         counts["past"] = len(past_df)
         if progress_callback:
             progress_callback(f"past 수집 완료: {counts['past']}건")
 
-    if config.run_late:
+    if config.run_late and not cancel_token.cancelled:
         from late.main import main as late_main
 
         if progress_callback:
             progress_callback("late 수집 시작")
-        late_df = late_main(**common_params)
+        late_df = late_main(**common_params, first_results_callback=first_results_callback("late"))
         counts["late"] = len(late_df)
         if progress_callback:
             progress_callback(f"late 수집 완료: {counts['late']}건")
 
-    if config.run_integ:
+    if config.run_integ and not cancel_token.cancelled:
         from integ.main import main as integ_main
 
         if progress_callback:
             progress_callback("integ 수집 시작")
-        integ_df = integ_main(**common_params)
+        integ_df = integ_main(**common_params, first_results_callback=first_results_callback("integ"))
         counts["integ"] = len(integ_df)
         if progress_callback:
             progress_callback(f"integ 수집 완료: {counts['integ']}건")
 
+    if cancel_token.cancelled:
+        notes.append("사용자 요청으로 중지되어 부분 결과만 포함되어 있습니다.")
+
     preview_df = build_preview_dataframe(past_df, late_df, integ_df)
     if progress_callback:
         progress_callback(f"미리보기 데이터프레임 생성 완료: {len(preview_df)}건")
@@ -80,13 +116,18 @@ def collect_result_dataframe(
     return counts, notes, preview_df
 
 
-def export_result_dataframe(result_df: pd.DataFrame, config: RunConfig) -> Path:
+def export_result_dataframe(result_df: pd.DataFrame, config: RunConfig) -> list[Path]:
     from exporter.exporter import export_dataframe
 
-    export_dataframe(
+    return export_dataframe(
         result_df,
         output_dir=config.output_dir,
         export_format=config.export_format,
         output_name=config.output_name,
+        crawl_params={
+            **build_common_params(config),
+            "run_past": config.run_past,
+            "run_late": config.run_late,
+            "run_integ": config.run_integ,
+        },
     )
-    return Path(config.output_dir) / f"{config.output_name}{get_output_extension(config.export_format)}"
@@ -5,6 +5,7 @@ from pathlib import Path
 
 
 CONFIG_PATH = Path("config") / "last_run.json"
+LOG_DIR = Path("logs")
 DEFAULT_EXPORT_FORMAT = "pickle"
 DEFAULT_MAX_WORKERS = 64
 DEFAULT_DELAY = 0.2
@@ -14,6 +15,22 @@ APP_WIDTH = 1280
 APP_HEIGHT = 940
 PREVIEW_LIST_COLUMNS = ["구분", "분야", "제목", "회신일자", "일련번호"]
 DETAIL_TEXT_COLUMNS = ["질의요지", "회답", "이유"]
+SEARCH_TEXT_COLUMNS = ["제목"] + DETAIL_TEXT_COLUMNS
+FILTER_CATEGORY_COLUMNS = ["구분", "분야"]
+PREVIEW_SEARCH_DELAY_MS = 200
+LOG_POLL_INTERVAL_MS = 100
+LOG_MAX_LINES = 5000
+LOG_MAX_MESSAGES_PER_TICK = 20000
+PROGRESS_UNITS = ["past", "late", "integ"]
+OUTPUT_EXTENSIONS = {"pickle": ".pkl", "excel": ".xlsx", "parquet": ".parquet", "jsonl": ".jsonl", "sqlite": ".db"}
+EXPORT_FORMAT_OPTIONS = [
+    ("pickle", "Pickle (.pkl)"),
+    ("excel", "Excel (.xlsx)"),
+    ("parquet", "Parquet (.parquet)"),
+    ("jsonl", "JSONL (.jsonl)"),
+    ("sqlite", "SQLite 검색 DB (.db)"),
+    ("all", "전체 (pkl/xlsx/parquet/jsonl/db, 동시 저장)"),
+]
 
 
 @dataclass
@@ -73,13 +90,19 @@ def normalize_output_name(output_name: str) -> str:
     if not value:
         return ""
     path = Path(value)
-    if path.suffix.lower() in {".pkl", ".xlsx"}:
+    if path.suffix.lower() in set(OUTPUT_EXTENSIONS.values()):
         return path.stem
     return value
 
 
+def get_output_extensions(export_format: str) -> list[str]:
+    if export_format == "all":
+        return list(OUTPUT_EXTENSIONS.values())
+    return [OUTPUT_EXTENSIONS.get(export_format, ".pkl")]
+
+
 def get_output_extension(export_format: str) -> str:
-    return ".xlsx" if export_format == "excel" else ".pkl"
+    return get_output_extensions(export_format)[0]
 
 
 def build_common_params(config: RunConfig) -> dict:
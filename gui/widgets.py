@@ -1,10 +1,13 @@
 import calendar
 from datetime import date, datetime
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
+import numpy as np
 import tkinter as tk
 from tkinter import ttk
 
+from common.progress import ProgressEvent, format_progress
+
 
 class DatePicker(ttk.LabelFrame):
     def __init__(self, master: tk.Misc, title: str, initial_value: str):
@@ -127,3 +130,197 @@ class DatePicker(ttk.LabelFrame):
         self.selected_date = date.today()
         self.date_var.set(self.selected_date.strftime("%Y-%m-%d"))
         self._render_calendar()
+
+
+class VirtualTreeview(ttk.Frame):
+    """보이는 행 수만큼의 Treeview 항목을 재사용하여 값만 바꿔 끼우는 목록 (행은 데이터 위치로 식별)"""
+
+    DEFAULT_ROW_HEIGHT = 20
+    WHEEL_ROWS = 3
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        columns: Sequence[str],
+        row_values: Callable[[int], Sequence],
+        on_select: Optional[Callable[[int], None]] = None,
+    ):
+        super().__init__(master)
+        self.row_values = row_values
+        self.on_select = on_select
+        self.positions = np.arange(0)
+        self.first = 0
+        self.visible_rows = 1
+        self.selected_index: Optional[int] = None
+
+        self.tree = ttk.Treeview(self, columns=list(columns), show="headings", selectmode="browse")
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda _event: self._scroll_by(-self.WHEEL_ROWS))
+        self.tree.bind("<Button-5>", lambda _event: self._scroll_by(self.WHEEL_ROWS))
+        for key, step in (("<Up>", -1), ("<Down>", 1)):
+            self.tree.bind(key, lambda _event, step=step: self._move_selection(step))
+        self.tree.bind("<Prior>", lambda _event: self._move_selection(-self.visible_rows))
+        self.tree.bind("<Next>", lambda _event: self._move_selection(self.visible_rows))
+        self.tree.bind("<Home>", lambda _event: self._move_selection(-len(self.positions)))
+        self.tree.bind("<End>", lambda _event: self._move_selection(len(self.positions)))
+
+    @property
+    def selected_position(self) -> Optional[int]:
+        if self.selected_index is None:
+            return None
+        return int(self.positions[self.selected_index])
+
+    def set_positions(self, positions: Sequence[int]) -> None:
+        previous = self.selected_position
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.selected_index = None
+        if previous is not None:
+            matches = np.flatnonzero(self.positions == previous)
+            if len(matches):
+                self.selected_index = int(matches[0])
+        self.first = 0 if self.selected_index is None else max(0, self.selected_index - self.visible_rows // 2)
+        self._render()
+
+    def select_index(self, index: int) -> None:
+        if not len(self.positions):
+            return
+        index = max(0, min(index, len(self.positions) - 1))
+        self.selected_index = index
+        if index < self.first:
+            self.first = index
+        elif index >= self.first + self.visible_rows:
+            self.first = index - self.visible_rows + 1
+        self._render()
+        self.tree.focus_set()
+        if self.on_select is not None:
+            self.on_select(int(self.positions[index]))
+
+    def refresh(self) -> None:
+        self._render()
+
+    def _row_height(self) -> int:
+        value = ttk.Style(self).lookup("Treeview", "rowheight")
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return self.DEFAULT_ROW_HEIGHT
+
+    def _on_resize(self, event: tk.Event) -> None:
+        children = self.tree.get_children()
+        bbox = self.tree.bbox(children[0]) if children else None
+        header_height = bbox[1] if bbox else self.DEFAULT_ROW_HEIGHT + 4
+        visible_rows = max(1, (event.height - header_height) // self._row_height())
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self._render()
+
+    def _render(self) -> None:
+        total = len(self.positions)
+        self.first = max(0, min(self.first, total - self.visible_rows))
+        count = min(self.visible_rows, total - self.first)
+
+        children = self.tree.get_children()
+        if len(children) > count:
+            self.tree.delete(*children[count:])
+        for slot in range(len(children), count):
+            self.tree.insert("", tk.END, iid=f"row{slot}")
+        for slot in range(count):
+            self.tree.item(f"row{slot}", values=list(self.row_values(int(self.positions[self.first + slot]))))
+
+        # 선택 표시는 데이터 위치 기준 (선택 행이 화면 밖이면 표시 해제)
+        slot = None if self.selected_index is None else self.selected_index - self.first
+        if slot is not None and 0 <= slot < count:
+            self.tree.selection_set(f"row{slot}")
+            self.tree.focus(f"row{slot}")
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+        self.tree.yview_moveto(0)
+
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + count) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_by(self, rows: int) -> str:
+        self.first += rows
+        self._render()
+        return "break"
+
+    def _on_scrollbar(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self.first = int(float(value) * len(self.positions))
+            self._render()
+        elif action == "scroll":
+            self._scroll_by(int(value) * (self.visible_rows if unit == "pages" else 1))
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        # Windows는 120 단위, macOS는 작은 정수
+        steps = event.delta // 120 if abs(event.delta) >= 120 else (1 if event.delta > 0 else -1)
+        return self._scroll_by(-steps * self.WHEEL_ROWS)
+
+    def _move_selection(self, step: int) -> str:
+        if self.selected_index is None:
+            self.select_index(self.first)
+        else:
+            self.select_index(self.selected_index + step)
+        return "break"
+
+    def _on_tree_select(self, _event=None) -> None:
+        # <<TreeviewSelect>>는 나중에 전달되므로 현재 선택 상태로 판단 (_render가 바꾼 선택이면 무시됨)
+        selection = self.tree.selection()
+        if not selection:
+            return
+        index = self.first + int(selection[0][len("row"):])
+        if index != self.selected_index:
+            self.select_index(index)
+
+
+class ProgressPanel(ttk.LabelFrame):
+    """유닛별 진행 막대 + 완료 수/속도/남은 시간 표시 (ProgressEvent로 갱신)"""
+
+    def __init__(self, master: tk.Misc, units: Sequence[str], title: str = "진행 상황"):
+        super().__init__(master, text=title, padding=8)
+        self.rows: dict[str, tuple[ttk.Progressbar, tk.StringVar]] = {}
+        self.last_seq: dict[str, int] = {}
+        for row, unit in enumerate(units):
+            ttk.Label(self, text=unit, width=8).grid(row=row, column=0, sticky="w")
+            bar = ttk.Progressbar(self, mode="determinate", maximum=1)
+            bar.grid(row=row, column=1, sticky="ew", padx=(0, 8), pady=2)
+            status_var = tk.StringVar(value="대기")
+            ttk.Label(self, textvariable=status_var, width=56).grid(row=row, column=2, sticky="w")
+            self.rows[unit] = (bar, status_var)
+        self.columnconfigure(1, weight=1)
+
+    def reset(self) -> None:
+        self.last_seq.clear()
+        for bar, status_var in self.rows.values():
+            bar.stop()
+            bar.configure(mode="determinate", maximum=1, value=0)
+            status_var.set("대기")
+
+    def update_event(self, event: ProgressEvent) -> None:
+        row = self.rows.get(event.unit)
+        if row is None:
+            return
+        # 큐에서 늦게 도착한 이전 이벤트는 무시 (진행 막대가 뒤로 가지 않게)
+        if event.seq <= self.last_seq.get(event.unit, 0):
+            return
+        self.last_seq[event.unit] = event.seq
+        bar, status_var = row
+        if event.total:
+            bar.stop()
+            bar.configure(mode="determinate", maximum=event.total, value=min(event.done, event.total))
+        elif event.finished:
+            bar.stop()
+            bar.configure(mode="determinate", maximum=1, value=1)
+        elif str(bar.cget("mode")) != "indeterminate":
+            # 전체 수를 모르면 움직이는 막대로 표시
+            bar.configure(mode="indeterminate")
+            bar.start(20)
+        status_var.set(format_progress(event))
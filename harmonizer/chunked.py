@@ -0,0 +1,214 @@
+# Harmonizer 청크 단위 실행 (외부 병합 정렬, 전체 본문이 메모리에 올라가지 않음)
+#
+# 1) 소스별 입력 청크를 표준 컬럼으로 변환 → 회신일자 순으로 정렬 → 임시 파일(블록 단위 pickle)로 저장
+#    (청크마다 중복 판정 키/우선순위/일련번호 체계만 메모리에 남김: 행당 약 34바이트)
+# 2) 전체 키로 소스 간 중복 판정 (Harmonizer._find_duplicates, 메모리 실행과 같은 규칙)
+# 3) 정렬된 run들을 heapq k-way 병합 → (회신일자, 입력 순서) 순으로 chunk_size 행씩 출력
+#    회신일자 없는 행은 입력 순서대로 마지막 (메모리 실행의 안정 정렬과 같은 순서)
+#
+# 사용 예:
+#     harmonizer = Harmonizer(None, None, None)
+#     for chunk in harmonizer.run_chunked(past_chunks=iter_pickle_chunks(paths), chunk_size=50_000):
+#         ...
+import heapq
+import logging
+import os
+import tempfile
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from harmonizer.main import _to_datetime
+
+if TYPE_CHECKING:
+    from harmonizer.main import Harmonizer
+
+logger = logging.getLogger(__name__)
+
+# 기본 출력 청크 행 수
+DEFAULT_CHUNK_SIZE = 50_000
+
+# 임시 run 파일 블록 행 수 (병합 중 run마다 한 블록만 메모리에 올림 → 병합 메모리 ≈ run 수 × 블록)
+DEFAULT_BLOCK_SIZE = 500
+
+# 내부 작업 컬럼: 입력 순서, 정렬 키(회신일자 ns, 없으면 int64 최대값), 해석된 회신일자
+_SEQ = '_seq'
+_ORDER = '_order'
+_DATE = '_date'
+_NAT_ORDER = np.iinfo(np.int64).max
+
+
+def iter_pickle_chunks(paths: Iterable[str]) -> Iterator[pd.DataFrame]:
+    """pickle 파일(예: 샤드 결과 data/shards/*.pkl)을 파일 하나씩 읽는 청크 iterator"""
+    for path in paths:
+        yield pd.read_pickle(path)
+
+
+def iter_parquet_chunks(path: str, batch_size: int = DEFAULT_CHUNK_SIZE,
+                        columns: Optional[Sequence[str]] = None) -> Iterator[pd.DataFrame]:
+    """Parquet 파일/데이터셋 디렉터리를 batch_size 행씩 읽는 청크 iterator (pyarrow 필요)"""
+    try:
+        import pyarrow.dataset as ds
+    except ImportError as e:
+        raise ImportError("Parquet 청크 읽기에는 pyarrow가 필요합니다: pip install pyarrow") from e
+
+    dataset = ds.dataset(path, format='parquet')
+    for batch in dataset.to_batches(columns=list(columns) if columns else None, batch_size=batch_size):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+class _RunWriter:
+    """정렬된 청크를 블록 단위 임시 파일로 저장"""
+
+    def __init__(self, directory: str, block_size: int):
+        self.directory = directory
+        self.block_size = block_size
+        self.runs: List[List[str]] = []
+
+    def write(self, df: pd.DataFrame) -> None:
+        paths = []
+        run_number = len(self.runs)
+        for block_number, start in enumerate(range(0, len(df), self.block_size)):
+            path = os.path.join(self.directory, f"run{run_number:05d}_{block_number:05d}.pkl")
+            df.iloc[start:start + self.block_size].to_pickle(path)
+            paths.append(path)
+        self.runs.append(paths)
+
+
+def _iter_run(paths: List[str], dropped: np.ndarray, involved: Dict[int, Optional[tuple]],
+              involved_seqs: np.ndarray, report_columns: List[str]) -> Iterator[tuple]:
+    """run 하나의 행을 블록 단위로 읽어 순서대로 반환 (중복으로 제거된 행 제외)"""
+    for path in paths:
+        block = pd.read_pickle(path)
+        os.remove(path)
+        seqs = block[_SEQ].to_numpy()
+
+        # 충돌 보고서에 필요한 행(제거/유지)만 기록
+        if len(involved_seqs):
+            for position in np.flatnonzero(np.isin(seqs, involved_seqs)):
+                involved[int(seqs[position])] = tuple(block[report_columns].iloc[position])
+
+        keep = ~dropped[seqs]
+        if not keep.all():
+            block = block[keep]
+        yield from block.itertuples(index=False, name=None)
+
+
+def run_chunked(harmonizer: 'Harmonizer',
+                past_chunks: Optional[Iterable[pd.DataFrame]] = None,
+                late_chunks: Optional[Iterable[pd.DataFrame]] = None,
+                integ_chunks: Optional[Iterable[pd.DataFrame]] = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                block_size: int = DEFAULT_BLOCK_SIZE,
+                temp_dir: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """
+    청크 입력으로 Harmonizer.run() 실행 (회신일자 순 출력 청크 generator)
+
+    출력 청크를 이어 붙이면 같은 입력에 대한 Harmonizer.run() 결과와 같다.
+    중복 제거 보고서(harmonizer.collisions)는 마지막 청크를 반환한 뒤 채워진다.
+
+    Args:
+        harmonizer: 옵션(keep_source, dedup 등)을 가진 Harmonizer
+        past_chunks / late_chunks / integ_chunks: 소스별 원본 데이터프레임 청크 iterator
+        chunk_size: 출력 청크 행 수
+        block_size: 임시 run 파일 블록 행 수
+        temp_dir: 임시 파일 디렉터리 (기본값: 시스템 임시 디렉터리)
+
+    Yields:
+        pd.DataFrame: id가 이어지는 출력 청크
+    """
+    harmonizer.collisions = pd.DataFrame()
+    standard_columns = harmonizer._get_standard_columns()
+    processors = [
+        (past_chunks, harmonizer._process_past_df),
+        (late_chunks, harmonizer._process_late_df),
+        (integ_chunks, harmonizer._process_integ_df),
+    ]
+
+    with tempfile.TemporaryDirectory(prefix='harmonizer_', dir=temp_dir) as directory:
+        writer = _RunWriter(directory, block_size)
+        key_parts: List[Dict[str, np.ndarray]] = []
+        total_rows = 0
+
+        # 1) 청크별 변환/정렬 후 임시 파일로 저장
+        for chunks, process in processors:
+            for chunk in chunks or ():
+                df = process(chunk)
+                if df.empty:
+                    continue
+                df = df[standard_columns].reset_index(drop=True)
+                df[_SEQ] = np.arange(total_rows, total_rows + len(df), dtype=np.int64)
+                total_rows += len(df)
+
+                if harmonizer.dedup:
+                    key_parts.append(harmonizer._dedup_keys(df))
+
+                dates = _to_datetime(df['회신일자'])
+                df[_DATE] = dates
+                df[_ORDER] = np.where(dates.isna(), _NAT_ORDER, dates.to_numpy(dtype='datetime64[ns]').view(np.int64))
+                # 청크 안에서는 _seq가 증가 순이므로 안정 정렬이면 (회신일자, 입력 순서) 순
+                writer.write(df.sort_values(_ORDER, kind='stable', ignore_index=True))
+
+        logger.info(f"청크 실행: 입력 {total_rows}행, 임시 run {len(writer.runs)}개")
+
+        # 2) 소스 간 중복 판정
+        dropped = np.zeros(total_rows, dtype=bool)
+        kept_positions = np.empty(0, dtype=np.int64)
+        if harmonizer.dedup and total_rows:
+            dropped, kept_positions = harmonizer._find_duplicates(
+                {name: np.concatenate([part[name] for part in key_parts]) for name in key_parts[0]}
+            )
+            del key_parts
+        dropped_positions = np.flatnonzero(dropped)
+        report_columns = ['source', '일련번호', '제목', '회신일자']
+        involved_seqs = np.unique(np.concatenate([dropped_positions, kept_positions]))
+        involved: Dict[int, Optional[tuple]] = dict.fromkeys(involved_seqs.tolist())
+
+        # 3) k-way 병합 → 출력 청크
+        row_columns = standard_columns + [_SEQ, _DATE, _ORDER]
+        order_key = itemgetter(row_columns.index(_ORDER), row_columns.index(_SEQ))
+        merged = heapq.merge(
+            *(_iter_run(paths, dropped, involved, involved_seqs, report_columns) for paths in writer.runs),
+            key=order_key,
+        )
+
+        next_id = 1
+        rows: List[tuple] = []
+        for row in merged:
+            rows.append(row)
+            if len(rows) >= chunk_size:
+                yield _build_output_chunk(harmonizer, rows, row_columns, next_id)
+                next_id += len(rows)
+                rows = []
+        if rows:
+            yield _build_output_chunk(harmonizer, rows, row_columns, next_id)
+            next_id += len(rows)
+
+        # 충돌 보고서 (메모리 실행의 _deduplicate와 같은 형식)
+        if len(dropped_positions):
+            kept_rows = [involved[int(position)] for position in kept_positions]
+            dropped_rows = [involved[int(position)] for position in dropped_positions]
+            harmonizer.collisions = pd.DataFrame({
+                'kept_source': [row[0] for row in kept_rows],
+                'kept_일련번호': [row[1] for row in kept_rows],
+                'dropped_source': [row[0] for row in dropped_rows],
+                'dropped_일련번호': [row[1] for row in dropped_rows],
+                '제목': [row[2] for row in dropped_rows],
+                '회신일자': [row[3] for row in dropped_rows],
+            })
+            harmonizer._log_collisions(total_rows)
+
+        logger.info(f"청크 실행 완료: 최종 {next_id - 1}개 항목")
+
+
+def _build_output_chunk(harmonizer: 'Harmonizer', rows: List[tuple],
+                        row_columns: List[str], start_id: int) -> pd.DataFrame:
+    """병합된 행 목록 → 출력 형식 데이터프레임 (id는 start_id부터)"""
+    df = pd.DataFrame.from_records(rows, columns=row_columns)
+    df['회신일자'] = df[_DATE]
+    df.drop(columns=[_SEQ, _DATE, _ORDER], inplace=True)
+    df.insert(0, 'id', np.arange(start_id, start_id + len(df), dtype=np.int64))
+    return harmonizer._finish_output(df)
@@ -1,15 +1,62 @@
 # 법령해석/비조치의견서, 과거비조치의견, 현장점검의견 3개를 합쳐서 lq용 df로 변환하는 파일
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Sequence, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 중복 판정 필드 (정규화 후 해시)
+DEFAULT_DEDUP_FIELDS: Tuple[str, ...] = ('제목', '회신일자', '일련번호')
+
+# 소스별 일련번호 체계 (목록에 없는 소스는 소스마다 별도 체계)
+# 체계가 같은 소스끼리는 dedup_fields 전체로, 체계가 다른 소스끼리는 일련번호를 뺀 필드
+# (정규화한 제목 + 회신일자)로 중복 판정 (integ의 일련번호는 dataIdx라 late/past와 비교할 수 없음)
+SERIAL_NUMBER_SCHEMES: Dict[str, str] = {'late': 'fsc', 'past': 'fsc', 'integ': 'integ'}
+
+# 제목 정규화 시 제거할 문자 (영문/숫자/한글/한자 외 공백, 문장부호 등)
+# \W는 문자열 dtype 저장 방식(pyarrow 등)에 따라 ASCII만 단어 문자로 보므로 범위를 직접 지정
+_TITLE_NOISE_PATTERN = "[^0-9a-z\uac00-\ud7a3\u3131-\u318e\u4e00-\u9fff]+"
+
+# 중복 시 남길 소스 우선순위 (앞쪽이 우선)
+DEFAULT_SOURCE_PRECEDENCE: Tuple[str, ...] = ('late', 'integ', 'past')
+
+# run() 실행 엔진 ('polars'는 polars 별도 설치 필요, harmonizer/polars_backend.py)
+ENGINES: Tuple[str, ...] = ('pandas', 'polars')
+
+# 출력 dtype: 값 종류가 적은 컬럼은 category, 제목/본문 등 텍스트는 문자열 dtype
+# (회신일자는 datetime 유지, 결측은 NaT)
+CATEGORY_COLUMNS: Tuple[str, ...] = ('구분', '분야', '회신부서', 'source')
+TEXT_COLUMNS: Tuple[str, ...] = ('제목', '담당자', '일련번호', '질의요지', '회답', '이유')
+
+
+def _text_dtype() -> pd.StringDtype:
+    """텍스트 컬럼 dtype (pyarrow가 있으면 Arrow 문자열, 없으면 파이썬 문자열)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return pd.StringDtype('python')
+    return pd.StringDtype('pyarrow')
+
+
+TEXT_DTYPE = _text_dtype()
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """
+    날짜 문자열 변환 (소스마다 '2024-01-02', '2024.01.02' 등 형식이 섞여 있어 값별로 해석)
+    """
+    return pd.to_datetime(values, errors='coerce', format='mixed')
+
+
 class Harmonizer:
     """데이터프레임 조화 및 통합 클래스"""
 
-    def __init__(self, past_df: pd.DataFrame, late_df: pd.DataFrame, integ_df: pd.DataFrame, **kwargs):
+    def __init__(self, past_df: pd.DataFrame, late_df: pd.DataFrame, integ_df: pd.DataFrame,
+                 keep_source: bool = False, dedup: bool = False,
+                 dedup_fields: Sequence[str] = DEFAULT_DEDUP_FIELDS,
+                 source_precedence: Sequence[str] = DEFAULT_SOURCE_PRECEDENCE,
+                 engine: str = 'pandas', **kwargs):
         """
         Harmonizer 클래스 초기화
         
@@ -17,11 +64,29 @@ class Harmonizer:
             past_df: 과거회신사례 데이터프레임
             late_df: 법령해석/비조치의견서 데이터프레임
             integ_df: 현장점검의견 데이터프레임
+            keep_source: 결과에 source 컬럼(past/late/integ) 유지 여부 (증분 모드에 필요)
+            dedup: 소스 간 중복 문서 제거 여부 (기본값 False: 기존과 같이 모든 행 반환, 제거 결과는 self.collisions)
+            dedup_fields: 중복 판정 필드 (정규화한 제목/회신일자/일련번호, 일련번호 체계가 다른
+                소스 간에는 일련번호를 제외하고 판정 - SERIAL_NUMBER_SCHEMES)
+            source_precedence: 중복 시 남길 소스 우선순위 (앞쪽이 우선)
+            engine: run() 실행 엔진 ('pandas' 또는 'polars', 결과 형식은 같음)
             **kwargs: 추가 매개변수
         """
-        self.past_df = past_df.copy() if past_df is not None else pd.DataFrame()
-        self.late_df = late_df.copy() if late_df is not None else pd.DataFrame()
-        self.integ_df = integ_df.copy() if integ_df is not None else pd.DataFrame()
+        self.keep_source = keep_source
+        self.dedup = dedup
+        self.dedup_fields = tuple(dedup_fields)
+        self.source_precedence = tuple(source_precedence)
+        if engine not in ENGINES:
+            raise ValueError(f"지원하지 않는 engine입니다: {engine} (선택: {', '.join(ENGINES)})")
+        self.engine = engine
+        
+        # 마지막 실행에서 제거된 중복 문서 보고서
+        self.collisions = pd.DataFrame()
+        
+        # 입력 데이터프레임은 읽기만 하므로 복사하지 않음
+        self.past_df = past_df if past_df is not None else pd.DataFrame()
+        self.late_df = late_df if late_df is not None else pd.DataFrame()
+        self.integ_df = integ_df if integ_df is not None else pd.DataFrame()
         
         # 로깅 설정
         self._setup_logging()
@@ -48,6 +113,13 @@ class Harmonizer:
         Returns:
             pd.DataFrame: 통합된 DataFrame
         """
+        if self.engine == 'polars':
+            from harmonizer.polars_backend import run_polars
+            logger.info("polars 엔진으로 실행...")
+            final_df = run_polars(self)
+            logger.info(f"처리 완료: 최종 {len(final_df)}개 항목")
+            return final_df
+        
         # 각 데이터프레임 전처리
         logger.info("데이터프레임 전처리 시작...")
         
@@ -59,6 +131,9 @@ class Harmonizer:
         logger.info("데이터프레임 병합...")
         merged_df = self._merge_dataframes(past_processed, late_processed, integ_processed)
         
+        # 소스 간 중복 제거
+        merged_df = self._deduplicate(merged_df)
+        
         # ID 부여 및 최종 정리
         logger.info("최종 정리 및 ID 부여...")
         final_df = self._finalize_dataframe(merged_df)
@@ -66,21 +141,241 @@ class Harmonizer:
         logger.info(f"처리 완료: 최종 {len(final_df)}개 항목")
         return final_df
 
-    def _process_past_df(self) -> pd.DataFrame:
+    def run_chunked(self, past_chunks: Optional[Iterable[pd.DataFrame]] = None,
+                    late_chunks: Optional[Iterable[pd.DataFrame]] = None,
+                    integ_chunks: Optional[Iterable[pd.DataFrame]] = None,
+                    chunk_size: Optional[int] = None, block_size: Optional[int] = None,
+                    temp_dir: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        청크 단위 실행: 소스별 청크 iterator를 입력받아 회신일자 순 출력 청크를 차례로 반환
+        
+        정렬된 run을 임시 파일로 내보낸 뒤 k-way 병합하므로 전체 본문을 메모리에 올리지 않는다
+        (harmonizer/chunked.py, engine과 관계없이 pandas로 처리).
+        
+        Args:
+            past_chunks / late_chunks / integ_chunks: 소스별 원본 데이터프레임 청크 iterator
+                (예: chunked.iter_pickle_chunks(샤드 파일 목록), chunked.iter_parquet_chunks(경로))
+            chunk_size: 출력 청크 행 수 (기본값: chunked.DEFAULT_CHUNK_SIZE)
+            block_size: 임시 run 파일 블록 행 수 (기본값: chunked.DEFAULT_BLOCK_SIZE)
+            temp_dir: 임시 run 파일 디렉터리 (기본값: 시스템 임시 디렉터리)
+            
+        Yields:
+            pd.DataFrame: id가 이어지는 출력 청크 (이어 붙이면 run() 결과와 같음)
+        """
+        from harmonizer.chunked import DEFAULT_BLOCK_SIZE, DEFAULT_CHUNK_SIZE, run_chunked
+        
+        return run_chunked(self, past_chunks, late_chunks, integ_chunks,
+                           chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                           block_size=block_size or DEFAULT_BLOCK_SIZE, temp_dir=temp_dir)
+
+    def run_incremental(self, existing_df: Optional[pd.DataFrame]) -> pd.DataFrame:
+        """
+        증분 실행: 기존 통합 결과에 이번 입력(새 문서/변경 문서)만 반영 (engine과 관계없이 pandas로 처리)
+        
+        기존 행은 다시 처리하지 않으며, 문서 키(source + 일련번호, 일련번호가 없으면
+        source + 제목 + 회신일자)가 같은 행은 id를 유지한 채 해당 행만 제자리에서 갱신(upsert)하고,
+        새 문서는 기존 최대 id 다음 번호부터 회신일자 순으로 id를 부여해 끝에 추가한다.
+        dedup=True면 새 문서를 기존 문서와도 중복 판정해 우선순위가 낮은 쪽을 제거한다
+        (새 문서가 이기면 기존 문서의 id와 위치를 이어받음, 결과는 self.collisions).
+        
+        Args:
+            existing_df: 이전 통합 결과 (keep_source=True로 생성되어 source 컬럼이 있어야 함)
+            
+        Returns:
+            pd.DataFrame: 갱신된 통합 DataFrame (source 컬럼 포함)
+        """
+        # 증분 결과에는 source가 필요하므로 이 실행 동안만 keep_source 사용 (이후 run()에는 영향 없음)
+        keep_source = self.keep_source
+        self.keep_source = True
+        try:
+            return self._run_incremental(existing_df)
+        finally:
+            self.keep_source = keep_source
+    
+    def _run_incremental(self, existing_df: Optional[pd.DataFrame]) -> pd.DataFrame:
+        if existing_df is None or existing_df.empty:
+            logger.info("기존 결과가 없어 전체 실행으로 처리합니다.")
+            return self.run()
+        if 'source' not in existing_df.columns or 'id' not in existing_df.columns:
+            raise ValueError("증분 실행에는 id, source 컬럼이 있는 기존 결과가 필요합니다 (keep_source=True로 생성).")
+        
+        # 이번 입력만 표준 스키마로 변환 (id는 아래에서 다시 부여)
+        incoming = self._finalize_dataframe(self._deduplicate(self._merge_dataframes(
+            self._process_past_df(), self._process_late_df(), self._process_integ_df()
+        )))
+        if incoming.empty:
+            logger.info("증분 입력이 없습니다.")
+            return existing_df
+        
+        # 같은 문서가 이번 입력에 여러 번 있으면 마지막 값 사용
+        incoming_keys = self._document_keys(incoming)
+        latest = ~incoming_keys.duplicated(keep='last').to_numpy()
+        incoming = incoming[latest].reset_index(drop=True)
+        incoming_keys = incoming_keys[latest].reset_index(drop=True)
+        
+        # 기존 문서 키 → 행 위치 (키가 중복된 기존 행은 첫 행 기준)
+        existing_keys = self._document_keys(existing_df)
+        first_rows = ~existing_keys.duplicated(keep='first').to_numpy()
+        key_index = pd.Index(existing_keys[first_rows])
+        row_positions = np.flatnonzero(first_rows)
+        matched = key_index.get_indexer(incoming_keys)
+        is_update = matched >= 0
+        update_positions = row_positions[matched[is_update]]
+        update_rows = np.flatnonzero(is_update)
+        
+        # 새 문서 중 기존 문서와 중복인 문서 판정
+        new_rows = np.flatnonzero(~is_update)
+        replaced_positions = np.empty(0, dtype=np.int64)
+        if self.dedup and len(new_rows):
+            new_rows, takeover_positions, takeover_rows, replaced_positions = (
+                self._dedup_against_existing(existing_df, incoming, new_rows)
+            )
+            update_positions = np.concatenate([update_positions, takeover_positions])
+            update_rows = np.concatenate([update_rows, takeover_rows])
+        
+        # 기존 문서 갱신: 바뀐 행만 제자리에서 교체 (dtype은 작은 갱신분 쪽을 기존 컬럼에 맞춤)
+        result = existing_df.copy(deep=False)
+        value_columns = [c for c in incoming.columns if c != 'id' and c in result.columns]
+        if len(update_positions):
+            delta = self._align_dtypes(result, incoming.iloc[update_rows][value_columns])
+            for column in value_columns:
+                result.iloc[update_positions, result.columns.get_loc(column)] = delta[column].array
+        if len(replaced_positions):
+            result = result.drop(index=result.index[replaced_positions]).reset_index(drop=True)
+        
+        # 새 문서 추가 (기존 최대 id 다음 번호부터)
+        appended = incoming.iloc[new_rows].reset_index(drop=True)
+        # 숫자로 읽을 수 있는 기존 id가 없으면 run()과 같이 1부터
+        max_id = pd.to_numeric(existing_df['id'], errors='coerce').max()
+        start_id = (int(max_id) if pd.notna(max_id) else 0) + 1
+        appended['id'] = range(start_id, start_id + len(appended))
+        if not appended.empty:
+            appended = self._align_dtypes(result, appended[list(result.columns)])
+            result = pd.concat([result, appended], ignore_index=True)
+        
+        # 이전 버전 결과(object 컬럼)만 여기서 변환 (현재 형식이면 dtype이 같아 건너뜀)
+        result = self._apply_output_dtypes(result)
+        
+        logger.info(f"증분 처리 완료: 갱신 {len(update_positions)}개, 추가 {len(appended)}개, "
+                    f"중복 제거 {len(self.collisions)}개, 최종 {len(result)}개 항목")
+        return result
+
+    def _dedup_against_existing(self, existing_df: pd.DataFrame, incoming: pd.DataFrame,
+                                new_rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        증분 입력의 새 문서를 기존 문서와 중복 판정 (run()과 같은 규칙: _find_duplicates)
+        
+        기존 행은 판정 키만 계산하며, 판정 필드에 회신일자가 있으면 새 문서와 회신일자가 같거나
+        회신일자가 없는 기존 행만 대상으로 한다. 기존 행끼리의 판정은 반영하지 않는다.
+        
+        Args:
+            existing_df: 기존 통합 결과
+            incoming: 표준 스키마로 변환한 증분 입력
+            new_rows: 기존 문서 키와 일치하지 않은 incoming 행 위치
+            
+        Returns:
+            (추가할 incoming 행 위치, 새 문서가 이어받을 기존 행 위치, 이어받는 incoming 행 위치,
+             삭제할 기존 행 위치)
+        """
+        key_columns = ['source', '제목', '회신일자', '일련번호']
+        new_frame = incoming.iloc[new_rows]
+        candidates = np.ones(len(existing_df), dtype=bool)
+        if '회신일자' in self.dedup_fields:
+            existing_days = _to_datetime(existing_df['회신일자']).dt.normalize()
+            new_days = _to_datetime(new_frame['회신일자']).dt.normalize().dropna().unique()
+            candidates = (existing_days.isin(new_days) | existing_days.isna()).to_numpy()
+        existing_positions = np.flatnonzero(candidates)
+        
+        combined = pd.concat([
+            existing_df.iloc[existing_positions][key_columns].astype(object),
+            new_frame[key_columns].astype(object),
+        ], ignore_index=True)
+        dropped, kept = self._find_duplicates(self._dedup_keys(combined))
+        
+        # 결합 위치 → (기존 행 위치 또는 incoming 행 위치)
+        n_existing = len(existing_positions)
+        losers = np.flatnonzero(dropped)
+        is_new_loser = losers >= n_existing
+        is_new_winner = kept >= n_existing
+        # 기존 행끼리의 중복은 이번 증분과 관계없으므로 그대로 둠
+        relevant = is_new_loser | is_new_winner
+        losers, kept, is_new_loser, is_new_winner = (
+            losers[relevant], kept[relevant], is_new_loser[relevant], is_new_winner[relevant]
+        )
+        
+        # 충돌 보고서: 증분 입력 안의 중복(_deduplicate) 뒤에 이어서 기록
+        collisions = pd.DataFrame({
+            'kept_source': combined['source'].to_numpy()[kept],
+            'kept_일련번호': combined['일련번호'].to_numpy()[kept],
+            'dropped_source': combined['source'].to_numpy()[losers],
+            'dropped_일련번호': combined['일련번호'].to_numpy()[losers],
+            '제목': combined['제목'].to_numpy()[losers],
+            '회신일자': combined['회신일자'].to_numpy()[losers],
+        })
+        if len(collisions):
+            lost = collisions['dropped_source'].value_counts()
+            logger.warning(f"기존 문서와 중복: 새 문서 {int(is_new_loser.sum())}개 제거, "
+                           f"기존 문서 {int((~is_new_loser).sum())}개를 새 문서로 교체 (소스별 제거 행 수: "
+                           + ", ".join(f"{source} {count}행" for source, count in lost.items()) + ")")
+            self.collisions = (collisions if self.collisions.empty
+                               else pd.concat([self.collisions, collisions], ignore_index=True))
+        
+        # 기존 문서보다 우선순위가 높은 새 문서: 첫 번째로 이긴 기존 행의 id/위치를 이어받고 나머지는 삭제
+        replaced = pd.DataFrame({
+            'winner': new_rows[kept[~is_new_loser] - n_existing],
+            'position': existing_positions[losers[~is_new_loser]],
+        }).sort_values('position', kind='stable')
+        takeover = ~replaced['winner'].duplicated(keep='first').to_numpy()
+        
+        dropped_new = new_rows[losers[is_new_loser] - n_existing]
+        taken_over = replaced['winner'].to_numpy()[takeover]
+        remaining = new_rows[~np.isin(new_rows, np.concatenate([dropped_new, taken_over]))]
+        return (remaining, replaced['position'].to_numpy()[takeover], taken_over,
+                replaced['position'].to_numpy()[~takeover])
+
+    def _align_dtypes(self, target: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+        """
+        갱신분(delta) 컬럼 dtype을 target 컬럼 dtype에 맞춤 (category는 target에 새 값 범주를 추가)
+        
+        target 컬럼은 범주 추가만 하므로 기존 행 값은 다시 변환하지 않는다.
+        
+        Args:
+            target: 기존 통합 결과 (category 컬럼 범주가 제자리에서 늘어날 수 있음)
+            delta: target에 넣을 행
+            
+        Returns:
+            pd.DataFrame: target과 같은 dtype의 delta
+        """
+        aligned = {}
+        for column in delta.columns:
+            dtype = target[column].dtype
+            values = delta[column]
+            if isinstance(dtype, pd.CategoricalDtype):
+                new_categories = pd.Index(values.dropna().astype(object).unique()).difference(dtype.categories)
+                if len(new_categories):
+                    target[column] = target[column].cat.add_categories(new_categories)
+                    dtype = target[column].dtype
+            aligned[column] = values if values.dtype == dtype else values.astype(dtype)
+        return pd.DataFrame(aligned, index=delta.index)
+
+    def _process_past_df(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         past_df 전처리
         
+        Args:
+            df: 처리할 데이터프레임 (기본값: self.past_df, 청크 실행 시 청크 단위로 전달)
+        
         Returns:
             pd.DataFrame: 전처리된 past_df
         """
-        if self.past_df.empty:
+        df = self.past_df if df is None else df  # 읽기만 하므로 복사하지 않음
+        if df.empty:
             return pd.DataFrame(columns=self._get_standard_columns())
             
         logger.info("past_df 처리 중...")
-        df = self.past_df.copy()
         
-        # 컬럼 매핑
-        df_mapped = pd.DataFrame()
+        # 컬럼 매핑 (표준 컬럼명 → 값)
+        df_mapped = {}
         
         # 기본 컬럼 매핑
         df_mapped['구분'] = df['pastreqType']
@@ -92,49 +387,39 @@ class Harmonizer:
         df_mapped['일련번호'] = df['serialNum']
         
         # 복합 필드 생성
-        df_mapped['질의요지'] = df.apply(
-            lambda row: self._combine_fields([
-                row.get('inquiry', ''),
-                row.get('fact', ''),
-                row.get('baseLaw', '')
-            ]), axis=1
-        )
-        
-        df_mapped['회답'] = df.apply(
-            lambda row: self._combine_fields([
-                row.get('answer', '')
-            ]), axis=1
-        )
-        
-        df_mapped['이유'] = df.apply(
-            lambda row: self._combine_fields([
-                row.get('reason', '')
-            ]), axis=1
-        )
+        df_mapped['질의요지'] = self._combine_columns(df, ['inquiry', 'fact', 'baseLaw'])
+        df_mapped['회답'] = self._combine_columns(df, ['answer'])
+        df_mapped['이유'] = self._combine_columns(df, ['reason'])
         
         # 소스 표시
         df_mapped['source'] = 'past'
         
+        # 표준 컬럼 순서로 한 번에 생성 (입력 컬럼을 그대로 참조, 스칼라는 브로드캐스트)
+        df_mapped = self._build_standard_frame(df_mapped, df.index)
+        
         # 디버그 로깅
         logger.debug(f"past_df 처리 완료: {len(df_mapped)}행")
         
         return df_mapped
     
-    def _process_late_df(self) -> pd.DataFrame:
+    def _process_late_df(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         late_df 전처리
         
+        Args:
+            df: 처리할 데이터프레임 (기본값: self.late_df, 청크 실행 시 청크 단위로 전달)
+        
         Returns:
             pd.DataFrame: 전처리된 late_df
         """
-        if self.late_df.empty:
+        df = self.late_df if df is None else df  # 읽기만 하므로 복사하지 않음
+        if df.empty:
             return pd.DataFrame(columns=self._get_standard_columns())
             
         logger.info("late_df 처리 중...")
-        df = self.late_df.copy()
         
-        # 컬럼 매핑
-        df_mapped = pd.DataFrame()
+        # 컬럼 매핑 (표준 컬럼명 → 값)
+        df_mapped = {}
         
         # 기본 컬럼 매핑
         df_mapped['구분'] = df['gubun']
@@ -148,41 +433,38 @@ class Harmonizer:
         # 복합 필드 생성
         df_mapped['질의요지'] = df['inquiry']
         
-        df_mapped['회답'] = df.apply(
-            lambda row: self._combine_fields([
-                row.get('answer', '')
-            ]), axis=1
-        )
-        
-        df_mapped['이유'] = df.apply(
-            lambda row: self._combine_fields([
-                row.get('reason', '')
-            ]), axis=1
-        )
+        df_mapped['회답'] = self._combine_columns(df, ['answer'])
+        df_mapped['이유'] = self._combine_columns(df, ['reason'])
         
         # 소스 표시
         df_mapped['source'] = 'late'
         
+        # 표준 컬럼 순서로 한 번에 생성 (입력 컬럼을 그대로 참조, 스칼라는 브로드캐스트)
+        df_mapped = self._build_standard_frame(df_mapped, df.index)
+        
         # 디버그 로깅
         logger.debug(f"late_df 처리 완료: {len(df_mapped)}행")
         
         return df_mapped
 
-    def _process_integ_df(self) -> pd.DataFrame:
+    def _process_integ_df(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         integ_df 전처리
         
+        Args:
+            df: 처리할 데이터프레임 (기본값: self.integ_df, 청크 실행 시 청크 단위로 전달)
+        
         Returns:
             pd.DataFrame: 전처리된 integ_df
         """
-        if self.integ_df.empty:
+        df = self.integ_df if df is None else df  # 읽기만 하므로 복사하지 않음
+        if df.empty:
             return pd.DataFrame(columns=self._get_standard_columns())
             
         logger.info("integ_df 처리 중...")
-        df = self.integ_df.copy()
         
-        # 컬럼 매핑
-        df_mapped = pd.DataFrame()
+        # 컬럼 매핑 (표준 컬럼명 → 값)
+        df_mapped = {}
         
         # 기본 컬럼 매핑
         df_mapped['구분'] = df['pastreqType']
@@ -196,22 +478,15 @@ class Harmonizer:
         # 복합 필드 생성
         df_mapped['질의요지'] = df['inquiry']
         
-        df_mapped['회답'] = df.apply(
-            lambda row: self._combine_fields([
-                row.get('answer_conclusion', ''),
-                row.get('answer_content', '')
-            ]), axis=1
-        )
-        
-        df_mapped['이유'] = df.apply(
-            lambda row: self._combine_fields([
-                row.get('plan', '')
-            ]), axis=1
-        )
+        df_mapped['회답'] = self._combine_columns(df, ['answer_conclusion', 'answer_content'])
+        df_mapped['이유'] = self._combine_columns(df, ['plan'])
         
         # 소스 표시
         df_mapped['source'] = 'integ'
         
+        # 표준 컬럼 순서로 한 번에 생성 (입력 컬럼을 그대로 참조, 스칼라는 브로드캐스트)
+        df_mapped = self._build_standard_frame(df_mapped, df.index)
+        
         # 디버그 로깅
         logger.debug(f"integ_df 처리 완료: {len(df_mapped)}행")
         
@@ -233,18 +508,212 @@ class Harmonizer:
         standard_columns = self._get_standard_columns()
         
         # 각 DataFrame에 공통 컬럼이 있는지 확인하고 조정
+        frames = []
         for df, name in [(past_df, 'past'), (late_df, 'late'), (integ_df, 'integ')]:
             for col in standard_columns:
                 if col not in df.columns:
                     logger.warning(f"{name} 데이터프레임에 '{col}' 컬럼이 없습니다. 빈 값으로 추가합니다.")
                     df[col] = np.nan
+            # 빈 데이터프레임은 병합 시 dtype 추론에만 영향을 주므로 제외
+            if not df.empty:
+                frames.append(df[standard_columns])
+        
+        if not frames:
+            return pd.DataFrame(columns=standard_columns)
         
-        # 모든 DataFrame 병합
-        merged_df = pd.concat([past_df, late_df, integ_df], ignore_index=True)
+        # 모든 DataFrame 병합 (병합은 이 한 번만 수행)
+        merged_df = pd.concat(frames, ignore_index=True)
         logger.info(f"병합된 데이터프레임: {len(merged_df)}행")
         
         return merged_df
 
+    def _dedup_keys(self, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        중복 판정 해시 키 계산
+        
+        제목은 NFKC 정규화 + 소문자 + 공백/문장부호 제거, 회신일자는 YYYY-MM-DD,
+        일련번호는 공백 제거 + 소문자로 맞춘 뒤 필드 조합을 64bit 해시로 변환한다.
+        
+        Args:
+            df: 병합된 DataFrame (source 컬럼 포함)
+            
+        Returns:
+            행별 배열 dict (청크 실행 시 청크별 결과를 이어 붙여 _find_duplicates에 전달)
+            - key / eligible: dedup_fields 해시 키와 판정 대상 여부
+              (제목이 없거나 제목 외 값이 모두 비면 판정하지 않음)
+            - loose_key / loose_eligible: 일련번호를 뺀 해시 키와 판정 대상 여부
+              (일련번호 체계가 다른 소스 간 비교용, 제목과 나머지 값이 모두 있어야 판정)
+            - rank: 소스 우선순위, scheme: 일련번호 체계
+        """
+        normalized = {}
+        for field in self.dedup_fields:
+            values = df[field] if field in df.columns else pd.Series('', index=df.index)
+            if field == '회신일자':
+                values = _to_datetime(values).dt.strftime('%Y-%m-%d').fillna('')
+            else:
+                values = values.fillna('').astype(str).str.normalize('NFKC').str.lower()
+                pattern = _TITLE_NOISE_PATTERN if field == '제목' else r'\s+'
+                values = values.str.replace(pattern, '', regex=True)
+            normalized[field] = values
+        
+        key_frame = pd.DataFrame(normalized, index=df.index)
+        return self._dedup_arrays(
+            lambda columns: pd.util.hash_pandas_object(key_frame[columns], index=False).to_numpy(),
+            lambda column: (key_frame[column] != '').to_numpy(),
+            df['source'], len(df),
+        )
+
+    def _dedup_arrays(self, hash_columns, non_empty, sources: pd.Series, length: int) -> Dict[str, np.ndarray]:
+        """
+        정규화한 판정 필드 → _dedup_keys 결과 dict (pandas/polars 엔진 공통)
+        
+        Args:
+            hash_columns: 판정 필드 목록 → 행별 해시 배열
+            non_empty: 판정 필드 → 행별 값 존재 여부 배열
+            sources: 행별 source
+            length: 행 수
+        """
+        fields = list(self.dedup_fields)
+        has_title = non_empty('제목') if '제목' in fields else np.ones(length, dtype=bool)
+        others = [non_empty(field) for field in fields if field != '제목']
+        has_other = np.logical_or.reduce(others) if others else np.ones(length, dtype=bool)
+        arrays = {
+            'key': hash_columns(fields),
+            'eligible': has_title & has_other,
+            'rank': self._source_ranks(sources),
+            'scheme': sources.astype(object).map(SERIAL_NUMBER_SCHEMES).fillna(sources.astype(object)).to_numpy(dtype=object),
+        }
+        
+        # 일련번호 체계가 다른 소스 간 비교 키 (일련번호 외 판정 필드가 제목뿐이면 비교하지 않음)
+        loose_fields = [field for field in fields if field != '일련번호']
+        loose_others = [non_empty(field) for field in loose_fields if field != '제목']
+        if '일련번호' in fields and '제목' in loose_fields and loose_others:
+            arrays['loose_key'] = hash_columns(loose_fields)
+            arrays['loose_eligible'] = has_title & np.logical_and.reduce(loose_others)
+        return arrays
+
+    def _deduplicate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        해시 인덱스 기반 중복 문서 제거
+        
+        같은 키의 문서가 여러 개면 source_precedence 순위가 높은 소스의 문서를 남기고
+        (같은 소스끼리는 먼저 나온 문서), 제거된 문서는 self.collisions에 기록한다.
+        
+        Args:
+            df: 병합된 DataFrame (source 컬럼 포함)
+            
+        Returns:
+            pd.DataFrame: 중복이 제거된 DataFrame
+        """
+        self.collisions = pd.DataFrame()
+        if not self.dedup or df.empty:
+            return df
+        
+        dropped, kept_positions = self._find_duplicates(self._dedup_keys(df))
+        if not dropped.any():
+            return df
+        
+        # 충돌 보고서: 제거된 문서와 남긴 문서
+        dropped_positions = np.flatnonzero(dropped)
+        self.collisions = pd.DataFrame({
+            'kept_source': df['source'].to_numpy()[kept_positions],
+            'kept_일련번호': df['일련번호'].to_numpy()[kept_positions],
+            'dropped_source': df['source'].to_numpy()[dropped_positions],
+            'dropped_일련번호': df['일련번호'].to_numpy()[dropped_positions],
+            '제목': df['제목'].to_numpy()[dropped_positions],
+            '회신일자': df['회신일자'].to_numpy()[dropped_positions],
+        })
+        
+        self._log_collisions(len(df))
+        
+        return df[~dropped].reset_index(drop=True)
+
+    def _source_ranks(self, sources: pd.Series) -> np.ndarray:
+        """source_precedence 순위 (목록에 없는 소스는 가장 낮은 순위)"""
+        precedence = {source: rank for rank, source in enumerate(self.source_precedence)}
+        return sources.map(precedence).fillna(len(precedence)).to_numpy(dtype=np.int64)
+
+    def _find_duplicates(self, keys: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        중복 행 판정
+        
+        1) key가 같은 행: 우선순위 → 원래 순서로 정렬했을 때 키별 첫 행을 남김
+        2) loose_key가 같고 일련번호 체계가 다른 행: _mark_cross_scheme_duplicates
+        
+        Args:
+            keys: _dedup_keys 결과 (행별 배열 dict)
+            
+        Returns:
+            (제거할 행 여부 배열, 제거할 각 행 대신 남긴 행 위치 배열)
+        """
+        ranks = keys['rank']
+        winners = np.full(len(ranks), -1, dtype=np.int64)
+        
+        order = np.lexsort((np.arange(len(ranks)), ranks))
+        ordered_keys = keys['key'][order]
+        first_in_order = ~pd.Series(ordered_keys).duplicated(keep='first').to_numpy()
+        duplicated = ~first_in_order & keys['eligible'][order]
+        if duplicated.any():
+            winner_of_key = pd.Series(order[first_in_order], index=ordered_keys[first_in_order])
+            winners[order[duplicated]] = winner_of_key.loc[ordered_keys[duplicated]].to_numpy()
+        
+        if 'loose_key' in keys:
+            self._mark_cross_scheme_duplicates(keys, winners)
+        
+        dropped = winners >= 0
+        return dropped, winners[dropped]
+
+    def _mark_cross_scheme_duplicates(self, keys: Dict[str, np.ndarray], winners: np.ndarray):
+        """
+        일련번호 체계가 다른 소스 간 중복 판정 (winners를 제자리에서 갱신)
+        
+        loose_key(제목 + 회신일자)가 같은 남은 행들을 우선순위 → 원래 순서로 보면서,
+        앞서 남긴 행 중 일련번호 체계가 다른 행이 있으면 그 행의 중복으로 제거한다
+        (같은 체계에서 일련번호만 다른 행은 별개 문서로 유지).
+        
+        Args:
+            keys: _dedup_keys 결과 (loose_key 포함)
+            winners: 행별로 대신 남긴 행 위치 (-1은 남긴 행)
+        """
+        candidates = np.flatnonzero((winners < 0) & keys['loose_eligible'])
+        loose_keys = keys['loose_key'][candidates]
+        # 일련번호 체계가 두 개 이상 섞인 키만 확인 (대부분 행은 여기서 제외)
+        mixed = pd.Series(keys['scheme'][candidates]).groupby(loose_keys).transform('nunique').to_numpy() > 1
+        candidates = candidates[mixed]
+        if not len(candidates):
+            return
+        candidates = candidates[np.lexsort((candidates, keys['rank'][candidates], keys['loose_key'][candidates]))]
+        
+        current_key, kept = None, []
+        for position, loose_key, scheme in zip(candidates.tolist(), keys['loose_key'][candidates].tolist(),
+                                               keys['scheme'][candidates].tolist()):
+            if loose_key != current_key:
+                current_key, kept = loose_key, []
+            winner = next((kept_position for kept_position, kept_scheme in kept if kept_scheme != scheme), None)
+            if winner is None:
+                kept.append((position, scheme))
+            else:
+                winners[position] = winner
+        
+        # 1)에서 남긴 행이 여기서 제거된 경우 최종적으로 남긴 행을 가리키도록 연결
+        dropped = np.flatnonzero(winners >= 0)
+        targets = winners[dropped]
+        winners[dropped] = np.where(winners[targets] >= 0, winners[targets], targets)
+
+    def _log_collisions(self, total_rows: int):
+        """
+        충돌 보고서(self.collisions) 요약 로깅
+        
+        Args:
+            total_rows: 중복 제거 전 행 수
+        """
+        summary = self.collisions.groupby(['kept_source', 'dropped_source']).size()
+        for (kept, removed), count in summary.items():
+            logger.warning(f"중복 문서 {count}개 제거: {removed} → {kept} 유지")
+        lost = self.collisions['dropped_source'].value_counts()
+        logger.warning("소스별 중복 제거 행 수: " + ", ".join(f"{source} {count}행" for source, count in lost.items()))
+        logger.info(f"중복 제거: {total_rows}행 → {total_rows - len(self.collisions)}행")
+
     def _finalize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         최종 데이터프레임 정리
@@ -257,48 +726,123 @@ class Harmonizer:
         """
         # 회신일자 형식 표준화
         if '회신일자' in df.columns:
-            df['회신일자'] = pd.to_datetime(df['회신일자'], errors='coerce')
-            
-            # 회신일자 있는/없는 데이터 분리
-            df_with_date = df[df['회신일자'].notna()].copy()
-            df_no_date = df[df['회신일자'].isna()].copy()
+            df['회신일자'] = _to_datetime(df['회신일자'])
             
-            # 회신일자 있는 데이터만 정렬
-            df_with_date = df_with_date.sort_values(by='회신일자')
-            
-            # 다시 합치기 (회신일자 없는 데이터는 마지막에)
-            df = pd.concat([df_with_date, df_no_date]).reset_index(drop=True)
+            # 회신일자 기준 안정 정렬 한 번 (회신일자 없는 데이터는 원래 순서대로 마지막에)
+            df = df.sort_values(by='회신일자', kind='stable', na_position='last', ignore_index=True)
         
         # ID 부여
         df.insert(0, 'id', range(1, len(df) + 1))
         
+        return self._finish_output(df)
+
+    def _finish_output(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        출력 마무리 (pandas/polars 엔진 공통)
+        
+        Args:
+            df: 정렬 및 ID 부여가 끝난 DataFrame
+            
+        Returns:
+            pd.DataFrame: source 컬럼 정리 및 결측 처리된 DataFrame
+        """
         # source 컬럼 제거 (필요 없는 경우)
-        if 'source' in df.columns:
-            df = df.drop('source', axis=1)
+        if 'source' in df.columns and not self.keep_source:
+            del df['source']
+        
+        return self._apply_output_dtypes(df)
+
+    def _apply_output_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        출력 컬럼 dtype 지정 (pickle 크기/로드 시간 및 GUI 필터링용)
         
-        # NA 값 빈 문자열로 변경
-        df = df.fillna('')
+        - CATEGORY_COLUMNS: category (결측은 빈 문자열)
+        - TEXT_COLUMNS: 문자열 dtype (결측은 빈 문자열)
+        - 회신일자: datetime 유지 (결측은 NaT)
         
+        Args:
+            df: 표준 컬럼 DataFrame
+            
+        Returns:
+            pd.DataFrame: dtype이 지정된 DataFrame (컬럼 단위로 제자리에서 교체)
+        """
+        for column in CATEGORY_COLUMNS:
+            if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype(TEXT_DTYPE).fillna('').astype('category')
+        for column in TEXT_COLUMNS:
+            if column in df.columns and df[column].dtype != TEXT_DTYPE:
+                df[column] = df[column].astype(TEXT_DTYPE).fillna('')
+        if '회신일자' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['회신일자']):
+            df['회신일자'] = _to_datetime(df['회신일자'].replace('', None))
         return df
 
-    def _combine_fields(self, fields: List[str]) -> str:
+    def _document_keys(self, df: pd.DataFrame) -> pd.Series:
+        """
+        문서 고유 키 (증분 실행 시 id 유지 기준)
+        
+        source + 일련번호, 일련번호가 없으면 source + 제목 + 회신일자
+        
+        Args:
+            df: source 컬럼이 있는 통합 DataFrame
+            
+        Returns:
+            pd.Series: 문서 키 문자열 (df와 같은 인덱스)
+        """
+        source = df['source'].fillna('').astype(str)
+        serial = df['일련번호'].fillna('').astype(str).str.strip()
+        title = df['제목'].fillna('').astype(str).str.strip()
+        reply_date = _to_datetime(df['회신일자']).dt.strftime('%Y-%m-%d').fillna('')
+        
+        by_serial = source + '|' + serial
+        by_title = source + '|#' + title + '|' + reply_date
+        return by_serial.where(serial != '', by_title)
+
+    def _build_standard_frame(self, columns: Dict[str, object], index: pd.Index) -> pd.DataFrame:
         """
-        여러 필드를 하나로 결합
+        표준 컬럼 순서의 DataFrame 생성 (Series는 복사하지 않고 참조)
         
         Args:
-            fields: 결합할 필드 값 목록
+            columns: 표준 컬럼명 → Series 또는 스칼라 값
+            index: 원본 DataFrame 인덱스
             
         Returns:
-            str: 결합된 텍스트
+            pd.DataFrame: 표준 컬럼 DataFrame
+        """
+        return pd.DataFrame(columns, index=index, columns=self._get_standard_columns(), copy=False)
+
+    def _combine_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.Series:
         """
-        # None 필터링 및 빈 문자열 처리
-        valid_fields = [str(f).strip() for f in fields if f is not None and str(f).strip()]
+        여러 컬럼을 행별로 결합 (컬럼 단위 벡터 연산)
         
-        if not valid_fields:
-            return ""
+        값은 strip 후 빈 문자열/결측(None, NaN)을 제외하고 "\n\n"으로 이어 붙인다.
+        없는 컬럼은 빈 값으로 취급한다.
         
-        # 구분자로 결합
-        return "\n\n".join(valid_fields)
+        Args:
+            df: 원본 DataFrame
+            columns: 결합할 컬럼 목록 (순서대로)
+            
+        Returns:
+            pd.Series: 결합된 텍스트 (df와 같은 인덱스)
+        """
+        combined = None
+        for column in columns:
+            if column not in df.columns:
+                continue
+            part = df[column].fillna('')
+            # 문자열이 아닌 값(숫자 등)이 섞인 경우에만 변환 (astype(str)은 전체 복사 비용이 큼)
+            if pd.api.types.infer_dtype(part, skipna=False) != 'string':
+                part = part.astype(str)
+            part = part.str.strip()
+            if combined is None:
+                combined = part
+                continue
+            # 양쪽 모두 값이 있을 때만 구분자 추가
+            separator = np.where((combined != '') & (part != ''), '\n\n', '')
+            combined = combined + separator + part
+        
+        if combined is None:
+            return pd.Series('', index=df.index, dtype=object)
+        return combined
 
     def _get_standard_columns(self) -> List[str]:
         """표준 컬럼 목록 반환"""
@@ -318,7 +862,8 @@ if __name__ == "__main__":
     result_df = Harmonizer(
         past_df=past_df, 
         late_df=late_df, 
-        integ_df=integ_df
+        integ_df=integ_df,
+        dedup=True
     ).run()
 
     import pandasgui as pg
@@ -0,0 +1,244 @@
+# Harmonizer.run()의 Polars 실행 백엔드 (Harmonizer(engine='polars')로 사용, polars 별도 설치 필요)
+#
+# 입력/출력 계약은 pandas 경로와 같다.
+# - 입력: past/late/integ pandas DataFrame
+# - 출력: id + 표준 컬럼 pandas DataFrame (회신일자 기준 안정 정렬, 출력 dtype은 Harmonizer._apply_output_dtypes 공통)
+# 컬럼 매핑/필드 결합/병합/날짜 해석/중복 제거/정렬을 LazyFrame 하나의 계획으로 만들고
+# 마지막에 한 번 collect 한 뒤 pandas로 변환한다.
+# (중복 판정만 정규화한 판정 필드를 먼저 collect 해서 pandas 엔진과 같은 Harmonizer._find_duplicates로 처리)
+# 차이: 일련번호는 소스 간 타입을 맞추기 위해 문자열로 통일된다 (integ의 dataIdx 숫자 → 문자열).
+import logging
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import polars as pl
+except ImportError as e:
+    raise ImportError("engine='polars'에는 polars가 필요합니다: pip install polars") from e
+
+from harmonizer.main import Harmonizer, _TITLE_NOISE_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# 소스별 표준 컬럼 매핑
+# 문자열: 원본 컬럼 그대로, 리스트: 원본 컬럼들을 strip 후 "\n\n"으로 결합, None: 해당 정보 없음
+SOURCE_MAPPINGS: Dict[str, Dict[str, Union[str, List[str], None]]] = {
+    'past': {
+        '구분': 'pastreqType',
+        '분야': None,
+        '제목': 'pastreqSubject',
+        '회신부서': None,
+        '담당자': None,
+        '회신일자': 'regDate',
+        '일련번호': 'serialNum',
+        '질의요지': ['inquiry', 'fact', 'baseLaw'],
+        '회답': ['answer'],
+        '이유': ['reason'],
+    },
+    'late': {
+        '구분': 'gubun',
+        '분야': 'category',
+        '제목': 'list_title',
+        '회신부서': 'registrant',
+        '담당자': None,
+        '회신일자': 'reply_date',
+        '일련번호': 'number',
+        '질의요지': 'inquiry',
+        '회답': ['answer'],
+        '이유': ['reason'],
+    },
+    'integ': {
+        '구분': 'pastreqType',
+        '분야': 'category',
+        '제목': 'list_title',
+        '회신부서': None,
+        '담당자': None,
+        '회신일자': 'reply_date',
+        '일련번호': 'dataIdx',
+        '질의요지': 'inquiry',
+        '회답': ['answer_conclusion', 'answer_content'],
+        '이유': ['plan'],
+    },
+}
+
+# 회신일자 해석 형식 ('.', '/' 구분자는 '-'로 바꾼 뒤 앞에서부터 시도)
+_DATE_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d', '%Y%m%d')
+
+# 내부 작업 컬럼
+_POS = '_pos'
+_DATE = '_date'
+
+
+def _to_polars(df: pd.DataFrame, columns: List[str]) -> pl.DataFrame:
+    """필요한 컬럼만 polars로 변환 (숫자/문자열이 섞인 object 컬럼은 문자열로)"""
+    series = []
+    for column in columns:
+        values = df[column]
+        try:
+            series.append(pl.from_pandas(values.rename(column)))
+        except Exception:
+            texts = [None if pd.isna(v) else str(v) for v in values]
+            series.append(pl.Series(column, texts, dtype=pl.Utf8))
+    return pl.DataFrame(series)
+
+
+def _text(column: str) -> pl.Expr:
+    return pl.col(column).cast(pl.Utf8)
+
+
+def _combine(columns: List[str], available: List[str]) -> pl.Expr:
+    """Harmonizer._combine_columns와 같은 규칙 (strip 후 빈 값 제외, "\n\n"으로 결합)"""
+    parts = [
+        _text(c).str.strip_chars().replace('', None)
+        for c in columns if c in available
+    ]
+    if not parts:
+        return pl.lit('')
+    return pl.concat_str(parts, separator='\n\n', ignore_nulls=True).fill_null('')
+
+
+def _map_source(source: str, df: pd.DataFrame) -> pl.LazyFrame:
+    """소스 데이터프레임 → 표준 컬럼 LazyFrame"""
+    mapping = SOURCE_MAPPINGS[source]
+    needed = []
+    for spec in mapping.values():
+        if isinstance(spec, str):
+            if spec not in df.columns:
+                raise KeyError(spec)
+            needed.append(spec)
+        elif spec:
+            needed.extend(c for c in spec if c in df.columns)
+    needed = list(dict.fromkeys(needed))
+
+    expressions = []
+    for target, spec in mapping.items():
+        if spec is None:
+            expr = pl.lit(None, dtype=pl.Utf8)
+        elif isinstance(spec, str):
+            expr = _text(spec)
+        else:
+            expr = _combine(spec, needed)
+        expressions.append(expr.alias(target))
+    expressions.append(pl.lit(source).alias('source'))
+
+    logger.info(f"{source}_df 처리 중... (polars)")
+    return _to_polars(df, needed).lazy().select(expressions)
+
+
+def _parse_dates(expr: pl.Expr) -> pl.Expr:
+    """여러 형식이 섞인 날짜 문자열 → datetime (해석 불가는 null)"""
+    text = expr.str.strip_chars().str.replace_all(r'[./]', '-').str.strip_chars_end('-')
+    return pl.coalesce([text.str.to_datetime(fmt, strict=False, time_unit='us') for fmt in _DATE_FORMATS])
+
+
+def _dedup_key_columns(harmonizer: Harmonizer, schema_columns: List[str]) -> List[pl.Expr]:
+    """Harmonizer._dedup_keys와 같은 정규화 (판정 필드별 정규화 값, 컬럼명은 필드명)"""
+    keys = []
+    for field in harmonizer.dedup_fields:
+        if field == '회신일자':
+            values = pl.col(_DATE).dt.strftime('%Y-%m-%d').fill_null('')
+        elif field in schema_columns:
+            values = _text(field).fill_null('').str.normalize('NFKC').str.to_lowercase()
+            pattern = _TITLE_NOISE_PATTERN if field == '제목' else r'\s+'
+            values = values.str.replace_all(pattern, '')
+        else:
+            values = pl.lit('')
+        keys.append(values.alias(f'_key_{field}'))
+    return keys
+
+
+def _mark_duplicates(harmonizer: Harmonizer, lf: pl.LazyFrame, columns: List[str]) -> pl.LazyFrame:
+    """
+    중복 행 표시 (_dropped) 및 대신 남길 행 위치 (_winner)
+
+    정규화한 판정 필드만 먼저 collect 해서 해시로 비교하고, 판정 규칙은
+    pandas 엔진과 같은 Harmonizer._find_duplicates를 사용한다.
+    """
+    keys = lf.select([pl.col(_POS), pl.col('source')] + _dedup_key_columns(harmonizer, columns)).collect()
+    arrays = harmonizer._dedup_arrays(
+        lambda fields: keys.select(pl.struct([f'_key_{field}' for field in fields]).hash()).to_series().to_numpy(),
+        lambda field: (keys[f'_key_{field}'] != '').to_numpy(),
+        keys['source'].to_pandas(), keys.height,
+    )
+    dropped, kept_positions = harmonizer._find_duplicates(arrays)
+
+    winners = np.full(keys.height, -1, dtype=np.int64)
+    winners[dropped] = kept_positions
+    marks = pl.DataFrame({
+        _POS: keys[_POS],
+        '_dropped': dropped,
+        '_winner': pl.Series(winners).cast(keys[_POS].dtype, strict=False),
+    })
+    return lf.join(marks.lazy(), on=_POS, how='left')
+
+
+def run_polars(harmonizer: Harmonizer) -> pd.DataFrame:
+    """
+    Polars LazyFrame으로 Harmonizer.run() 실행
+
+    Args:
+        harmonizer: 입력 데이터프레임과 옵션(keep_source, dedup 등)을 가진 Harmonizer
+
+    Returns:
+        pd.DataFrame: Harmonizer.run()과 같은 형식의 통합 DataFrame
+    """
+    harmonizer.collisions = pd.DataFrame()
+    standard_columns = harmonizer._get_standard_columns()
+
+    frames = [
+        _map_source(source, df)
+        for source, df in [('past', harmonizer.past_df), ('late', harmonizer.late_df), ('integ', harmonizer.integ_df)]
+        if not df.empty
+    ]
+    if not frames:
+        return harmonizer._finalize_dataframe(pd.DataFrame(columns=standard_columns))
+
+    # 병합 + 회신일자 해석 (원래 값은 충돌 보고서용으로 유지)
+    lf = (
+        pl.concat(frames, how='vertical')
+        .with_row_index(_POS)
+        .with_columns(_parse_dates(pl.col('회신일자')).alias(_DATE))
+    )
+
+    collisions_lf: Optional[pl.LazyFrame] = None
+    if harmonizer.dedup:
+        marked = _mark_duplicates(harmonizer, lf, standard_columns)
+        winners = marked.select(
+            pl.col(_POS).alias('_winner'),
+            pl.col('source').alias('kept_source'),
+            pl.col('일련번호').alias('kept_일련번호'),
+        )
+        collisions_lf = (
+            marked.filter('_dropped')
+            .join(winners, on='_winner', how='left')
+            .sort(_POS)
+            .select(
+                'kept_source', 'kept_일련번호',
+                pl.col('source').alias('dropped_source'),
+                pl.col('일련번호').alias('dropped_일련번호'),
+                '제목', '회신일자',
+            )
+        )
+        lf = marked.filter(~pl.col('_dropped'))
+
+    # 회신일자 기준 안정 정렬 (회신일자 없는 데이터는 원래 순서대로 마지막에) + ID 부여
+    result_lf = (
+        lf.sort([_DATE, _POS], nulls_last=True)
+        .with_columns(pl.col(_DATE).alias('회신일자'))
+        .select(standard_columns)
+        .with_row_index('id', offset=1)
+        .with_columns(pl.col('id').cast(pl.Int64))
+    )
+
+    if collisions_lf is not None:
+        result, collisions = pl.collect_all([result_lf, collisions_lf])
+        if collisions.height:
+            harmonizer.collisions = collisions.to_pandas()
+            harmonizer._log_collisions(result.height + collisions.height)
+    else:
+        result = result_lf.collect()
+
+    logger.info(f"polars 처리 결과: {result.height}행")
+    return harmonizer._finish_output(result.to_pandas())
@@ -11,6 +11,9 @@ LIST_URL = f"{BASE_URL}/fsc_new/replyCase/selectReplyCaseTotalReplyList.do"
 # 상세 페이지 URL
 DETAIL_URL = f"{BASE_URL}/fsc_new/ExmntTaskDetail.do"
 
+# HTTP 요청 타임아웃 (연결, 응답 읽기 초) - 중지 요청 시 진행 중인 요청도 이 시간 안에 끝남
+REQUEST_TIMEOUT = (10, 30)
+
 # HTTP 헤더
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
@@ -139,3 +142,9 @@ ADDITIONAL_PARAMS = {
 # 일자 형식
 DATE_FORMAT = "%Y-%m-%d"
 
+
+# 샤드 분할/병합 키
+SHARD_KEY_FIELDS = ("dataIdx",)
+
+# 상세 크롤링 우선순위 필드 (값 내림차순으로 처리하여 최신 문서를 먼저 수집)
+PRIORITY_KEY_FIELD = "replyRegDate"
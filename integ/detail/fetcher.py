@@ -2,8 +2,9 @@
 import requests
 from typing import Optional
 
-from integ.config import DETAIL_URL, DETAIL_HEADERS, ST_NO, MU_NO, ACT_CD, CHECKPLACE_SET_IDX
+from integ.config import DETAIL_URL, DETAIL_HEADERS, ST_NO, MU_NO, ACT_CD, CHECKPLACE_SET_IDX, REQUEST_TIMEOUT
 from common.ssl_adapter import get_legacy_session
+from common.metrics import get_registry
 
 class DetailFetcher:
     """상세 페이지 HTML 가져오기"""
@@ -11,6 +12,7 @@ class DetailFetcher:
     def __init__(self):
         self.headers = DETAIL_HEADERS.copy()
         self.session = get_legacy_session()
+        self._request_seconds = get_registry().histogram("integ.detail.request_seconds")
         
     def get_html(self, checkplaceNo: int) -> str:
         """상세 페이지 HTML 요청"""
@@ -21,7 +23,8 @@ class DetailFetcher:
             "checkplaceSetIdx": CHECKPLACE_SET_IDX,
             "actCd": ACT_CD
         }
-        response = self.session.post(DETAIL_URL, headers=self.headers, data=data)
+        with self._request_seconds.time():
+            response = self.session.post(DETAIL_URL, headers=self.headers, data=data, timeout=REQUEST_TIMEOUT)
         return response.text
     
 if __name__ == "__main__":
@@ -2,20 +2,44 @@
 from bs4 import BeautifulSoup
 import re
 from typing import Optional
-from dataclasses import dataclass
 
 from integ.models import DetailItem
+from common.metrics import RunMetrics
 from common.utils import html_to_text_preserve_p_br, clean_text
 
-@dataclass
 class ParsingStats:
-    """파싱 통계"""
-    regex_found_count: int = 0
-    total_processed: int = 0
-    failed_items: list = None
+    """파싱 통계 (전역 metrics 레지스트리에 누적, 값은 start() 이후 이번 실행분, 여러 worker 스레드에서 갱신해도 안전)"""
     
-    def __post_init__(self):
-        self.failed_items = []
+    def __init__(self, prefix: str = "integ.detail"):
+        self.metrics = metrics = RunMetrics(prefix)
+        self.regex_found = metrics.counter("regex_found")
+        self.processed = metrics.counter("processed")
+        self.failures = metrics.failures("failed")
+    
+    def start(self) -> None:
+        """실행 시작 (이후 값만 집계)"""
+        self.metrics.start()
+    
+    def finish(self) -> None:
+        """실행 종료 (값 고정)"""
+        self.metrics.finish()
+    
+    @property
+    def regex_found_count(self) -> int:
+        return self.metrics.count(self.regex_found)
+    
+    @property
+    def total_processed(self) -> int:
+        return self.metrics.count(self.processed)
+    
+    @property
+    def failure_count(self) -> int:
+        return self.metrics.count(self.failures)
+    
+    @property
+    def failed_items(self) -> list:
+        """실패 항목 목록 (idx, 오류)"""
+        return self.metrics.failure_items(self.failures)
 
 class DetailParser:
     """상세 페이지 파싱"""
@@ -25,7 +49,7 @@ class DetailParser:
     
     def parse(self, html_content: str, dataIdx: int) -> DetailItem:
         """HTML 파싱하여 DetailItem 반환"""
-        self.stats.total_processed += 1
+        self.stats.processed.inc()
         
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
@@ -60,7 +84,7 @@ class DetailParser:
             )
             
         except Exception as e:
-            self.stats.failed_items.append((dataIdx, str(e)))
+            self.stats.failures.record(dataIdx, str(e))
             return None
     
     # def _get_td_text(self, soup: BeautifulSoup, th_text: str) -> Optional[str]:
@@ -95,7 +119,7 @@ class DetailParser:
         for pattern in patterns:
             match = re.search(pattern, html_content, re.DOTALL | re.IGNORECASE)
             if match:
-                self.stats.regex_found_count += 1
+                self.stats.regex_found.inc()
                 return html_to_text_preserve_p_br(match.group(1))
         
         return None
\ No newline at end of file
@@ -10,27 +10,35 @@ from datetime import datetime
 
 from integ.config import (
     LIST_URL, DEFAULT_HEADERS, DEFAULT_BATCH_SIZE, 
-    DEFAULT_LIST_PARAMS, GUBUN_MAPPING, DEFAULT_DELAY
+    DEFAULT_LIST_PARAMS, GUBUN_MAPPING, DEFAULT_DELAY, REQUEST_TIMEOUT
 )
 from integ.models import ListItem
 from common.utils import random_sleep
 from common.ssl_adapter import get_legacy_session
+from common.metrics import get_registry
+from common.cancellation import CancellationToken
+from common.records import records_to_dataframe
 
 logger = logging.getLogger(__name__)
 
 class ListCrawler:
     """금융위원회 통합회신사례 목록 크롤러"""
 
-    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, max_items: Optional[int] = None):
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, max_items: Optional[int] = None,
+                 cancel_token: Optional[CancellationToken] = None):
         """
         Args:
             batch_size: 한 번에 요청할 항목 수
             max_items: 최대 크롤링할 항목 수
+            cancel_token: 취소 토큰 (취소 시 다음 페이지를 요청하지 않고 부분 결과 반환)
         """
         self.batch_size = batch_size
         self.max_items = max_items
+        self.cancel_token = cancel_token or CancellationToken()
         self.headers = DEFAULT_HEADERS.copy()
         self.session = get_legacy_session()
+        self.cancel_token.register(self.session.close)
+        self._request_seconds = get_registry().histogram("integ.list.request_seconds")
         self.session.headers.update(self.headers)
 
     def get_list_dataframe(self, start_date: str, end_date: Optional[str] = None) -> pd.DataFrame:
@@ -51,12 +59,8 @@ class ListCrawler:
             logger.warning("조회 결과가 없습니다.")
             return pd.DataFrame()
             
-        # ListItem 객체를 DataFrame으로 직접 변환 (to_dict 메서드 활용)
-        items_dict = [item.to_dict() for item in items]
-            
-        # DataFrame 생성
-        df = pd.DataFrame(items_dict)
-        return df
+        # ListItem 객체를 컬럼 버퍼에 바로 누적하여 DataFrame 생성
+        return records_to_dataframe(items, ListItem)
 
     def get_list_items(
         self,
@@ -98,12 +102,18 @@ class ListCrawler:
         
         # 데이터 페이징 처리
         while True:
+            # 취소 요청 확인
+            if self.cancel_token.cancelled:
+                logger.info(f"목록 크롤링 중지: {len(collected_items)}개 항목까지 수집")
+                break
+                
             # 시작 인덱스 업데이트
             params["start"] = str(start_idx)
             
             try:
                 logger.info(f"목록 요청: start={start_idx}, length={self.batch_size}")
-                response = self.session.post(LIST_URL, data=params)
+                with self._request_seconds.time():
+                    response = self.session.post(LIST_URL, data=params, timeout=REQUEST_TIMEOUT)
                 response.raise_for_status()
                 
                 # JSON 응답 파싱
@@ -149,7 +159,7 @@ class ListCrawler:
                     break
                 
                 # 추가 요청 전 딜레이
-                random_sleep(DEFAULT_DELAY)
+                random_sleep(DEFAULT_DELAY, cancel_token=self.cancel_token)
                 
             except Exception as e:
                 logger.error(f"목록 요청 실패: {str(e)}")
@@ -5,8 +5,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Union
 
-@dataclass
-class ListItem:
+from common.records import Record
+
+@dataclass(slots=True)
+class ListItem(Record):
     """목록 페이지 항목 모델 - API 응답에 맞춤"""
     rownumber: int
     dataIdx: int
@@ -35,8 +37,8 @@ class ListItem:
             "replyRegDate": self.replyRegDate
         }
 
-@dataclass
-class DetailItem:
+@dataclass(slots=True)
+class DetailItem(Record):
     """상세 페이지 항목 모델 - 모든 유형 공통"""
     
     dataIdx: int
@@ -62,8 +64,8 @@ class DetailItem:
         # None 값은 제외
         return {k: v for k, v in result.items() if v is not None}
 
-@dataclass
-class CombinedItem:
+@dataclass(slots=True)
+class CombinedItem(Record):
     """ListItem과 DetailItem을 결합한 모델"""
     # 목록 항목 필드 (ListItem)
     rownumber: int
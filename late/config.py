@@ -18,10 +18,19 @@ LIST_URL = f"{BASE_URL}/selectReplyCasePastReplyList.do"
 LAWREQ_DETAIL_URL = f"{BASE_URL}/LawreqDetail.do"
 OPINION_DETAIL_URL = f"{BASE_URL}/OpinionDetail.do"
 
+# HTTP 요청 타임아웃 (연결, 응답 읽기 초) - 중지 요청 시 진행 중인 요청도 이 시간 안에 끝남
+REQUEST_TIMEOUT = (10, 30)
+
 # 공통 파라미터
 ST_NO = "11"
 MU_NO = "171"
 ACT_CD = "R"
 
 # 결과 저장 파일명
-OUTPUT_EXCEL = "fsc_crawling_result.xlsx"
\ No newline at end of file
+OUTPUT_EXCEL = "fsc_crawling_result.xlsx"
+
+# 샤드 분할/병합 키 (법령해석/비조치의견서는 idx 체계가 달라 gubun 포함)
+SHARD_KEY_FIELDS = ("gubun", "idx")
+
+# 상세 크롤링 우선순위 필드 (값 내림차순으로 처리하여 최신 문서를 먼저 수집)
+PRIORITY_KEY_FIELD = "regDate"
@@ -9,26 +9,39 @@ import time
 import re
 from bs4 import BeautifulSoup
 
+from late.config import REQUEST_TIMEOUT
 from late.models import DetailItem
 from common.utils import random_sleep, html_to_text_preserve_p_br
 from common.ssl_adapter import get_legacy_session
+from common.metrics import get_registry
+from common.cancellation import CancellationToken
+
+# 상세 페이지 요청 헤더 (인스턴스마다 복사해서 사용)
+DETAIL_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
 
 class BaseFetcher(ABC):
     """HTML 페이지 요청 기본 클래스"""
     
-    def __init__(self, delay_seconds: float = 0.5, session: Optional[requests.Session] = None):
+    def __init__(self, delay_seconds: float = 0.5, session: Optional[requests.Session] = None,
+                 cancel_token: Optional[CancellationToken] = None):
         """
         Args:
             delay_seconds: 요청 간 지연 시간 (초)
+            cancel_token: 취소 토큰 (취소 시 요청 간 대기를 즉시 중단)
         """
         self.delay_seconds = delay_seconds
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        self.cancel_token = cancel_token
+        self.headers = DETAIL_HEADERS.copy()
         if session:
             self.session = session
         else:
             self.session = get_legacy_session()
+        
+        metrics = get_registry()
+        self._request_seconds = metrics.histogram("late.detail.request_seconds")
+        self._request_errors = metrics.counter("late.detail.request_errors")
     
     def fetch(self, idx: int) -> Optional[str]:
         """
@@ -44,14 +57,16 @@ class BaseFetcher(ABC):
             url = self._get_url()
             params = self._get_request_params(idx)
             
-            response = self.session.post(url, headers=self.headers, data=params) #던진다!
+            with self._request_seconds.time():
+                response = self.session.post(url, headers=self.headers, data=params, timeout=REQUEST_TIMEOUT) #던진다!
             response.raise_for_status()
             
             # 너무 빠른 연속 요청 방지
-            random_sleep(self.delay_seconds)
+            random_sleep(self.delay_seconds, cancel_token=self.cancel_token)
             
             return response.text
         except Exception:
+            self._request_errors.inc()
             return None
             
     @abstractmethod
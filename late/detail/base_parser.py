@@ -9,12 +9,18 @@ from bs4 import BeautifulSoup
 
 from common.utils import html_to_text_preserve_p_br
 
+# 특수 마크업(data-hwpjson) 제거용 정규식
+_HWPJSON_RE = re.compile(r'data-hwpjson="[^"]*"')
+
 class BaseParser(ABC):
     """
     HTML 파싱 기본 클래스 - 순수 기능 중심
     각 하위 클래스는 해당 문서 유형에 특화된 파싱 로직을 구현해야 함
     """
     
+    # 필드명별 정규식 캐시 (모든 인스턴스/스레드가 공유, 필드명당 1회만 컴파일)
+    _field_regex_cache: Dict[str, "re.Pattern"] = {}
+    
     @abstractmethod
     def parse(self, html_content: str, idx: int, gubun: str) -> Any:
         """
@@ -35,7 +41,7 @@ class BaseParser(ABC):
         # 특수 마크업 제거
         cleaned_html = html_content
         if 'data-hwpjson' in html_content:
-            cleaned_html = re.sub(r'data-hwpjson="[^"]*"', '', html_content)
+            cleaned_html = _HWPJSON_RE.sub('', html_content)
         
         # 여러 파서 시도
         for parser in ["html.parser", "lxml", "html5lib"]:
@@ -87,11 +93,14 @@ class BaseParser(ABC):
     
     def _extract_field_by_regex(self, html_content: str, field_name: str) -> Optional[str]:
         """정규식으로 필드 값 추출 시도 - 유틸리티 메서드"""
-        pattern = re.search(
-            f'<th[^>]*>{field_name}</th>\\s*<td[^>]*>(.*?)</td>', 
-            html_content, 
-            re.DOTALL | re.IGNORECASE
-        )
+        regex = self._field_regex_cache.get(field_name)
+        if regex is None:
+            regex = re.compile(
+                f'<th[^>]*>{field_name}</th>\\s*<td[^>]*>(.*?)</td>',
+                re.DOTALL | re.IGNORECASE
+            )
+            self._field_regex_cache[field_name] = regex
+        pattern = regex.search(html_content)
         if pattern:
             field_html = pattern.group(1)
             return html_to_text_preserve_p_br(f"<td>{field_html}</td>")
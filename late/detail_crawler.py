@@ -3,8 +3,10 @@
 """
 
 import pandas as pd
-from typing import List, Optional
+from dataclasses import asdict
+from typing import Callable, List, Optional, Tuple, Union
 import concurrent.futures
+import threading
 from tqdm import tqdm
 
 from late.models import ListItem, DetailItem, CombinedItem
@@ -16,23 +18,60 @@ from late.detail.opinion.fetcher import OpinionFetcher
 from late.detail.opinion.parser import OpinionParser
 from late.detail.combiner import DetailCombiner
 from common.ssl_adapter import get_legacy_session
+from common.metrics import RunMetrics
+from common.cancellation import CancellationToken, CrawlCancelled, iter_completed
+from common.sharding import shard_key
+from common.work_queue import WorkQueue, run_workers
+from common.columnar import ColumnarBuilder
+from common.scheduling import DEFAULT_FIRST_RESULTS_COUNT, FirstResultsNotifier, prioritize
+from common.sinks import JsonlSink
+from common.progress import ProgressListener, ProgressReporter
+from late.config import PRIORITY_KEY_FIELD, SHARD_KEY_FIELDS
 
 class DetailCrawler:
     """금융위원회 회신사례 상세 내용 크롤러 (래퍼 클래스)"""
     
-    def __init__(self, delay_seconds: float = 0.5, max_workers: int = 64):
+    def __init__(self, delay_seconds: float = 0.5, max_workers: int = 64,
+                 cancel_token: Optional[CancellationToken] = None,
+                 work_queue: Optional[WorkQueue] = None,
+                 priority_key: Optional[str] = PRIORITY_KEY_FIELD,
+                 first_results_callback: Optional[Callable[[pd.DataFrame], None]] = None,
+                 first_results_count: int = DEFAULT_FIRST_RESULTS_COUNT,
+                 sink: Optional[JsonlSink] = None,
+                 keep_results: bool = True,
+                 progress_listener: Optional[ProgressListener] = None):
         """
         Args:
             delay_seconds: 요청 간 지연 시간 (초)
             max_workers: 병렬 처리 시 최대 worker 수
+            cancel_token: 취소 토큰 (취소 시 남은 항목을 버리고 부분 결과 반환)
+            work_queue: 작업 큐 (None이면 프로세스 내 스레드풀로 직접 처리)
+            priority_key: 상세 작업 우선순위 필드 (값 내림차순 = 최신 문서 우선, None이면 목록 순서)
+            first_results_callback: 처음 first_results_count개 결과가 모이면 한 번 호출 (중간 미리보기용)
+            first_results_count: first results 콜백을 호출할 수집 건수
+            sink: 완료된 항목을 바로 기록할 JSONL sink (None이면 기록하지 않음)
+            keep_results: False면 결과를 메모리에 모으지 않음 (sink 기록만, 빈 데이터프레임 반환)
+            progress_listener: 진행 상황 이벤트(ProgressEvent) 콜백 (지정 시 tqdm 출력 대신 이벤트만 전달)
         """
         self.delay_seconds = delay_seconds
         self.max_workers = max_workers
+        self.cancel_token = cancel_token or CancellationToken()
+        self.work_queue = work_queue
+        self.priority_key = priority_key
+        self.first_results_callback = first_results_callback
+        self.first_results_count = first_results_count
+        self.sink = sink
+        self.keep_results = keep_results
+        self.progress_listener = progress_listener
         self.combiner = DetailCombiner()
         
-        # 통계 변수
-        self.total_processed = 0
-        self.failed_items = []
+        # 통계 지표 (전역 metrics 레지스트리의 late.detail.*, 실행별 값은 시작 시점과의 차이)
+        self.metrics = metrics = RunMetrics("late.detail")
+        self._processed = metrics.counter("processed")
+        self._failures = metrics.failures("failed")
+        self._parse_seconds = metrics.histogram("parse_seconds")
+        self._in_flight = metrics.gauge("in_flight")
+        self._pending = metrics.gauge("pending")
         
         # 문서 유형별 처리기 매핑
         self.fetcher_map = {
@@ -47,6 +86,52 @@ class DetailCrawler:
 
         # 세션 재사용을 위한 SSL Adapter 설정 (max_workers 만큼 풀 크기 지정)
         self.session = get_legacy_session(pool_maxsize=max_workers)
+        # 취소 시 세션을 닫아 대기 중인 연결을 정리
+        self.cancel_token.register(self.session.close)
+        
+        # worker 스레드별 fetcher/parser 캐시 (항목마다 새로 만들지 않고 스레드당 1회 생성)
+        self._local = threading.local()
+        
+    def _get_handlers(self, gubun: str) -> Optional[Tuple[BaseFetcher, BaseParser]]:
+        """
+        현재 스레드 전용 fetcher/parser 인스턴스 반환 (최초 요청 시에만 생성)
+        
+        Args:
+            gubun: 문서 유형 ('법령해석' 또는 '비조치의견서' 등)
+            
+        Returns:
+            (fetcher, parser) 튜플, 지원하지 않는 유형이면 None
+        """
+        handlers = getattr(self._local, "handlers", None)
+        if handlers is None:
+            handlers = self._local.handlers = {}
+        
+        pair = handlers.get(gubun)
+        if pair is None:
+            fetcher_class = self.fetcher_map.get(gubun)
+            parser_class = self.parser_map.get(gubun)
+            if not fetcher_class or not parser_class:
+                return None
+            # 세션을 공유하여 인스턴스 생성
+            fetcher = fetcher_class(delay_seconds=self.delay_seconds, session=self.session, cancel_token=self.cancel_token)
+            pair = (fetcher, parser_class())
+            handlers[gubun] = pair
+        return pair
+    
+    @property
+    def total_processed(self) -> int:
+        """이번 실행에서 처리 시도한 항목 수"""
+        return self.metrics.count(self._processed)
+    
+    @property
+    def failure_count(self) -> int:
+        """이번 실행의 실패 항목 수"""
+        return self.metrics.count(self._failures)
+    
+    @property
+    def failed_items(self) -> List[tuple]:
+        """이번 실행의 실패 항목 목록 (idx, gubun, 오류)"""
+        return self.metrics.failure_items(self._failures)
         
     def get_detail_item(self, idx: int, gubun: str) -> Optional[DetailItem]:
         """
@@ -59,39 +144,147 @@ class DetailCrawler:
         Returns:
             DetailItem 객체, 오류 발생 시 None
         """
-        self.total_processed += 1
+        self._processed.inc()
+        with self._in_flight.track():
+            return self._fetch_detail_item(idx, gubun)
+    
+    def _fetch_detail_item(self, idx: int, gubun: str) -> Optional[DetailItem]:
         try:
-            # 적절한 Fetcher와 Parser 선택
-            fetcher_class:BaseFetcher = self.fetcher_map.get(gubun)
-            parser_class:BaseParser = self.parser_map.get(gubun)
-            
-            if not fetcher_class or not parser_class:
-                self.failed_items.append((idx, gubun, f"지원하지 않는 문서 유형: {gubun}"))
+            # 적절한 Fetcher와 Parser 선택 (스레드별로 재사용)
+            handlers = self._get_handlers(gubun)
+            if handlers is None:
+                self._failures.record(idx, gubun, f"지원하지 않는 문서 유형: {gubun}")
                 return None
-                
-            # 세션을 공유하여 인스턴스 생성
-            fetcher:LawFetcher|OpinionFetcher = fetcher_class(delay_seconds=self.delay_seconds, session=self.session)
-            parser:LawParser|OpinionParser = parser_class()
+            fetcher, parser = handlers
                 
             # HTML 가져오기 : 페쳐 사용
             html_content = fetcher.fetch(idx)
             if not html_content:
-                self.failed_items.append((idx, gubun, "HTML 요청 실패"))
+                # 취소로 세션이 닫힌 경우는 실패로 집계하지 않음
+                if not self.cancel_token.cancelled:
+                    self._failures.record(idx, gubun, "HTML 요청 실패")
                 return None
                 
             # HTML 파싱 : 파서 사용용
-            detail_item = parser.parse(html_content, idx, gubun)
+            with self._parse_seconds.time():
+                detail_item = parser.parse(html_content, idx, gubun)
             return detail_item
         except Exception as e:
             # 실패 항목 기록
-            self.failed_items.append((idx, gubun, str(e)))
+            self._failures.record(idx, gubun, str(e))
             return None
     
     def _process_item(self, list_item: ListItem) -> CombinedItem:
         """단일 항목 처리를 위한 helper 함수 (병렬 처리용)"""
+        self.cancel_token.raise_if_cancelled()
         detail_item = self.get_detail_item(list_item.idx, list_item.gubun)
+        # 처리 도중 취소되었다면 결과를 버림
+        self.cancel_token.raise_if_cancelled()
         return self.combiner.combine(list_item, detail_item)
-            
+
+    def _first_results_notifier(self) -> FirstResultsNotifier:
+        """first results 콜백이 없으면 결과를 모으지 않는 notifier"""
+        callback = self._notify_first_results if self.first_results_callback is not None else None
+        return FirstResultsNotifier(callback, self.first_results_count)
+
+    def _notify_first_results(self, items: List[Union[CombinedItem, dict]]) -> None:
+        """처음 수집된 항목들을 데이터프레임으로 first results 콜백에 전달 (작업 큐 결과는 dict)"""
+        combined_items = ColumnarBuilder.for_record(CombinedItem)
+        for item in items:
+            if isinstance(item, dict):
+                combined_items.append_mapping(item)
+            else:
+                combined_items.append(item)
+        self.first_results_callback(combined_items.to_dataframe())
+    
+    def run_queue_worker(self, work_queue: Optional[WorkQueue] = None) -> int:
+        """
+        작업 큐에서 항목을 가져와 처리 (큐가 빌 때까지)
+        다른 프로세스/노드에서 같은 큐를 공유하는 worker로 실행할 때 사용
+        
+        Returns:
+            이 worker가 완료한 항목 수
+        """
+        work_queue = work_queue or self.work_queue
+        self.metrics.start()
+        unfinished = work_queue.unfinished_count()
+        self._pending.set(unfinished)
+        progress = ProgressReporter("late", "detail", unfinished, self.progress_listener)
+        first_results = self._first_results_notifier()
+
+        def handler(payload: dict) -> dict:
+            try:
+                result = self._process_job(payload)
+            except Exception:
+                # 실패한 작업은 재시도 대상으로 남으므로 완료 수는 그대로 두고 오류 수만 갱신
+                progress.update(0, errors=self.failure_count)
+                raise
+            self._pending.dec()
+            progress.update(errors=self.failure_count)
+            first_results.add(result)
+            return result
+
+        with progress:
+            done = run_workers(work_queue, handler, self.max_workers, self.cancel_token)
+        # 다른 worker가 처리한 작업도 반영
+        self._pending.set(work_queue.unfinished_count())
+        self.metrics.finish()
+        if not self.cancel_token.cancelled:
+            first_results.flush()
+        return done
+    
+    def _process_job(self, payload: dict) -> dict:
+        """큐 작업 처리: 상세 수집 실패 시 예외를 던져 재시도 대상으로 남김"""
+        list_item = ListItem(**payload)
+        detail_item = self.get_detail_item(list_item.idx, list_item.gubun)
+        if detail_item is None:
+            raise RuntimeError(f"상세 내용 수집 실패: {list_item.gubun} {list_item.idx}")
+        result = asdict(self.combiner.combine(list_item, detail_item))
+        # 큐 완료 처리 전에 기록하므로 재시도 시 같은 항목이 한 번 더 기록될 수 있음
+        if self.sink is not None:
+            self.sink.write(result)
+        return result
+    
+    def _get_combined_dataframe_from_queue(self, list_items: List[ListItem]) -> pd.DataFrame:
+        """작업 큐에 항목을 등록하고 처리한 뒤 결과 수집"""
+        added = self.work_queue.put(
+            (shard_key(item, SHARD_KEY_FIELDS), asdict(item))
+            for item in prioritize(list_items, self.priority_key)
+        )
+        print(f"작업 큐 등록: {added}개 항목 (기존 작업 {len(list_items) - added}개는 이어서 처리)")
+        self.run_queue_worker()
+        if not self.keep_results:
+            # 완료 결과는 sink에만 기록, 큐에 저장된 결과를 메모리로 다시 읽지 않음
+            self._print_queue_status(len(self.work_queue.failed()))
+            return ColumnarBuilder.for_record(CombinedItem).to_dataframe()
+        return self.collect_queue_dataframe()
+    
+    def collect_queue_dataframe(self) -> pd.DataFrame:
+        """작업 큐의 완료 결과 + 최종 실패 항목(상세 없음)을 데이터프레임으로 반환"""
+        results = ColumnarBuilder.for_record(CombinedItem)
+        for row in self.work_queue.results():
+            results.append_mapping(row)
+        failed = self.work_queue.failed()
+        for payload, _ in failed:
+            results.append(self.combiner.combine(ListItem(**payload), None))
+        self._print_queue_status(len(failed))
+        return results.to_dataframe()
+    
+    def _print_queue_status(self, failed_count: int) -> None:
+        """작업 큐의 최종 실패 / 미완료 항목 수 출력"""
+        unfinished = self.work_queue.unfinished_count()
+        if failed_count:
+            print(f"경고: {failed_count}개 항목이 최대 재시도 후에도 실패했습니다.")
+        if unfinished:
+            print(f"참고: {unfinished}개 항목은 아직 다른 worker가 처리 중입니다.")
+
+    def get_list_only_dataframe(self, list_items: List[ListItem]) -> pd.DataFrame:
+        """상세 수집 없이 목록 정보만 결합한 데이터프레임 (목록 단계에서 취소된 경우의 부분 결과)"""
+        combined_items = ColumnarBuilder.for_record(CombinedItem)
+        for item in list_items:
+            combined_items.append(self.combiner.combine(item, None))
+        return combined_items.to_dataframe()
+
     def get_combined_dataframe(self, list_items: List[ListItem]) -> pd.DataFrame:
         """
         목록 아이템과 상세 내용을 결합한 데이터프레임 반환
@@ -103,38 +296,75 @@ class DetailCrawler:
             결합된 아이템의 DataFrame
         """
         total_items = len(list_items)
-        combined_items = []
+        # 완료된 항목을 컬럼별 버퍼에 바로 누적
+        combined_items = ColumnarBuilder.for_record(CombinedItem)
+        collected = 0
         
-        # 통계 변수 초기화
-        self.total_processed = 0
-        self.failed_items = []
+        # 실행 통계 기준점 (전역 지표는 초기화하지 않음)
+        self.metrics.start()
         
         print(f"상세 내용 크롤링 시작: 총 {total_items}개 항목")
         
+        # 작업 큐 사용 시 (다중 프로세스/노드 분산 처리)
+        if self.work_queue is not None:
+            return self._get_combined_dataframe_from_queue(list_items)
+        
         # 병렬 처리 구현
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # 최신 문서부터 제출 (스레드풀은 제출 순서대로 처리)
+        list_items = prioritize(list_items, self.priority_key)
+        first_results = self._first_results_notifier()
+        
+        self._pending.set(total_items)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
             futures = {executor.submit(self._process_item, item): item for item in list_items}
             
-            # tqdm을 사용한 진행 상황 표시
-            with tqdm(total=total_items, desc="상세 크롤링") as pbar:
-                for future in concurrent.futures.as_completed(futures):
-                    combined_item = future.result()
-                    combined_items.append(combined_item)
+            # 진행 상황: listener가 있으면 이벤트로 전달하고 tqdm 출력은 끔 (취소 시 남은 future는 버림)
+            progress = ProgressReporter("late", "detail", total_items, self.progress_listener)
+            with progress, tqdm(total=total_items, desc="상세 크롤링", disable=self.progress_listener is not None) as pbar:
+                for future in iter_completed(futures, self.cancel_token):
+                    try:
+                        combined_item = future.result()
+                    except CrawlCancelled:
+                        continue
+                    if self.sink is not None:
+                        self.sink.write(combined_item)
+                    if self.keep_results:
+                        combined_items.append(combined_item)
+                    collected += 1
+                    first_results.add(combined_item)
                     pbar.update(1)
+                    self._pending.dec()
+                    progress.update(errors=self.failure_count)
+                # 결과가 first_results_count개보다 적게 끝난 경우에도 중간 미리보기 전달
+                if not self.cancel_token.cancelled:
+                    first_results.flush()
+        finally:
+            # 취소된 경우 진행 중인 요청을 기다리지 않고 반환
+            executor.shutdown(wait=not self.cancel_token.cancelled, cancel_futures=True)
+            self._pending.set(0)
+            if self.sink is not None:
+                self.sink.flush()
         
         # 크롤링 완료 후 요약 정보 출력
-        print(f"상세 내용 크롤링 완료: 총 {len(combined_items)}개 항목")
+        if self.cancel_token.cancelled:
+            print(f"상세 내용 크롤링 중지: {total_items}개 중 {collected}개 항목만 수집되었습니다.")
+        else:
+            print(f"상세 내용 크롤링 완료: 총 {collected}개 항목")
+        
+        self.metrics.finish()
         
         # 실패 항목 요약 출력
-        if self.failed_items:
-            print(f"경고: {len(self.failed_items)}개 항목에서 문제가 발생했습니다.")
+        failed_items = self.failed_items
+        if failed_items:
+            print(f"경고: {len(failed_items)}개 항목에서 문제가 발생했습니다.")
             # 처음 3개만 상세 출력
-            for i, (idx, gubun, error) in enumerate(self.failed_items[:3]):
+            for i, (idx, gubun, error) in enumerate(failed_items[:3]):
                 print(f"  - 실패 항목 #{i+1}: idx={idx}, gubun={gubun}, 오류={error[:100]}")
-            if len(self.failed_items) > 3:
-                print(f"  - 그 외 {len(self.failed_items)-3}개 항목...")
+            if len(failed_items) > 3:
+                print(f"  - 그 외 {len(failed_items)-3}개 항목...")
         
-        return pd.DataFrame([vars(item) for item in combined_items])
+        return combined_items.to_dataframe()
 
 
 if __name__ == "__main__":
@@ -9,23 +9,31 @@ from typing import Callable, List, Dict, Any, Optional
 import json
 
 from late.models import ListItem
-from late.config import LIST_URL, DEFAULT_HEADERS
+from late.config import LIST_URL, DEFAULT_HEADERS, REQUEST_TIMEOUT
 from common.utils import random_sleep
 from common.ssl_adapter import get_legacy_session
+from common.metrics import get_registry
+from common.cancellation import CancellationToken
+from common.records import records_to_dataframe
 
 class ListCrawler:
     """금융위원회 회신사례 목록 크롤러"""
     
-    def __init__(self, batch_size: int = 1000, max_items: Optional[int] = None):
+    def __init__(self, batch_size: int = 1000, max_items: Optional[int] = None,
+                 cancel_token: Optional[CancellationToken] = None):
         """
         Args:
             batch_size: 한 번에 요청할 항목 수
             max_items: 최대 크롤링할 항목 수 (None이면 전체)
+            cancel_token: 취소 토큰 (취소 시 다음 페이지를 요청하지 않고 부분 결과 반환)
         """
         self.batch_size = batch_size
         self.max_items = max_items
+        self.cancel_token = cancel_token or CancellationToken()
         self.headers = DEFAULT_HEADERS.copy()
         self.session = get_legacy_session()
+        self.cancel_token.register(self.session.close)
+        self._request_seconds = get_registry().histogram("late.list.request_seconds")
         
     def get_list_items(self, start_date: str = "2000-01-01", end_date: Optional[str] = None) -> List[ListItem]:
         """
@@ -48,6 +56,11 @@ class ListCrawler:
         print(f"목록 크롤링 시작: {start_date} ~ {end_date}")
         
         while True:
+            # 취소 요청 확인
+            if self.cancel_token.cancelled:
+                print(f"목록 크롤링 중지: {len(all_items)}개 항목까지 수집")
+                break
+                
             # 최대 아이템 수 제한 확인
             if self.max_items and start_pos >= self.max_items:
                 break
@@ -66,7 +79,8 @@ class ListCrawler:
                 "searchReplyRegDateEnd": end_date
             }
             
-            response = self.session.post(LIST_URL, headers=self.headers, data=data)
+            with self._request_seconds.time():
+                response = self.session.post(LIST_URL, headers=self.headers, data=data, timeout=REQUEST_TIMEOUT)
             json_data = response.json()
             
             # 첫 번째 요청에서 전체 개수 확인
@@ -107,7 +121,7 @@ class ListCrawler:
                 break
                 
             # 요청 간 지연
-            random_sleep()
+            random_sleep(cancel_token=self.cancel_token)
             
         print(f"목록 크롤링 완료: 총 {len(all_items)}개 항목")
         return all_items
@@ -134,7 +148,7 @@ class ListCrawler:
             "searchReplyRegDateEnd": end_date
         }
 
-        response = self.session.post(LIST_URL, headers=self.headers, data=data)
+        response = self.session.post(LIST_URL, headers=self.headers, data=data, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         json_data = response.json()
         total_count = int(json_data.get("recordsTotal", 0))
@@ -147,7 +161,7 @@ class ListCrawler:
         목록을 데이터프레임으로 반환
         """
         list_items = self.get_list_items(start_date, end_date)
-        return pd.DataFrame([vars(item) for item in list_items])
+        return records_to_dataframe(list_items, ListItem)
     
 if __name__ == "__main__":
     crawler = ListCrawler(batch_size=1000)
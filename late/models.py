@@ -5,8 +5,10 @@
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
-@dataclass
-class ListItem:
+from common.records import Record
+
+@dataclass(slots=True)
+class ListItem(Record):
     """목록 아이템 데이터 클래스"""
     rownumber: int # 사용할 필요 없는 정보
     idx: int # 목록 아이템 인덱스
@@ -16,8 +18,8 @@ class ListItem:
     regDate: str # 등록일자
     number: str # 일련번호
 
-@dataclass
-class DetailItem:
+@dataclass(slots=True)
+class DetailItem(Record):
     """상세 내용 데이터 클래스"""
     title: str # 제목
     registrant: Optional[str] # 등록자
@@ -26,8 +28,8 @@ class DetailItem:
     answer: Optional[str] # 회답
     reason: Optional[str] # 이유
 
-@dataclass
-class CombinedItem:
+@dataclass(slots=True)
+class CombinedItem(Record):
     """목록과 상세 내용을 결합한 데이터 클래스"""
     # 목록 항목
     rownumber: int
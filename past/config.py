@@ -17,10 +17,19 @@ LIST_URL = f"{BASE_URL}/selectReplyCasePastReqList.do"
 # 상세 페이지 크롤링 설정
 PASTREQ_DETAIL_URL = f"{BASE_URL}/PastReqDetail.do"
 
+# HTTP 요청 타임아웃 (연결, 응답 읽기 초) - 중지 요청 시 진행 중인 요청도 이 시간 안에 끝남
+REQUEST_TIMEOUT = (10, 30)
+
 # 공통 파라미터
 ST_NO = "11"
 MU_NO = "172"  # 과거 법령해석 질의회신 메뉴 번호 (muNo=172)
 ACT_CD = "R"
 
 # 결과 저장 파일명
-OUTPUT_EXCEL = "fsc_past_crawling_result.xlsx"
\ No newline at end of file
+OUTPUT_EXCEL = "fsc_past_crawling_result.xlsx"
+
+# 샤드 분할/병합 키
+SHARD_KEY_FIELDS = ("pastreqIdx",)
+
+# 상세 크롤링 우선순위 필드 (값 내림차순으로 처리하여 최신 문서를 먼저 수집)
+PRIORITY_KEY_FIELD = "regDate"
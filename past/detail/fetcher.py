@@ -2,8 +2,9 @@
 import requests
 from typing import Optional
 
-from ..config import PASTREQ_DETAIL_URL, DEFAULT_HEADERS, ST_NO, MU_NO, ACT_CD
+from ..config import PASTREQ_DETAIL_URL, DEFAULT_HEADERS, ST_NO, MU_NO, ACT_CD, REQUEST_TIMEOUT
 from common.ssl_adapter import get_legacy_session
+from common.metrics import get_registry
 
 class DetailFetcher:
     """상세 페이지 HTML 가져오기"""
@@ -11,6 +12,7 @@ class DetailFetcher:
     def __init__(self):
         self.headers = DEFAULT_HEADERS.copy()
         self.session = get_legacy_session()
+        self._request_seconds = get_registry().histogram("past.detail.request_seconds")
         
     def get_html(self, pastreq_idx: int) -> str:
         """상세 페이지 HTML 요청"""
@@ -20,5 +22,7 @@ class DetailFetcher:
             "pastreqIdx": pastreq_idx, #실제 리스트에서 사용용하는건 이거 하나뿐이다
             "actCd": ACT_CD
         }
-        response = self.session.post(PASTREQ_DETAIL_URL, headers=self.headers, data=data)
+        with self._request_seconds.time():
+            response = self.session.post(PASTREQ_DETAIL_URL, headers=self.headers, data=data,
+                                         timeout=REQUEST_TIMEOUT)
         return response.text
\ No newline at end of file
@@ -2,8 +2,8 @@
 과거 회신사례(2014년 이전) 상세 내용 크롤링 클래스
 """
 import concurrent.futures
-import time
-from typing import List
+from dataclasses import asdict
+from typing import Callable, List, Optional, Union
 import pandas as pd
 from tqdm import tqdm
 
@@ -11,53 +11,235 @@ from past.models import ListItem, CombinedItem
 from past.detail.fetcher import DetailFetcher
 from past.detail.parser import DetailParser
 from past.detail.combiner import DetailCombiner
+from common.cancellation import CancellationToken, CrawlCancelled, iter_completed
+from common.sharding import shard_key
+from common.work_queue import WorkQueue, run_workers
+from common.columnar import ColumnarBuilder
+from common.scheduling import DEFAULT_FIRST_RESULTS_COUNT, FirstResultsNotifier, prioritize
+from common.sinks import JsonlSink
+from common.progress import ProgressListener, ProgressReporter
+from past.config import PRIORITY_KEY_FIELD, SHARD_KEY_FIELDS
 
 class DetailCrawler:
     """금융위원회 과거 회신사례 상세 내용 크롤러"""
     
-    def __init__(self, delay_seconds: float = 0.5, max_workers: int = 5):
+    def __init__(self, delay_seconds: float = 0.5, max_workers: int = 5,
+                 cancel_token: Optional[CancellationToken] = None,
+                 work_queue: Optional[WorkQueue] = None,
+                 priority_key: Optional[str] = PRIORITY_KEY_FIELD,
+                 first_results_callback: Optional[Callable[[pd.DataFrame], None]] = None,
+                 first_results_count: int = DEFAULT_FIRST_RESULTS_COUNT,
+                 sink: Optional[JsonlSink] = None,
+                 keep_results: bool = True,
+                 progress_listener: Optional[ProgressListener] = None):
         self.delay_seconds = delay_seconds
         self.max_workers = max_workers
+        self.cancel_token = cancel_token or CancellationToken()
+        self.work_queue = work_queue
+        self.priority_key = priority_key
+        self.first_results_callback = first_results_callback
+        self.first_results_count = first_results_count
+        # 완료 항목 JSONL 기록 / keep_results=False면 메모리에 모으지 않음
+        self.sink = sink
+        self.keep_results = keep_results
+        # 진행 상황 이벤트 콜백 (지정 시 tqdm 출력 대신 이벤트만 전달)
+        self.progress_listener = progress_listener
         self.fetcher = DetailFetcher()
+        self.cancel_token.register(self.fetcher.session.close)
         self.parser = DetailParser()
+        # 진행 중인 작업 수 / 남은 작업 수 게이지 (전역 metrics 레지스트리, past.detail.*)
+        self._in_flight = self.parser.stats.metrics.gauge("in_flight")
+        self._pending = self.parser.stats.metrics.gauge("pending")
         self.combiner = DetailCombiner()
     
+    def get_list_only_dataframe(self, list_items: List[ListItem]) -> pd.DataFrame:
+        """상세 수집 없이 목록 정보만 결합한 데이터프레임 (목록 단계에서 취소된 경우의 부분 결과)"""
+        combined_items = ColumnarBuilder.for_record(CombinedItem)
+        for item in list_items:
+            combined_items.append(self.combiner.combine(item, None))
+        return combined_items.to_dataframe()
+
     def get_combined_dataframe(self, list_items: List[ListItem]) -> pd.DataFrame:
         """목록 아이템과 상세 내용을 결합한 데이터프레임 반환"""
+        if self.work_queue is not None:
+            return self._get_combined_dataframe_from_queue(list_items)
         combined_items = self._process_items(list_items)
-        return pd.DataFrame([vars(item) for item in combined_items])
+        return combined_items.to_dataframe()
     
-    def _process_items(self, list_items: List[ListItem]) -> List[CombinedItem]:
+    def _process_items(self, list_items: List[ListItem]) -> ColumnarBuilder:
         """상세 페이지 크롤링 및 처리"""
-        combined_items = []
+        # 완료된 항목을 컬럼별 버퍼에 바로 누적
+        combined_items = ColumnarBuilder.for_record(CombinedItem)
+        collected = 0
         total_items = len(list_items)
         
         print(f"상세 내용 크롤링 시작: 총 {total_items}개 항목")
+        self.parser.stats.start()
+        self._pending.set(total_items)
+        
+        # 최신 문서부터 제출 (스레드풀은 제출 순서대로 처리)
+        list_items = prioritize(list_items, self.priority_key)
+        first_results = self._first_results_notifier()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
             futures = {executor.submit(self._process_single_item, item): item 
                       for item in list_items}
             
-            with tqdm(total=total_items, desc="상세 크롤링") as pbar:
-                for future in concurrent.futures.as_completed(futures):
-                    combined_item = future.result()
-                    combined_items.append(combined_item)
+            # 진행 상황: listener가 있으면 이벤트로 전달하고 tqdm 출력은 끔 (취소 시 남은 future는 버림)
+            progress = ProgressReporter("past", "detail", total_items, self.progress_listener)
+            with progress, tqdm(total=total_items, desc="상세 크롤링", disable=self.progress_listener is not None) as pbar:
+                for future in iter_completed(futures, self.cancel_token):
+                    try:
+                        combined_item = future.result()
+                    except CrawlCancelled:
+                        continue
+                    if self.sink is not None:
+                        self.sink.write(combined_item)
+                    if self.keep_results:
+                        combined_items.append(combined_item)
+                    collected += 1
+                    first_results.add(combined_item)
                     pbar.update(1)
+                    self._pending.dec()
+                    progress.update(errors=self.parser.stats.failure_count)
+                # 결과가 first_results_count개보다 적게 끝난 경우에도 중간 미리보기 전달
+                if not self.cancel_token.cancelled:
+                    first_results.flush()
+        finally:
+            # 취소된 경우 진행 중인 요청을 기다리지 않고 반환
+            executor.shutdown(wait=not self.cancel_token.cancelled, cancel_futures=True)
+            self._pending.set(0)
+            if self.sink is not None:
+                self.sink.flush()
         
+        if self.cancel_token.cancelled:
+            print(f"상세 내용 크롤링 중지: {total_items}개 중 {collected}개 항목만 수집되었습니다.")
+        self.parser.stats.finish()
         self._print_summary()
         return combined_items
     
+    def _first_results_notifier(self) -> FirstResultsNotifier:
+        """first results 콜백이 없으면 결과를 모으지 않는 notifier"""
+        callback = self._notify_first_results if self.first_results_callback is not None else None
+        return FirstResultsNotifier(callback, self.first_results_count)
+
+    def _notify_first_results(self, items: List[Union[CombinedItem, dict]]) -> None:
+        """처음 수집된 항목들을 데이터프레임으로 first results 콜백에 전달 (작업 큐 결과는 dict)"""
+        combined_items = ColumnarBuilder.for_record(CombinedItem)
+        for item in items:
+            if isinstance(item, dict):
+                combined_items.append_mapping(item)
+            else:
+                combined_items.append(item)
+        self.first_results_callback(combined_items.to_dataframe())
+    
+    def run_queue_worker(self, work_queue: Optional[WorkQueue] = None) -> int:
+        """
+        작업 큐에서 항목을 가져와 처리 (큐가 빌 때까지)
+        다른 프로세스/노드에서 같은 큐를 공유하는 worker로 실행할 때 사용
+        
+        Returns:
+            이 worker가 완료한 항목 수
+        """
+        work_queue = work_queue or self.work_queue
+        self.parser.stats.start()
+        unfinished = work_queue.unfinished_count()
+        self._pending.set(unfinished)
+        progress = ProgressReporter("past", "detail", unfinished, self.progress_listener)
+        first_results = self._first_results_notifier()
+
+        def handler(payload: dict) -> dict:
+            try:
+                result = self._process_job(payload)
+            except Exception:
+                # 실패한 작업은 재시도 대상으로 남으므로 완료 수는 그대로 두고 오류 수만 갱신
+                progress.update(0, errors=self.parser.stats.failure_count)
+                raise
+            self._pending.dec()
+            progress.update(errors=self.parser.stats.failure_count)
+            first_results.add(result)
+            return result
+
+        with progress:
+            done = run_workers(work_queue, handler, self.max_workers, self.cancel_token)
+        # 다른 worker가 처리한 작업도 반영
+        self._pending.set(work_queue.unfinished_count())
+        self.parser.stats.finish()
+        if not self.cancel_token.cancelled:
+            first_results.flush()
+        return done
+    
+    def _process_job(self, payload: dict) -> dict:
+        """큐 작업 처리: 상세 수집 실패 시 예외를 던져 재시도 대상으로 남김"""
+        with self._in_flight.track():
+            list_item = ListItem(**payload)
+            try:
+                html = self.fetcher.get_html(list_item.pastreqIdx)
+            except Exception as e:
+                # 요청 실패도 스레드풀 경로와 같이 실패로 집계 (취소로 세션이 닫힌 경우 제외)
+                if not self.cancel_token.cancelled:
+                    self.parser.stats.failures.record(list_item.pastreqIdx, str(e))
+                raise
+            # 파싱 실패는 parser가 기록하고 None 반환
+            detail_item = self.parser.parse(html, list_item.pastreqIdx)
+            if detail_item is None:
+                raise RuntimeError(f"상세 내용 수집 실패: {list_item.pastreqIdx}")
+            result = asdict(self.combiner.combine(list_item, detail_item))
+            # 큐 완료 처리 전에 기록하므로 재시도 시 같은 항목이 한 번 더 기록될 수 있음
+            if self.sink is not None:
+                self.sink.write(result)
+            self.cancel_token.wait(self.delay_seconds)
+            return result
+    
+    def _get_combined_dataframe_from_queue(self, list_items: List[ListItem]) -> pd.DataFrame:
+        """작업 큐에 항목을 등록하고 처리한 뒤 결과 수집"""
+        added = self.work_queue.put(
+            (shard_key(item, SHARD_KEY_FIELDS), asdict(item))
+            for item in prioritize(list_items, self.priority_key)
+        )
+        print(f"작업 큐 등록: {added}개 항목 (기존 작업 {len(list_items) - added}개는 이어서 처리)")
+        self.run_queue_worker()
+        if not self.keep_results:
+            # 완료 결과는 sink에만 기록, 큐에 저장된 결과를 메모리로 다시 읽지 않음
+            self._print_queue_status(len(self.work_queue.failed()))
+            return ColumnarBuilder.for_record(CombinedItem).to_dataframe()
+        return self.collect_queue_dataframe()
+    
+    def collect_queue_dataframe(self) -> pd.DataFrame:
+        """작업 큐의 완료 결과 + 최종 실패 항목(상세 없음)을 데이터프레임으로 반환"""
+        results = ColumnarBuilder.for_record(CombinedItem)
+        for row in self.work_queue.results():
+            results.append_mapping(row)
+        failed = self.work_queue.failed()
+        for payload, _ in failed:
+            results.append(self.combiner.combine(ListItem(**payload), None))
+        self._print_queue_status(len(failed))
+        return results.to_dataframe()
+    
+    def _print_queue_status(self, failed_count: int) -> None:
+        """작업 큐의 최종 실패 / 미완료 항목 수 출력"""
+        unfinished = self.work_queue.unfinished_count()
+        if failed_count:
+            print(f"경고: {failed_count}개 항목이 최대 재시도 후에도 실패했습니다.")
+        if unfinished:
+            print(f"참고: {unfinished}개 항목은 아직 다른 worker가 처리 중입니다.")
+
     def _process_single_item(self, list_item: ListItem) -> CombinedItem:
         """단일 항목 처리"""
-        try:
-            html = self.fetcher.get_html(list_item.pastreqIdx)
-            detail_item = self.parser.parse(html, list_item.pastreqIdx)
-            combined_item = self.combiner.combine(list_item, detail_item)
-            time.sleep(self.delay_seconds)
-            return combined_item
-        except Exception as e:
-            self.parser.stats.failed_items.append((list_item.pastreqIdx, str(e)))
-            return self.combiner.combine(list_item, None)
+        with self._in_flight.track():
+            self.cancel_token.raise_if_cancelled()
+            try:
+                html = self.fetcher.get_html(list_item.pastreqIdx)
+                detail_item = self.parser.parse(html, list_item.pastreqIdx)
+                combined_item = self.combiner.combine(list_item, detail_item)
+                self.cancel_token.wait(self.delay_seconds)
+                return combined_item
+            except Exception as e:
+                if self.cancel_token.cancelled:
+                    raise CrawlCancelled(str(e))
+                self.parser.stats.failures.record(list_item.pastreqIdx, str(e))
+                return self.combiner.combine(list_item, None)
             
     def _print_summary(self):
         """처리 결과 요약 출력"""
@@ -65,12 +247,13 @@ class DetailCrawler:
         if stats.regex_found_count > 0:
             print(f"참고: {stats.regex_found_count}개 항목은 정규식을 사용하여 '이유' 필드를 찾았습니다.")
         
-        if stats.failed_items:
-            print(f"경고: {len(stats.failed_items)}개 항목에서 문제가 발생했습니다.")
-            for i, (idx, error) in enumerate(stats.failed_items[:3]):
+        failed_items = stats.failed_items
+        if failed_items:
+            print(f"경고: {len(failed_items)}개 항목에서 문제가 발생했습니다.")
+            for i, (idx, error) in enumerate(failed_items[:3]):
                 print(f"  - 실패 항목 #{i+1}: pastreqIdx={idx}, 오류={error[:100]}")
-            if len(stats.failed_items) > 3:
-                print(f"  - 그 외 {len(stats.failed_items)-3}개 항목...")
+            if len(failed_items) > 3:
+                print(f"  - 그 외 {len(failed_items)-3}개 항목...")
 
 if __name__ == "__main__":
     import logging
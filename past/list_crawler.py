@@ -17,23 +17,31 @@ if parent_dir not in sys.path:
 
 
 from common.ssl_adapter import get_legacy_session
+from common.metrics import get_registry
+from common.cancellation import CancellationToken
+from common.records import records_to_dataframe
 from past.models import ListItem
-from past.config import LIST_URL, DEFAULT_HEADERS
+from past.config import LIST_URL, DEFAULT_HEADERS, REQUEST_TIMEOUT
 from common.utils import random_sleep
 
 class ListCrawler:
     """금융위원회 과거 회신사례 목록 크롤러"""
     
-    def __init__(self, batch_size: int = 1000, max_items: Optional[int] = None):
+    def __init__(self, batch_size: int = 1000, max_items: Optional[int] = None,
+                 cancel_token: Optional[CancellationToken] = None):
         """
         Args:
             batch_size: 한 번에 요청할 항목 수
             max_items: 최대 크롤링할 항목 수 (None이면 전체)
+            cancel_token: 취소 토큰 (취소 시 다음 페이지를 요청하지 않고 부분 결과 반환)
         """
         self.batch_size = batch_size
         self.max_items = max_items
+        self.cancel_token = cancel_token or CancellationToken()
         self.headers = DEFAULT_HEADERS.copy()
         self.session = get_legacy_session()
+        self.cancel_token.register(self.session.close)
+        self._request_seconds = get_registry().histogram("past.list.request_seconds")
         
     def get_list_items(
         self,
@@ -63,6 +71,11 @@ class ListCrawler:
             progress_callback(f"past 목록 조회 시작: {start_date} ~ {end_date}")
         
         while True:
+            # 취소 요청 확인
+            if self.cancel_token.cancelled:
+                print(f"목록 크롤링 중지: {len(all_items)}개 항목까지 수집")
+                break
+                
             # 최대 아이템 수 제한 확인
             if self.max_items and start_pos >= self.max_items:
                 break
@@ -81,7 +94,8 @@ class ListCrawler:
                 "searchReplyRegDateEnd": end_date
             }
             
-            response = self.session.post(LIST_URL, headers=self.headers, data=data)
+            with self._request_seconds.time():
+                response = self.session.post(LIST_URL, headers=self.headers, data=data, timeout=REQUEST_TIMEOUT)
             json_data = response.json()
             
             # 첫 번째 요청에서 전체 개수 확인
@@ -127,7 +141,7 @@ class ListCrawler:
                 break
                 
             # 요청 간 지연
-            random_sleep()
+            random_sleep(cancel_token=self.cancel_token)
             
         print(f"목록 크롤링 완료: 총 {len(all_items)}개 항목")
         if progress_callback:
@@ -161,7 +175,7 @@ class ListCrawler:
         목록을 데이터프레임으로 반환
         """
         list_items = self.get_list_items(start_date, end_date)
-        return pd.DataFrame([vars(item) for item in list_items])
+        return records_to_dataframe(list_items, ListItem)
     
 if __name__ == "__main__":
     # 테스트용 코드
@@ -8,9 +8,15 @@ import time
 import pandas as pd
 from datetime import datetime
 import traceback
+from typing import Optional
 
 from past.list_crawler import ListCrawler
 from past.detail_crawler import DetailCrawler
+from common.cancellation import CancellationToken
+from common.sharding import DEFAULT_SHARD_DIR, filter_shard, parse_shard, write_shard_output
+from common.work_queue import SQLiteWorkQueue
+from common.sinks import JsonlSink
+from past.config import SHARD_KEY_FIELDS
 
 def parse_args():
     """명령행 인자 파싱"""
@@ -28,11 +34,25 @@ def parse_args():
                         help="상세 내용 크롤링 시 병렬 처리 작업자 수")
     parser.add_argument("--delay", type=float, default=0.3,
                         help="요청 간 지연 시간 (초)")
+    parser.add_argument("--shard", type=parse_shard, default=None,
+                        help="샤드 모드: i/N 형식 (N개 중 i번째 샤드만 크롤링, i는 0부터)")
+    parser.add_argument("--shard-dir", type=str, default=DEFAULT_SHARD_DIR,
+                        help="샤드 결과 저장 디렉토리")
+    parser.add_argument("--queue", type=str, default=None,
+                        help="작업 큐 SQLite 파일 경로 (여러 worker가 공유, 중단 후 재실행 시 이어서 처리)")
+    parser.add_argument("--worker", action="store_true",
+                        help="worker 모드: 목록 크롤링 없이 --queue의 남은 상세 작업만 처리")
+    parser.add_argument("--jsonl", type=str, default=None,
+                        help="상세 항목을 완료되는 대로 기록할 JSONL 파일 경로 (크롤링 중 tail 가능, 이어서 기록)")
+    parser.add_argument("--no-keep", dest="keep_results", action="store_false",
+                        help="상세 항목을 메모리에 모으지 않고 --jsonl 파일에만 기록 (결과 데이터프레임은 비어 있음)")
 
     return parser.parse_args()
 
 def main(start_date="2000-01-01", end_date=None, batch_size=1000, 
-         max_items=None, max_workers=8, delay=0.3)-> pd.DataFrame : 
+         max_items=None, max_workers=8, delay=0.3, cancel_token=None, shard=None,
+         queue_path=None, first_results_callback=None, jsonl_path=None,
+         progress_listener=None, keep_results=True)-> pd.DataFrame : 
     """
     메인 실행 함수 (순수 데이터 조회 기능만 제공)
     
@@ -43,23 +63,33 @@ def main(start_date="2000-01-01", end_date=None, batch_size=1000,
         max_items: 최대 크롤링 항목 수 (기본값: 제한 없음)
         max_workers: 병렬 처리 작업자 수 (기본값: 8)
         delay: 요청 간 지연 시간 초 (기본값: 0.3)
+        cancel_token: 취소 토큰 (취소 시 그때까지 수집한 부분 결과 반환)
+        shard: (i, N) 튜플이면 idx 해시가 i번째 샤드인 항목만 상세 크롤링
+        queue_path: 작업 큐 SQLite 파일 경로 (지정 시 상세 작업을 큐에 등록하고 처리)
+        first_results_callback: 최신 문서 일부가 먼저 수집되면 호출할 콜백 (중간 미리보기용 데이터프레임 전달)
+        jsonl_path: 상세 항목을 완료되는 대로 기록할 JSONL 파일 경로 (None이면 기록하지 않음)
+        progress_listener: 상세 크롤링 진행 상황 이벤트(ProgressEvent) 콜백 (지정 시 tqdm 출력 대신 이벤트 전달)
+        keep_results: False면 상세 항목을 메모리에 모으지 않고 jsonl_path에만 기록 (빈 데이터프레임 반환, jsonl_path 필요)
         
     Returns:
         pd.DataFrame: 크롤링 결과 데이터프레임
     """
+    if not keep_results and not jsonl_path:
+        raise ValueError("keep_results=False에는 jsonl_path가 필요합니다 (결과를 기록할 곳이 없음).")
+    cancel_token = cancel_token or CancellationToken()
     try:
         start_time = time.time()
         print(f"크롤링 시작: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # 목록 크롤링
         print(f"목록 크롤링 중... (시작일: {start_date}, 종료일: {end_date or '현재'})")
-        list_crawler = ListCrawler(batch_size=batch_size, max_items=max_items)
+        list_crawler = ListCrawler(batch_size=batch_size, max_items=max_items, cancel_token=cancel_token)
         list_items = list_crawler.get_list_items(start_date=start_date, end_date=end_date)
         
         if not list_items:
             print("목록 크롤링 결과가 없습니다.")
             return pd.DataFrame()  # 빈 데이터프레임 반환
-            
+        
         print(f"목록 크롤링 완료: {len(list_items)}개 항목")
         
         # 날짜 조건에 맞는 항목 필터링
@@ -72,15 +102,36 @@ def main(start_date="2000-01-01", end_date=None, batch_size=1000,
         ]
         print(f"필터링된 항목 수: {len(filtered_items)}개 (조건: {start_date} ~ {end_date})")
         
+        # 샤드 모드: 담당 샤드 항목만 남김
+        if shard is not None:
+            filtered_items = filter_shard(filtered_items, shard, SHARD_KEY_FIELDS)
+            print(f"샤드 {shard[0]}/{shard[1]} 항목 수: {len(filtered_items)}개")
+        
         if not filtered_items:
             print("필터링된 항목이 없습니다. 작업을 종료합니다.")
             return pd.DataFrame()  # 빈 데이터프레임 반환
+        
+        # 목록 단계에서 취소된 경우: 이미 받은 목록 정보만 부분 결과로 반환
+        if cancel_token.cancelled:
+            print(f"작업이 취소되어 상세 크롤링을 건너뜁니다. (목록 정보 {len(filtered_items)}개 항목만 반환)")
+            return DetailCrawler(delay_seconds=delay, cancel_token=cancel_token).get_list_only_dataframe(filtered_items)
                 
         # 상세 내용 크롤링 및 결합
         print("상세 내용 크롤링 중...")
-        detail_crawler = DetailCrawler(delay_seconds=delay, max_workers=max_workers)
+        work_queue = SQLiteWorkQueue(queue_path) if queue_path else None
+        sink = JsonlSink(jsonl_path) if jsonl_path else None
+        detail_crawler = DetailCrawler(delay_seconds=delay, max_workers=max_workers,
+                                       cancel_token=cancel_token, work_queue=work_queue,
+                                       first_results_callback=first_results_callback, sink=sink,
+                                       keep_results=keep_results, progress_listener=progress_listener)
         #result_df = detail_crawler.get_combined_dataframe(list_items)
-        result_df = detail_crawler.get_combined_dataframe(filtered_items)
+        try:
+            result_df = detail_crawler.get_combined_dataframe(filtered_items)
+        finally:
+            if work_queue is not None:
+                work_queue.close()
+            if sink is not None:
+                sink.close()
         
         # 소요 시간 출력
         elapsed_time = time.time() - start_time
@@ -99,13 +150,56 @@ def main(start_date="2000-01-01", end_date=None, batch_size=1000,
         print(traceback.format_exc())
         return pd.DataFrame()  # 빈 데이터프레임 반환
 
+def run_queue_worker(queue_path: str, max_workers: int = 8, delay: float = 0.3,
+                     cancel_token: Optional[CancellationToken] = None,
+                     jsonl_path: Optional[str] = None) -> int:
+    """
+    worker 모드 - 공유 작업 큐의 남은 상세 작업만 처리
+    
+    Args:
+        jsonl_path: 이 worker가 완료한 항목을 기록할 JSONL 파일 경로 (worker마다 다른 파일 권장)
+    
+    Returns:
+        int: 이 worker가 완료한 항목 수
+    """
+    work_queue = SQLiteWorkQueue(queue_path)
+    sink = JsonlSink(jsonl_path) if jsonl_path else None
+    try:
+        detail_crawler = DetailCrawler(delay_seconds=delay, max_workers=max_workers,
+                                       cancel_token=cancel_token, work_queue=work_queue, sink=sink)
+        done = detail_crawler.run_queue_worker()
+        print(f"worker 완료: {done}개 항목 처리, 남은 작업 {work_queue.unfinished_count()}개")
+        return done
+    finally:
+        work_queue.close()
+        if sink is not None:
+            sink.close()
+
 if __name__ == "__main__":
     args = parse_args()
+
+    # worker 모드: 다른 프로세스/노드가 등록한 작업 큐를 함께 처리하고 종료
+    if args.worker:
+        if not args.queue:
+            raise SystemExit("--worker 모드에는 --queue 경로가 필요합니다.")
+        run_queue_worker(args.queue, max_workers=args.max_workers, delay=args.delay,
+                         jsonl_path=args.jsonl)
+        raise SystemExit(0)
+    if not args.keep_results and not args.jsonl:
+        raise SystemExit("--no-keep에는 --jsonl 경로가 필요합니다.")
     result = main(
         start_date=args.start_date,
         end_date=args.end_date,
         batch_size=args.batch_size,
         max_items=args.max_items,
         max_workers=args.max_workers,
-        delay=args.delay
+        delay=args.delay,
+        shard=args.shard,
+        queue_path=args.queue,
+        jsonl_path=args.jsonl,
+        keep_results=args.keep_results
     )
+
+    # 샤드 모드: 샤드별 부분 결과 저장 (병합은 python -m common.sharding merge past)
+    if args.shard is not None:
+        write_shard_output(result, args.shard_dir, "past", args.shard)
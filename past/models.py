@@ -5,8 +5,10 @@
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
-@dataclass
-class ListItem:
+from common.records import Record
+
+@dataclass(slots=True)
+class ListItem(Record):
     """목록 아이템 데이터 클래스"""
     rownumber: int
     pastreqIdx: int  # 과거회신사례 인덱스
@@ -15,8 +17,8 @@ class ListItem:
     serialNum: Optional[str]  # 일련번호
     regDate: str # 등록일자        
 
-@dataclass
-class DetailItem:
+@dataclass(slots=True)
+class DetailItem(Record):
     """상세 내용 데이터 클래스"""
     inquiry: Optional[str]  # 질의요지
     fact: Optional[str]  # 법령해석요청의 원인이 되는 사실관계
@@ -24,8 +26,8 @@ class DetailItem:
     answer: Optional[str] # 회답
     reason: Optional[str] # 이유    
 
-@dataclass
-class CombinedItem:
+@dataclass(slots=True)
+class CombinedItem(Record):
     """목록과 상세 내용을 결합한 데이터 클래스"""
     # 목록 항목
     rownumber: int
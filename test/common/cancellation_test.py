@@ -0,0 +1,130 @@
+"""
+취소 토큰(common.cancellation) 동작 확인 (네트워크 불필요)
+
+- cancel() 시 등록 순서대로 콜백 실행, 여러 번 호출해도 한 번만 실행, 콜백 오류는 무시
+- 취소 후 등록한 콜백은 즉시 실행
+- wait()는 취소되면 제한 시간 전에 True로 반환, 취소가 없으면 시간이 지난 뒤 False
+- iter_completed는 취소되면 남은 future를 취소하고 멈춤
+- 크롤러의 HTTP 요청에 타임아웃이 설정되어 있음 (중지 후 진행 중인 요청도 제한 시간 안에 끝남)
+
+실행: python test/common/cancellation_test.py
+"""
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from common.cancellation import CancellationToken, CrawlCancelled, iter_completed
+
+
+def check_callbacks():
+    token = CancellationToken()
+    calls = []
+    token.register(lambda: calls.append("session"))
+
+    def broken():
+        calls.append("broken")
+        raise RuntimeError("콜백 오류")
+
+    token.register(broken)
+    token.register(lambda: calls.append("after"))
+    assert calls == []
+    token.raise_if_cancelled()
+
+    token.cancel()
+    token.cancel()
+    assert token.cancelled
+    assert calls == ["session", "broken", "after"], calls
+
+    # 취소 후 등록하면 즉시 실행
+    token.register(lambda: calls.append("late"))
+    assert calls[-1] == "late"
+    try:
+        token.raise_if_cancelled()
+    except CrawlCancelled:
+        pass
+    else:
+        raise AssertionError("취소 후 raise_if_cancelled가 예외를 발생시키지 않음")
+    print("콜백 실행 순서 / 한 번만 실행 / 취소 후 등록: OK")
+
+
+def check_wait():
+    token = CancellationToken()
+    start = time.perf_counter()
+    assert token.wait(0.05) is False
+    assert time.perf_counter() - start >= 0.04
+
+    threading.Timer(0.05, token.cancel).start()
+    start = time.perf_counter()
+    assert token.wait(5) is True
+    assert time.perf_counter() - start < 1
+    print("wait() 취소 시 즉시 반환: OK")
+
+
+def check_iter_completed():
+    token = CancellationToken()
+    release = threading.Event()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        futures = {executor.submit(lambda i=i: i): i for i in range(2)}
+        # worker가 1개라 뒤의 작업은 release 전까지 실행되지 않음
+        futures[executor.submit(release.wait)] = "blocking"
+        futures.update({executor.submit(lambda i=i: i): i for i in range(2, 10)})
+
+        results = []
+        start = time.perf_counter()
+        for future in iter_completed(futures, token, poll_interval=0.01):
+            results.append(future.result())
+            if len(results) == 2:
+                token.cancel()
+        elapsed = time.perf_counter() - start
+        cancelled = [future for future in futures if future.cancelled()]
+        release.set()
+
+    assert sorted(results) == [0, 1], results
+    assert elapsed < 1, elapsed
+    assert len(cancelled) == 8, len(cancelled)
+
+    # 토큰이 없으면 as_completed와 같이 모두 반환
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {executor.submit(lambda i=i: i): i for i in range(5)}
+        assert sorted(future.result() for future in iter_completed(futures)) == list(range(5))
+    print("iter_completed 취소 시 남은 작업 취소 후 종료: OK")
+
+
+class RecordingSession:
+    """post 호출 인자를 기록하는 세션 (네트워크 없음)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(kwargs)
+        raise ConnectionError("테스트용 세션")
+
+
+def check_request_timeouts():
+    from integ.detail.fetcher import DetailFetcher as IntegFetcher
+    from past.detail.fetcher import DetailFetcher as PastFetcher
+
+    for fetcher_cls in (PastFetcher, IntegFetcher):
+        fetcher = fetcher_cls()
+        fetcher.session = RecordingSession()
+        try:
+            fetcher.get_html(1)
+        except Exception:
+            pass
+        assert fetcher.session.calls, fetcher_cls
+        assert all(call.get("timeout") for call in fetcher.session.calls), fetcher.session.calls
+    print("상세 요청 타임아웃 설정: OK")
+
+
+if __name__ == "__main__":
+    check_callbacks()
+    check_wait()
+    check_iter_completed()
+    check_request_timeouts()
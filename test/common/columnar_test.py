@@ -0,0 +1,80 @@
+"""
+컬럼 단위 결과 누적기(common.columnar)와 Record 행 인터페이스(common.records) 확인 (네트워크 불필요)
+
+- to_arrow / to_dataframe 이후에도 같은 빌더에 계속 append 가능 (버퍼를 공유하지 않음)
+- 정수 컬럼에 정수가 아닌 값이 들어오면 해당 컬럼만 object로 전환
+- to_dataframe dtype: int 필드는 int64, 나머지는 object (None 유지)
+- records_to_dataframe: 항목이 없어도 컬럼 유지
+
+실행: python test/common/columnar_test.py
+"""
+import os
+import sys
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from common.columnar import ColumnarBuilder
+from common.records import records_to_dataframe
+from late.models import ListItem
+
+
+def make_item(i, title="목록"):
+    return ListItem(rownumber=i, idx=i * 10, gubun="법령해석", category=None, title=f"{title} {i}",
+                    regDate="2024-01-02", number=str(i))
+
+
+def check_append_after_export():
+    builder = ColumnarBuilder.for_record(ListItem)
+    builder.extend(make_item(i) for i in range(3))
+    table = builder.to_arrow()
+    df = builder.to_dataframe()
+    # 변환 결과가 버퍼를 참조하지 않으므로 계속 추가 가능
+    builder.append(make_item(3))
+    builder.append_mapping({"rownumber": 4, "idx": 40, "title": "dict 행"})
+    assert len(builder) == 5
+    assert table.num_rows == 3 and table.column("idx").to_pylist() == [0, 10, 20]
+    assert df["idx"].tolist() == [0, 10, 20]
+    assert builder.to_arrow().column("idx").to_pylist() == [0, 10, 20, 30, 40]
+    assert builder.to_dataframe()["gubun"].tolist()[-1] is None
+    print("to_arrow/to_dataframe 후 append: OK")
+
+
+def check_demotion():
+    builder = ColumnarBuilder(["idx", "title"], {"idx": "int64"})
+    builder.append_row([1, "가"])
+    builder.append_row(["A-2", "나"])
+    builder.append_row([2 ** 70, None])
+    assert builder.dtypes == {"idx": "object", "title": "object"}
+    df = builder.to_dataframe()
+    assert df["idx"].dtype == object and df["idx"].tolist() == [1, "A-2", 2 ** 70]
+    assert df["title"].tolist() == ["가", "나", None]
+    print("정수가 아닌 값 → object 전환: OK")
+
+
+def check_dtypes():
+    df = records_to_dataframe([make_item(i) for i in range(5)], ListItem)
+    assert list(df.columns) == list(ListItem.columns())
+    assert df["rownumber"].dtype == "int64" and df["idx"].dtype == "int64"
+    for column in ("gubun", "category", "title", "regDate", "number"):
+        assert df[column].dtype == object, (column, df[column].dtype)
+    assert df["category"].isna().all() and df["category"].tolist()[0] is None
+    assert make_item(1).to_row() == tuple(df.iloc[1].tolist()[:2]) + ("법령해석", None, "목록 1", "2024-01-02", "1")
+
+    empty = records_to_dataframe([], ListItem)
+    assert empty.empty and list(empty.columns) == list(ListItem.columns())
+    assert empty["idx"].dtype == "int64"
+    pd.testing.assert_frame_equal(records_to_dataframe([make_item(0)], ListItem),
+                                  pd.DataFrame([make_item(0).to_row()], columns=list(ListItem.columns()))
+                                  .astype({"category": object, "gubun": object, "title": object,
+                                           "regDate": object, "number": object}))
+    print("to_dataframe dtype / records_to_dataframe: OK")
+
+
+if __name__ == "__main__":
+    check_append_after_export()
+    check_demotion()
+    check_dtypes()
@@ -0,0 +1,157 @@
+"""
+metrics 레지스트리(common.metrics) 동작 확인 (네트워크 불필요)
+
+- 여러 스레드가 동시에 갱신해도 카운터/히스토그램/실패 기록 건수가 누락되지 않음
+- reset(prefix)는 해당 prefix 지표만 초기화 (등록은 유지)
+- 같은 이름을 다른 유형으로 등록하면 TypeError
+- 게이지 set/inc/dec/track
+- 크롤러/파서 통계는 전역 레지스트리에 누적 (처리/실패 건수를 전역에서 조회 가능, 초기화하지 않음),
+  실행별 값은 RunMetrics 시작 시점과의 차이: 두 크롤러가 서로 덮어쓰지 않음, 실행 후 게이지는 0
+
+실행: python test/common/metrics_test.py
+"""
+import os
+import sys
+import threading
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from common.metrics import MetricsRegistry, RunMetrics, get_registry
+from late.detail_crawler import DetailCrawler
+from late.models import DetailItem, ListItem
+from past.detail.parser import DetailParser
+
+THREADS = 64
+PER_THREAD = 2000
+
+
+class OfflineDetailCrawler(DetailCrawler):
+    """요청 없이 합성 상세 내용을 반환하는 DetailCrawler (idx가 5의 배수면 실패)"""
+
+    def get_detail_item(self, idx, gubun):
+        self._processed.inc()
+        if idx % 5 == 0:
+            self._failures.record(idx, gubun, "합성 실패")
+            return None
+        return DetailItem(title=f"제목 {idx}", registrant="담당", reply_date="2024-01-02",
+                          inquiry=f"질의 {idx}", answer="회답", reason=None)
+
+
+def check_threads():
+    metrics = MetricsRegistry()
+
+    def worker(thread_no):
+        # 스레드마다 이름으로 다시 조회 (동시 등록도 같은 지표를 반환해야 함)
+        counter = metrics.counter("test.processed")
+        histogram = metrics.histogram("test.seconds", buckets=(0.5, 1.0))
+        failures = metrics.failures("test.failed")
+        for i in range(PER_THREAD):
+            counter.inc()
+            histogram.observe(0.25 if i % 2 else 0.75)
+            if i % 100 == 0:
+                failures.record(thread_no, i)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total = THREADS * PER_THREAD
+    assert metrics.counter("test.processed").value == total
+    snapshot = metrics.snapshot("test.")
+    assert snapshot["test.seconds"]["count"] == total
+    assert snapshot["test.seconds"]["buckets"] == {"0.5": total // 2, "1.0": total // 2, "+Inf": 0}
+    assert snapshot["test.failed"] == THREADS * (PER_THREAD // 100)
+    assert metrics.histogram("test.seconds").quantile(0.5) == 0.5
+    print(f"{THREADS}개 스레드 동시 갱신 ({total}건): OK")
+
+
+def check_reset():
+    metrics = MetricsRegistry()
+    metrics.counter("a.detail.processed").inc(3)
+    metrics.histogram("a.detail.request_seconds").observe(0.1)
+    metrics.counter("b.detail.processed").inc(5)
+    metrics.reset("a.")
+    assert metrics.counter("a.detail.processed").value == 0
+    assert metrics.histogram("a.detail.request_seconds").count == 0
+    assert metrics.counter("b.detail.processed").value == 5
+    assert sorted(metrics.snapshot()) == ["a.detail.processed", "a.detail.request_seconds", "b.detail.processed"]
+    try:
+        metrics.histogram("b.detail.processed")
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("다른 유형으로 등록하면 TypeError가 나야 함")
+    print("prefix 초기화 / 유형 충돌: OK")
+
+
+def check_gauge():
+    metrics = MetricsRegistry()
+    gauge = metrics.gauge("test.in_flight")
+    gauge.set(3)
+    gauge.inc()
+    gauge.dec(2)
+    assert gauge.value == 2
+    with gauge.track():
+        assert gauge.value == 3
+    assert metrics.snapshot("test.") == {"test.in_flight": 2}
+
+    run = RunMetrics("test", registry=metrics)
+    processed = run.counter("processed")
+    processed.inc(5)
+    assert run.count(processed) == 5
+    run.finish()
+    processed.inc(2)
+    # finish 이후 증가분은 이번 실행 값에 포함하지 않음, 전역 값은 누적
+    assert run.count(processed) == 5 and processed.value == 7
+    assert run.snapshot() == {"test.in_flight": 2, "test.processed": 5}
+    print("게이지 / 실행 단위 집계: OK")
+
+
+def check_instance_scope():
+    registry = get_registry()
+    request_seconds = registry.histogram("late.detail.request_seconds")
+    request_seconds.observe(0.2)
+    observed = request_seconds.count
+    processed_before = registry.counter("late.detail.processed").value
+    failed_before = registry.failures("late.detail.failed").count
+
+    items = [ListItem(rownumber=i, idx=i, gubun="법령해석", category=None, title=f"목록 {i}",
+                      regDate="2024-01-02", number=str(i)) for i in range(1, 51)]
+    first = OfflineDetailCrawler(delay_seconds=0, max_workers=4)
+    first.get_combined_dataframe(items)
+    second = OfflineDetailCrawler(delay_seconds=0, max_workers=4)
+    second.get_combined_dataframe(items[:20])
+
+    # 두 번째 크롤러 실행이 첫 번째 크롤러 실행 통계를 바꾸지 않음
+    assert first.total_processed == 50 and len(first.failed_items) == 10
+    assert second.total_processed == 20 and len(second.failed_items) == 4
+    # 같은 크롤러를 다시 실행하면 그 실행분만 집계
+    first.get_combined_dataframe(items[:10])
+    assert first.total_processed == 10 and first.failure_count == 2 and second.total_processed == 20
+    # 전역 레지스트리에는 모든 실행이 누적되고, 요청 지연시간도 초기화되지 않음
+    assert registry.counter("late.detail.processed").value == processed_before + 80
+    assert registry.failures("late.detail.failed").count == failed_before + 16
+    assert request_seconds.count == observed
+    assert registry.gauge("late.detail.in_flight").value == 0
+    assert registry.gauge("late.detail.pending").value == 0
+
+    # 파서 통계도 전역 레지스트리(past.detail.*)에 기록, start() 이후 값만 실행 통계
+    parser_a = DetailParser()
+    parser_a.stats.start()
+    parser_a.stats.processed.inc()
+    parser_b = DetailParser()
+    parser_b.stats.start()
+    assert parser_a.stats.total_processed == 1 and parser_b.stats.total_processed == 0
+    assert "past.detail.processed" in registry.snapshot("past.detail.")
+    print("크롤러/파서 통계 전역 누적 + 실행별 집계, 게이지 복귀: OK")
+
+
+if __name__ == "__main__":
+    check_threads()
+    check_reset()
+    check_gauge()
+    check_instance_scope()
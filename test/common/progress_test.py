@@ -0,0 +1,184 @@
+"""
+진행 상황 이벤트(common.progress) 동작 확인 (네트워크 불필요)
+
+- min_interval 간격으로만 이벤트 전달, close 시 finished 이벤트 한 번
+- 여러 스레드 동시 update 시 완료 수가 누락되지 않음
+- 처리 속도/남은 시간 계산과 요약 문자열
+- 이벤트 seq는 전달 순서대로 증가 (여러 스레드에서도 완료 수가 뒤로 가지 않음)
+- DetailCrawler(progress_listener=...): tqdm 출력 없이 이벤트로 진행 상황 전달, 큐 모드도 오류 수 전달
+- past/integ 큐 모드: 요청(get_html) 예외도 실패로 집계되어 오류 수에 반영
+
+실행: python test/common/progress_test.py
+"""
+import contextlib
+import io
+import os
+import sys
+import threading
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from common.progress import ProgressEvent, ProgressReporter, format_duration, format_progress
+from common.work_queue import InProcessWorkQueue
+from late.detail_crawler import DetailCrawler
+from late.models import DetailItem, ListItem
+from integ.detail_crawler import DetailCrawler as IntegDetailCrawler
+from integ.models import ListItem as IntegListItem
+from past.detail_crawler import DetailCrawler as PastDetailCrawler
+from past.models import ListItem as PastListItem
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class OfflineDetailCrawler(DetailCrawler):
+    """요청 없이 합성 상세 내용을 반환하는 DetailCrawler (idx가 7의 배수면 실패)"""
+
+    def get_detail_item(self, idx, gubun):
+        self._processed.inc()
+        if idx % 7 == 0:
+            self._failures.record(idx, gubun, "합성 실패")
+            return None
+        return DetailItem(title=f"제목 {idx}", registrant="담당", reply_date="2024-01-02",
+                          inquiry=f"질의 {idx}", answer="회답", reason=None)
+
+
+def check_throttling():
+    clock = FakeClock()
+    events = []
+    with ProgressReporter("late", "detail", total=100, listener=events.append,
+                          min_interval=0.25, clock=clock) as progress:
+        for _ in range(100):
+            clock.now += 0.01
+            progress.update()
+    # 시작 1 + 0.25초마다 1 (1초 동안 4) + 완료 1
+    assert len(events) == 6, [event.done for event in events]
+    assert events[0].done == 0 and not events[0].finished
+    assert [event.done for event in events[1:5]] == [25, 50, 75, 100]
+    assert events[-1].finished and events[-1].done == 100
+    assert abs(events[1].rate - 100.0) < 1e-6
+    assert abs(events[-1].rate - 100.0) < 1e-6
+    # close는 한 번만
+    progress.close()
+    assert len(events) == 6
+    print("간격 제한 / finished 이벤트: OK")
+
+
+def check_threads():
+    events = []
+    lock = threading.Lock()
+
+    def listener(event):
+        with lock:
+            events.append(event)
+
+    progress = ProgressReporter("past", "detail", total=64 * 1000, listener=listener, min_interval=0.001)
+    progress.start()
+
+    def worker():
+        for _ in range(1000):
+            progress.update()
+
+    threads = [threading.Thread(target=worker) for _ in range(64)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    progress.close()
+    assert events[-1].finished and events[-1].done == 64 * 1000
+    assert sum(event.finished for event in events) == 1
+    # listener는 seq 순서대로 받고, 완료 수는 줄어들지 않음
+    seqs = [event.seq for event in events]
+    assert seqs == sorted(set(seqs)), "seq가 순서대로 증가해야 함"
+    done_values = [event.done for event in events]
+    assert done_values == sorted(done_values)
+    print(f"64개 스레드 동시 update ({len(events)}개 이벤트): OK")
+
+
+def check_formatting():
+    event = ProgressEvent(unit="late", phase="detail", done=250, total=1000, rate=12.5, errors=3, elapsed=20.0)
+    assert event.fraction == 0.25
+    assert event.eta_seconds == 60.0
+    assert format_progress(event) == "250 / 1,000 (25.0%) · 12.5건/s · 남은 시간 1:00 · 오류 3"
+    finished = ProgressEvent(unit="late", phase="detail", done=1000, total=1000, rate=10.0, elapsed=3725, finished=True)
+    assert format_progress(finished) == "1,000 / 1,000 (100.0%) · 평균 10.0건/s · 소요 1:02:05"
+    unknown = ProgressEvent(unit="integ", phase="detail", done=5, total=None, rate=0.0)
+    assert unknown.eta_seconds is None
+    assert format_progress(unknown) == "5건 · 0.0건/s · 남은 시간 --:--"
+    assert format_duration(59.6) == "1:00"
+    print("진행률/남은 시간/요약 문자열: OK")
+
+
+def check_crawler():
+    items = [ListItem(rownumber=i, idx=i, gubun="법령해석", category=None, title=f"목록 {i}",
+                      regDate=f"2024-01-{i % 28 + 1:02d}", number=str(i)) for i in range(1, 301)]
+    events = []
+    crawler = OfflineDetailCrawler(delay_seconds=0, max_workers=16, progress_listener=events.append)
+    stderr = io.StringIO()
+    with contextlib.redirect_stderr(stderr):
+        df = crawler.get_combined_dataframe(items)
+    assert len(df) == len(items)
+    assert "상세 크롤링" not in stderr.getvalue(), "listener 지정 시 tqdm 출력이 없어야 함"
+    assert {(event.unit, event.phase) for event in events} == {("late", "detail")}
+    done_values = [event.done for event in events]
+    assert done_values == sorted(done_values)
+    last = events[-1]
+    assert last.finished and last.done == last.total == len(items)
+    assert last.errors == len([item for item in items if item.idx % 7 == 0])
+    print(f"DetailCrawler 진행 이벤트 ({len(events)}개, 오류 {last.errors}): OK")
+
+    # 큐 모드: 실패한 작업도 오류 수로 전달
+    events.clear()
+    work_queue = InProcessWorkQueue(max_attempts=1)
+    crawler = OfflineDetailCrawler(delay_seconds=0, max_workers=16, work_queue=work_queue,
+                                   progress_listener=events.append)
+    crawler.get_combined_dataframe(items)
+    failed = len([item for item in items if item.idx % 7 == 0])
+    last = events[-1]
+    assert last.finished and last.done == len(items) - failed
+    assert last.errors == failed, last.errors
+    assert [event.seq for event in events] == sorted(event.seq for event in events)
+    print(f"큐 모드 진행 이벤트 (오류 {last.errors}): OK")
+
+
+def check_queue_fetch_errors():
+    """past/integ 큐 모드에서 요청 예외가 오류 수로 전달되는지"""
+    def get_html(idx):
+        if idx % 5 == 0:
+            raise ConnectionError(f"합성 연결 실패 {idx}")
+        return "<html><body></body></html>"
+
+    cases = [
+        (PastDetailCrawler, [PastListItem(rownumber=i, pastreqIdx=i, pastreqType="법령해석", pastreqSubject=f"제목 {i}",
+                                          serialNum=str(i), regDate="2014-01-02") for i in range(1, 51)]),
+        (IntegDetailCrawler, [IntegListItem(rownumber=i, dataIdx=i, pastreqType="현장건의 과제", title=f"제목 {i}",
+                                            replyRegDate="2024-01-02") for i in range(1, 51)]),
+    ]
+    for crawler_class, items in cases:
+        events = []
+        crawler = crawler_class(delay_seconds=0, max_workers=8, work_queue=InProcessWorkQueue(max_attempts=1),
+                                progress_listener=events.append)
+        crawler.fetcher.get_html = get_html
+        with contextlib.redirect_stdout(io.StringIO()):
+            crawler.get_combined_dataframe(items)
+        last = events[-1]
+        assert last.finished and last.done == 40, last
+        assert last.errors == 10, (crawler_class.__module__, last.errors)
+        assert len(crawler.parser.stats.failed_items) == 10
+        assert all("합성 연결 실패" in error for _, error in crawler.parser.stats.failed_items)
+    print("past/integ 큐 모드 요청 실패 오류 수: OK")
+
+
+if __name__ == "__main__":
+    check_throttling()
+    check_threads()
+    check_formatting()
+    check_crawler()
+    check_queue_fetch_errors()
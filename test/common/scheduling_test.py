@@ -0,0 +1,123 @@
+"""
+상세 작업 우선순위 / first results 콜백(common.scheduling) 확인 (네트워크 불필요)
+
+- prioritize: 최신순 정렬, 값 없는 항목은 마지막, 같은 값은 원래 순서
+- FirstResultsNotifier: count개 도달, timeout 경과, flush(수집 완료) 중 먼저 오는 시점에 한 번 호출
+- 콜백이 없으면 결과를 모으지 않음
+- DetailCrawler: 결과가 count개보다 적어도 완료 시 중간 미리보기 전달, 작업 큐 모드도 동일
+
+실행: python test/common/scheduling_test.py
+"""
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from common.scheduling import FirstResultsNotifier, prioritize
+from common.work_queue import InProcessWorkQueue, SQLiteWorkQueue
+from late.detail_crawler import DetailCrawler
+from late.models import DetailItem, ListItem
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class OfflineDetailCrawler(DetailCrawler):
+    """요청 없이 합성 상세 내용을 반환하는 DetailCrawler"""
+
+    def get_detail_item(self, idx, gubun):
+        self._processed.inc()
+        return DetailItem(title=f"제목 {idx}", registrant="담당", reply_date="2024-01-02",
+                          inquiry=f"질의 {idx}", answer="회답", reason=None)
+
+
+def make_list_items(count):
+    return [ListItem(rownumber=i, idx=i, gubun="법령해석", category=None, title=f"목록 {i}",
+                     regDate=f"2024-01-{i % 28 + 1:02d}", number=str(i)) for i in range(1, count + 1)]
+
+
+def check_prioritize():
+    items = [SimpleNamespace(name=name, regDate=date) for name, date in
+             [("a", "2020.01.01"), ("b", None), ("c", "2024-03-01"), ("d", "2020-01-01"), ("e", "")]]
+    assert [item.name for item in prioritize(items, "regDate")] == ["c", "a", "d", "b", "e"]
+    assert [item.name for item in prioritize(items, None)] == ["a", "b", "c", "d", "e"]
+    print("우선순위 정렬: OK")
+
+
+def check_notifier():
+    calls = []
+    notifier = FirstResultsNotifier(calls.append, count=3, timeout=None)
+    for i in range(5):
+        notifier.add(i)
+    notifier.flush()
+    assert calls == [[0, 1, 2]]
+
+    # timeout: 첫 결과 후 timeout초 지나서 들어온 결과에서 호출
+    clock = FakeClock()
+    calls = []
+    notifier = FirstResultsNotifier(calls.append, count=100, timeout=5.0, clock=clock)
+    notifier.add("a")
+    clock.now = 4.9
+    notifier.add("b")
+    assert calls == []
+    clock.now = 5.0
+    notifier.add("c")
+    notifier.add("d")
+    assert calls == [["a", "b", "c"]]
+
+    # flush: count개 미만으로 끝난 경우
+    calls = []
+    notifier = FirstResultsNotifier(calls.append, count=50, timeout=None)
+    notifier.flush()
+    assert calls == [], "결과가 없으면 호출하지 않음"
+    notifier.add("x")
+    notifier.flush()
+    notifier.flush()
+    assert calls == [["x"]]
+
+    # 콜백이 없으면 모으지 않음
+    notifier = FirstResultsNotifier(None)
+    for i in range(10):
+        notifier.add(i)
+    notifier.flush()
+    assert notifier._items == []
+    print("first results 호출 시점 (count / timeout / flush / 콜백 없음): OK")
+
+
+def check_crawler_small_run():
+    frames = []
+    crawler = OfflineDetailCrawler(delay_seconds=0, max_workers=4, first_results_callback=frames.append)
+    crawler.get_combined_dataframe(make_list_items(10))
+    assert len(frames) == 1 and len(frames[0]) == 10, [len(frame) for frame in frames]
+    print("결과가 50개 미만인 실행도 완료 시 중간 미리보기: OK")
+
+
+def check_crawler_queue(work_queue):
+    frames = []
+    crawler = OfflineDetailCrawler(delay_seconds=0, max_workers=4, work_queue=work_queue,
+                                   first_results_callback=frames.append, first_results_count=5)
+    df = crawler.get_combined_dataframe(make_list_items(30))
+    assert len(df) == 30
+    assert len(frames) == 1 and len(frames[0]) == 5
+    assert list(frames[0].columns) == list(df.columns)
+
+
+if __name__ == "__main__":
+    check_prioritize()
+    check_notifier()
+    check_crawler_small_run()
+    check_crawler_queue(InProcessWorkQueue())
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = SQLiteWorkQueue(os.path.join(tmp, "queue.db"))
+        check_crawler_queue(queue)
+        queue.close()
+    print("작업 큐 모드 중간 미리보기: OK")
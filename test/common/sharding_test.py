@@ -0,0 +1,109 @@
+"""
+샤드 분할/병합(common.sharding) 동작 확인 (네트워크 불필요)
+
+- 'i/N' 형식 파싱, 잘못된 형식(0/0, 2/2, 3/2, a/b 등)은 오류
+- 고정 키 집합을 N개 샤드로 나누면 서로 겹치지 않고 전체를 덮음
+- 샤드 배정은 프로세스와 무관 (CRC32 기반, PYTHONHASHSEED가 달라도 같은 결과)
+- 샤드 pickle 저장 → merge_shards / python -m common.sharding merge 로 원래 행 복원
+
+실행: python test/common/sharding_test.py
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from common.sharding import (filter_shard, find_shard_outputs, merge_shards, parse_shard, shard_key,
+                             shard_of, write_shard_output)
+from late.config import SHARD_KEY_FIELDS
+from late.models import ListItem
+
+SHARD_COUNT = 4
+
+# 다른 프로세스에서 같은 키의 샤드 배정을 계산하는 스크립트
+ASSIGNMENT_SCRIPT = (
+    "import json, sys; sys.path.insert(0, sys.argv[1]); "
+    "from common.sharding import shard_of; "
+    "print(json.dumps([shard_of(f'법령해석|{i}', 4) for i in range(500)]))"
+)
+
+
+def make_list_items(count):
+    return [ListItem(rownumber=i, idx=1000 + i, gubun="법령해석" if i % 3 else "비조치의견서", category=None,
+                     title=f"목록 {i}", regDate=f"2024-01-{i % 28 + 1:02d}", number=str(i)) for i in range(count)]
+
+
+def check_parse():
+    assert parse_shard("0/2") == (0, 2)
+    assert parse_shard(" 3 / 4 ") == (3, 4)
+    for value in ("0/0", "2/2", "3/2", "-1/2", "a/b", "1", "", "1/2/3"):
+        try:
+            parse_shard(value)
+        except argparse.ArgumentTypeError:
+            continue
+        raise AssertionError(f"잘못된 샤드 형식이 통과됨: {value!r}")
+    print("샤드 형식 파싱 / 잘못된 형식 거부: OK")
+
+
+def check_partition(items):
+    keys = [shard_key(item, SHARD_KEY_FIELDS) for item in items]
+    assert len(set(keys)) == len(keys)
+    shards = [filter_shard(items, (index, SHARD_COUNT), SHARD_KEY_FIELDS) for index in range(SHARD_COUNT)]
+    seen = [shard_key(item, SHARD_KEY_FIELDS) for shard in shards for item in shard]
+    # 서로 겹치지 않고 전체를 덮음
+    assert len(seen) == len(set(seen)) == len(keys)
+    assert set(seen) == set(keys)
+    assert all(shards), [len(shard) for shard in shards]
+    assert filter_shard(items, None, SHARD_KEY_FIELDS) == items
+    print(f"샤드 분할 ({len(items)}개 → {[len(shard) for shard in shards]}): OK")
+
+
+def check_cross_process():
+    expected = [shard_of(f"법령해석|{i}", SHARD_COUNT) for i in range(500)]
+    for seed in ("0", "12345"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        output = subprocess.run([sys.executable, "-c", ASSIGNMENT_SCRIPT, ROOT_DIR], env=env,
+                                capture_output=True, text=True, check=True).stdout
+        assert json.loads(output) == expected, f"PYTHONHASHSEED={seed}에서 샤드 배정이 다름"
+    print("프로세스 간 같은 샤드 배정: OK")
+
+
+def check_merge(items, shard_dir):
+    frame = pd.DataFrame([{**dict(zip(ListItem.columns(), item.to_row())), "answer": f"회답 {item.idx}"}
+                          for item in items])
+    for index in range(SHARD_COUNT):
+        shard_items = filter_shard(items, (index, SHARD_COUNT), SHARD_KEY_FIELDS)
+        shard_idx = {item.idx for item in shard_items}
+        write_shard_output(frame[frame["idx"].isin(shard_idx)], shard_dir, "late", (index, SHARD_COUNT))
+
+    paths = find_shard_outputs(shard_dir, "late")
+    assert [path.name for path in paths] == [f"late_shard_{i}_of_{SHARD_COUNT}.pkl" for i in range(SHARD_COUNT)]
+    merged = merge_shards(paths, SHARD_KEY_FIELDS)
+    pd.testing.assert_frame_equal(merged, frame)
+
+    # 같은 샤드 결과가 두 번 있어도 키 기준으로 한 번만
+    pd.testing.assert_frame_equal(merge_shards(paths + paths[:1], SHARD_KEY_FIELDS), frame)
+
+    # 명령행 병합
+    output = os.path.join(shard_dir, "merged.pkl")
+    subprocess.run([sys.executable, "-m", "common.sharding", "merge", "late", "--shard-dir", shard_dir,
+                    "--output", output], cwd=ROOT_DIR, capture_output=True, check=True)
+    pd.testing.assert_frame_equal(pd.read_pickle(output), frame)
+    print(f"샤드 결과 병합 ({len(paths)}개 파일 → {len(frame)}행, 명령행 포함): OK")
+
+
+if __name__ == "__main__":
+    items = make_list_items(1_000)
+    check_parse()
+    check_partition(items)
+    check_cross_process()
+    with tempfile.TemporaryDirectory() as tmp:
+        check_merge(items, tmp)
@@ -0,0 +1,182 @@
+"""
+JSONL sink(common.sinks) 동작 확인 (네트워크 불필요)
+
+- flush_items/flush_seconds 기준 배치 기록, 기록된 줄은 바로 다른 reader에서 읽힘 (tail)
+- flush_seconds는 다음 write 없이도 타이머 스레드가 기록 (close 시 타이머 종료)
+- 여러 스레드 동시 write 시 줄이 섞이지 않음
+- DetailCrawler(sink=..., keep_results=False): 결과를 메모리에 모으지 않고 sink에만 기록
+- iter_jsonl_chunks 로 다시 읽으면 get_combined_dataframe 결과와 같음
+- main(jsonl_path=..., keep_results=False) / --no-keep: 결과를 메모리에 모으지 않음, jsonl_path 없이 지정하면 오류
+- 작업 큐 모드도 keep_results=False면 큐의 완료 결과를 다시 읽지 않고 빈 데이터프레임 반환
+
+실행: python test/common/sinks_test.py
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import late.main
+from common.sinks import JsonlSink, iter_jsonl, iter_jsonl_chunks
+from common.work_queue import InProcessWorkQueue
+from late.detail_crawler import DetailCrawler
+from late.models import CombinedItem, DetailItem, ListItem
+
+
+class OfflineDetailCrawler(DetailCrawler):
+    """요청 없이 합성 상세 내용을 반환하는 DetailCrawler"""
+
+    def get_detail_item(self, idx, gubun):
+        self._processed.inc()
+        return DetailItem(title=f"제목 {idx}", registrant="담당", reply_date="2024-01-02",
+                          inquiry=f"질의 {idx} \"따옴표\"\n줄바꿈", answer="회답", reason=None)
+
+
+def make_list_items(count):
+    return [ListItem(rownumber=i, idx=i, gubun="법령해석", category=None, title=f"목록 {i}",
+                     regDate=f"2024-01-{i % 28 + 1:02d}", number=str(i)) for i in range(count)]
+
+
+def count_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for _ in f)
+
+
+def check_batching(path):
+    """flush_items마다 기록, 그 전에는 버퍼에만 존재"""
+    sink = JsonlSink(path, flush_items=10, flush_seconds=60)
+    for i in range(9):
+        sink.write({"idx": i})
+    assert count_lines(path) == 0
+    sink.write({"idx": 9})
+    assert count_lines(path) == 10, "flush_items 도달 시 바로 기록되어야 함"
+    sink.write({"idx": 10})
+    sink.flush()
+    assert [row["idx"] for row in iter_jsonl(path)] == list(range(11))
+    sink.close()
+    sink.close()
+
+    # flush_seconds 경과 후 다음 write가 없어도 타이머가 기록
+    with JsonlSink(path, flush_items=1000, flush_seconds=0.05, append=False) as sink:
+        sink.write({"idx": 0})
+        time.sleep(0.2)
+        assert count_lines(path) == 1, "다음 write 없이도 flush_seconds 후 기록되어야 함"
+        sink.write({"idx": 1})
+        time.sleep(0.2)
+        assert count_lines(path) == 2
+    assert not sink._timer.is_alive()
+
+
+def check_threads(path):
+    """여러 스레드 동시 write"""
+    with JsonlSink(path, flush_items=7, append=False) as sink:
+        def worker(offset):
+            for i in range(500):
+                sink.write({"idx": offset + i, "text": "가" * (i % 50)})
+        threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    rows = list(iter_jsonl(path))
+    assert len(rows) == 4000 and len({row["idx"] for row in rows}) == 4000
+
+
+def check_partial_line(path):
+    """기록 중인 마지막 미완성 줄은 읽지 않음"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"idx": 1}) + "\n" + '{"idx": ')
+    assert list(iter_jsonl(path)) == [{"idx": 1}]
+
+
+def check_main_no_keep(path):
+    """late.main: keep_results=False는 JSONL에만 기록, --no-keep 인자"""
+    list_items = make_list_items(50)
+
+    class OfflineListCrawler:
+        def __init__(self, batch_size=None, max_items=None, cancel_token=None):
+            pass
+
+        def get_list_items(self, start_date=None, end_date=None):
+            return list(list_items)
+
+    late.main.ListCrawler = OfflineListCrawler
+    late.main.DetailCrawler = OfflineDetailCrawler
+    result = late.main.main(delay=0, max_workers=4, jsonl_path=path, keep_results=False)
+    assert result.empty
+    assert count_lines(path) == len(list_items)
+    try:
+        late.main.main(keep_results=False)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("jsonl_path 없이 keep_results=False면 ValueError가 나야 함")
+
+    argv = sys.argv
+    try:
+        sys.argv = ["late.main", "--jsonl", path, "--no-keep"]
+        assert late.main.parse_args().keep_results is False
+        sys.argv = ["late.main"]
+        assert late.main.parse_args().keep_results is True
+    finally:
+        sys.argv = argv
+
+
+def check_queue_no_keep(path):
+    """작업 큐 모드 + keep_results=False: 결과는 sink에만, 큐 결과를 메모리로 읽지 않음"""
+    list_items = make_list_items(200)
+    work_queue = InProcessWorkQueue()
+
+    def results():
+        raise AssertionError("keep_results=False면 큐의 완료 결과를 읽지 않아야 함")
+
+    work_queue.results = results
+    with JsonlSink(path, append=False) as sink:
+        crawler = OfflineDetailCrawler(delay_seconds=0, max_workers=4, work_queue=work_queue,
+                                       sink=sink, keep_results=False)
+        streamed = crawler.get_combined_dataframe(list_items)
+    assert streamed.empty and list(streamed.columns) == list(CombinedItem.columns())
+    assert sorted(row["idx"] for row in iter_jsonl(path)) == [item.idx for item in list_items]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        check_batching(os.path.join(tmp, "batch.jsonl"))
+        print("배치 기록 / 타이머 기록: OK")
+
+        check_threads(os.path.join(tmp, "threads.jsonl"))
+        print("여러 스레드 동시 기록: OK")
+
+        check_partial_line(os.path.join(tmp, "partial.jsonl"))
+        print("미완성 줄 건너뜀: OK")
+
+        list_items = make_list_items(1_000)
+        expected = OfflineDetailCrawler(delay_seconds=0, max_workers=4).get_combined_dataframe(list_items)
+
+        path = os.path.join(tmp, "late_items.jsonl")
+        with JsonlSink(path) as sink:
+            crawler = OfflineDetailCrawler(delay_seconds=0, max_workers=4, sink=sink, keep_results=False)
+            streamed = crawler.get_combined_dataframe(list_items)
+            # 크롤링이 끝나면 sink를 닫기 전에도 모든 항목이 파일에 있음
+            assert count_lines(path) == len(list_items)
+        assert streamed.empty
+
+        chunks = list(iter_jsonl_chunks(path, chunk_size=300, record_class=CombinedItem))
+        assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+        loaded = pd.concat(chunks, ignore_index=True).sort_values("idx", ignore_index=True)
+        pd.testing.assert_frame_equal(loaded, expected.sort_values("idx", ignore_index=True))
+        print(f"DetailCrawler sink 기록 ({len(list_items)}건, keep_results=False) 및 청크 읽기: OK")
+
+        check_main_no_keep(os.path.join(tmp, "main_items.jsonl"))
+        print("main(keep_results=False) / --no-keep: OK")
+
+        check_queue_no_keep(os.path.join(tmp, "queue_items.jsonl"))
+        print("작업 큐 모드 keep_results=False: OK")
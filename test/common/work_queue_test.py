@@ -0,0 +1,155 @@
+"""
+작업 큐(common.work_queue) 동작 확인 (네트워크 불필요)
+
+임시 SQLite 파일을 로컬 broker로 사용하여
+등록/처리/재시도/lease 만료 후 재할당과 InProcess 큐와의 결과 일치를 확인한다.
+
+실행: python test/common/work_queue_test.py
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from common.cancellation import CancellationToken
+from common.work_queue import InProcessWorkQueue, SQLiteWorkQueue, run_workers
+
+
+def make_jobs(count):
+    return [(f"job-{i}", {"idx": i}) for i in range(count)]
+
+
+def square(payload):
+    return {"idx": payload["idx"], "value": payload["idx"] ** 2}
+
+
+def check_basic(work_queue):
+    """등록 → 처리 → 결과 수집, 중복 등록 무시"""
+    assert work_queue.put(make_jobs(50)) == 50
+    assert work_queue.put(make_jobs(10)) == 0, "같은 job_id는 다시 등록되지 않아야 함"
+
+    done = run_workers(work_queue, square, worker_count=4, poll_interval=0.05)
+    assert done == 50, done
+    assert work_queue.unfinished_count() == 0
+    results = sorted(work_queue.results(), key=lambda r: r["idx"])
+    assert [r["value"] for r in results] == [i ** 2 for i in range(50)]
+    return results
+
+
+def check_retry(work_queue):
+    """max_attempts 만큼 실패하면 failed로 남음"""
+    attempts = {}
+    lock = threading.Lock()
+
+    def flaky(payload):
+        with lock:
+            attempts[payload["idx"]] = attempts.get(payload["idx"], 0) + 1
+            count = attempts[payload["idx"]]
+        if payload["idx"] == 0:
+            raise RuntimeError("항상 실패")
+        if payload["idx"] == 1 and count < 2:
+            raise RuntimeError("첫 시도만 실패")
+        return square(payload)
+
+    work_queue.put(make_jobs(3))
+    run_workers(work_queue, flaky, worker_count=2, poll_interval=0.05)
+
+    failed = work_queue.failed()
+    assert len(failed) == 1 and failed[0][0] == {"idx": 0}, failed
+    assert attempts[0] == 3, attempts
+    assert sorted(r["idx"] for r in work_queue.results()) == [1, 2]
+
+
+def check_lease_takeover(path):
+    """작업을 가져간 worker가 죽으면 lease 만료 후 다른 worker가 처리"""
+    dead_queue = SQLiteWorkQueue(path, lease_seconds=0.5)
+    dead_queue.put(make_jobs(5))
+    job = dead_queue.get("dead-worker")
+    assert job is not None
+    dead_queue.close()  # ack 없이 종료 (프로세스 종료 상황)
+
+    live_queue = SQLiteWorkQueue(path, lease_seconds=0.5)
+    start = time.perf_counter()
+    done = run_workers(live_queue, square, worker_count=2, poll_interval=0.1, worker_id="live")
+    elapsed = time.perf_counter() - start
+    assert done == 5, done
+    assert live_queue.unfinished_count() == 0
+    assert elapsed >= 0.4, "lease가 만료되기 전에 재할당되면 안 됨"
+    live_queue.close()
+
+
+def check_cancel(work_queue):
+    """취소 시 남은 작업은 큐에 그대로 남음"""
+    token = CancellationToken()
+
+    def slow(payload):
+        if payload["idx"] == 3:
+            token.cancel()
+        return square(payload)
+
+    work_queue.put(make_jobs(20))
+    done = run_workers(work_queue, slow, worker_count=1, cancel_token=token, poll_interval=0.05)
+    assert done < 20 and work_queue.unfinished_count() == 20 - done, (done, work_queue.unfinished_count())
+
+
+def check_late_ack(work_queue):
+    """lease 만료 후 늦게 도착한 ack: 결과로 인정하고 작업을 다시 실행하지 않음, 완료 결과는 덮어쓰지 않음"""
+    work_queue.put(make_jobs(1))
+    job = work_queue.get("slow-worker")
+    time.sleep(0.15)  # lease 만료
+    work_queue.ack(job.job_id, {"idx": 0, "value": "late"})
+    assert work_queue.get("other-worker") is None, "늦은 ack 후 같은 작업이 다시 실행되면 안 됨"
+    assert work_queue.unfinished_count() == 0
+    work_queue.ack(job.job_id, {"idx": 0, "value": "duplicate"})
+    assert work_queue.results() == [{"idx": 0, "value": "late"}]
+
+
+def check_close_connections(path):
+    """close()는 worker 스레드에서 만든 연결까지 모두 닫음"""
+    work_queue = SQLiteWorkQueue(path)
+    work_queue.put(make_jobs(40))
+    run_workers(work_queue, square, worker_count=4, poll_interval=0.05)
+    connections = list(work_queue._connections)
+    assert len(connections) >= 2, "worker 스레드별 연결이 만들어져야 함"
+    work_queue.close()
+    for conn in connections:
+        try:
+            conn.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            continue
+        raise AssertionError("닫히지 않은 연결이 있음")
+    # 닫은 뒤에도 다시 사용하면 새 연결로 동작
+    assert work_queue.unfinished_count() == 0
+    work_queue.close()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite_results = check_basic(SQLiteWorkQueue(os.path.join(tmp, "basic.db")))
+        memory_results = check_basic(InProcessWorkQueue())
+        assert sqlite_results == memory_results
+        print("등록/처리: OK")
+
+        check_retry(SQLiteWorkQueue(os.path.join(tmp, "retry.db")))
+        check_retry(InProcessWorkQueue())
+        print("재시도/실패 기록: OK")
+
+        check_lease_takeover(os.path.join(tmp, "lease.db"))
+        print("lease 만료 후 재할당: OK")
+
+        check_cancel(SQLiteWorkQueue(os.path.join(tmp, "cancel.db")))
+        check_cancel(InProcessWorkQueue())
+        print("취소: OK")
+
+        check_late_ack(SQLiteWorkQueue(os.path.join(tmp, "late_ack.db"), lease_seconds=0.1))
+        check_late_ack(InProcessWorkQueue(lease_seconds=0.1))
+        print("lease 만료 후 늦은 ack: OK")
+
+        check_close_connections(os.path.join(tmp, "close.db"))
+        print("close 시 모든 스레드 연결 정리: OK")
@@ -0,0 +1,87 @@
+"""
+Excel 스트리밍 내보내기 확인 및 기존 방식(df.to_excel) 비교 (합성 데이터, 네트워크 불필요, openpyxl 필요)
+
+- 32,767자를 넘는 셀은 항상 같은 방식으로 잘려 한도 이내로 기록
+- 다시 읽은 값이 원본과 같음 (잘린 셀 제외)
+- 소요 시간 / 최대 메모리(tracemalloc) 비교 (manifest 해시 계산은 제외하고 Excel 기록만 측정)
+- 스트리밍 최대 메모리는 행 수와 무관한 상한(STREAMING_PEAK_LIMIT_MIB) 이내, 기존 방식보다 작아야 함
+
+실행: python test/exporter/excel_test.py [전체 행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+from openpyxl import load_workbook
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "test", "harmonizer"))
+
+from bench_harmonizer import make_corpus
+from exporter.excel import EXCEL_MAX_CELL_CHARS, TRUNCATION_MARKER, truncate_cell_text
+from exporter.exporter import Exporter
+from harmonizer.main import Harmonizer
+
+# 스트리밍 기록의 최대 메모리 상한 (10,000행에서 약 3~8MiB, 행 수가 늘어도 비슷함)
+STREAMING_PEAK_LIMIT_MIB = 16
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 2 ** 20
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    result = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df).run()
+
+    # 한도를 넘는 긴 본문 2건
+    long_text = "가" * (EXCEL_MAX_CELL_CHARS + 10)
+    result["회답"] = result["회답"].astype(object)
+    result.loc[[0, 5], "회답"] = [long_text, long_text + "나"]
+
+    # 잘림 규칙: 한도 이내, 같은 입력이면 같은 결과
+    truncated = truncate_cell_text(long_text)
+    assert len(truncated) == EXCEL_MAX_CELL_CHARS and truncated.endswith(TRUNCATION_MARKER)
+    assert truncate_cell_text(long_text + "나") == truncated
+    assert truncate_cell_text("짧은 본문") == "짧은 본문"
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        streaming_dir = os.path.join(tmp_dir, "streaming")
+        legacy_dir = os.path.join(tmp_dir, "legacy")
+
+        streaming = measure(lambda: Exporter(result, streaming_dir, "excel", manifest=False).export())
+        legacy = measure(lambda: Exporter(result, legacy_dir, "excel", excel_streaming=False,
+                                         manifest=False).export())
+
+        sheet = load_workbook(os.path.join(streaming_dir, "db_i.xlsx"), read_only=True).active
+        rows = list(sheet.iter_rows(values_only=True))
+        header, body = list(rows[0]), rows[1:]
+        assert header == list(result.columns)
+        assert len(body) == len(result)
+
+        answer = header.index("회답")
+        assert body[0][answer] == truncated and body[5][answer] == truncated
+        title = header.index("제목")
+        assert [row[title] for row in body] == result["제목"].tolist()
+        assert [row[header.index("id")] for row in body] == result["id"].tolist()
+        dates = [row[header.index("회신일자")] for row in body]
+        assert [d.date() if d else None for d in dates] == [d.date() if pd.notna(d) else None for d in result["회신일자"]]
+
+    print(f"{len(result)}행, 한도 초과 셀 2개 잘림 및 값 일치: OK")
+    print(f"df.to_excel      : {legacy[0]:.2f}초, 최대 {legacy[1]:.1f}MiB")
+    print(f"write-only 스트림: {streaming[0]:.2f}초, 최대 {streaming[1]:.1f}MiB")
+    assert streaming[1] < STREAMING_PEAK_LIMIT_MIB, f"스트리밍 최대 메모리 {streaming[1]:.1f}MiB"
+    assert streaming[1] < legacy[1], (streaming[1], legacy[1])
+    print(f"스트리밍 최대 메모리 {STREAMING_PEAK_LIMIT_MIB}MiB 이내: OK")
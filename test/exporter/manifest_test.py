@@ -0,0 +1,131 @@
+"""
+내보내기 manifest 확인 (합성 데이터, 네트워크 불필요, pyarrow/openpyxl 필요)
+
+- {output_name}.manifest.json: 행 수, 스키마, 내용 해시(전체/소스별), 크롤링 파라미터, 파일 목록
+- 같은 데이터를 다시 내보내면 파일/manifest 모두 그대로 (mtime 유지)
+- 내용이 바뀌면 다시 쓰고, 바뀐 소스의 해시만 달라짐
+- 파일이 지워졌거나 크기/sha256이 다르면 다시 씀 (수정 시각만 바뀐 파일은 그대로), 크롤링 파라미터만 바뀌면 manifest만 갱신
+- GUI 결과(build_preview_dataframe)도 source 컬럼이 있어 소스별 해시 기록
+
+실행: python test/exporter/manifest_test.py [전체 행 수]
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "test", "harmonizer"))
+
+from bench_harmonizer import make_corpus
+from exporter.exporter import Exporter
+from exporter.manifest import content_hashes, read_manifest
+from gui.services import build_preview_dataframe
+from harmonizer.main import Harmonizer
+
+PARAMS = {"start_date": "2000-01-01", "end_date": "2025-12-31", "max_workers": 64, "delay": 0.2}
+
+
+def mtimes(directory: str) -> dict:
+    return {name: os.stat(os.path.join(directory, name)).st_mtime_ns for name in sorted(os.listdir(directory))}
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    result = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df, keep_source=True).run()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 1) 첫 내보내기: manifest 기록
+        start = time.perf_counter()
+        Exporter(result, tmp_dir, "pickle,excel", crawl_params=PARAMS).export()
+        first_seconds = time.perf_counter() - start
+        manifest = read_manifest(tmp_dir, "db_i")
+        assert manifest["row_count"] == len(result)
+        assert [column["name"] for column in manifest["schema"]] == list(result.columns)
+        assert sorted(manifest["sources"]) == ["integ", "late", "past"]
+        assert sum(source["rows"] for source in manifest["sources"].values()) == len(result)
+        assert manifest["crawl_params"] == PARAMS
+        pickle_path = os.path.join(tmp_dir, "db_i.pkl")
+        with open(pickle_path, "rb") as f:
+            pickle_hash = "sha256:" + hashlib.sha256(f.read()).hexdigest()
+        pickle_stat = os.stat(pickle_path)
+        assert manifest["files"]["pickle"] == {"path": "db_i.pkl", "bytes": pickle_stat.st_size,
+                                               "mtime_ns": pickle_stat.st_mtime_ns, "sha256": pickle_hash}
+        print("manifest 기록: OK")
+
+        # 2) 같은 데이터 다시 내보내기 → 아무것도 쓰지 않음 (복사본도 같은 해시)
+        before = mtimes(tmp_dir)
+        start = time.perf_counter()
+        paths = Exporter(result.copy(), tmp_dir, "pickle,excel", crawl_params=PARAMS).export()
+        skip_seconds = time.perf_counter() - start
+        assert [p.name for p in paths] == ["db_i.pkl", "db_i.xlsx"]
+        assert mtimes(tmp_dir) == before
+        print(f"변경 없는 재내보내기 건너뜀 ({first_seconds:.2f}초 → {skip_seconds:.2f}초): OK")
+
+        # 3) 크롤링 파라미터만 변경 → manifest만 갱신
+        Exporter(result, tmp_dir, "pickle,excel", crawl_params={**PARAMS, "delay": 0.5}).export()
+        after = mtimes(tmp_dir)
+        assert after["db_i.pkl"] == before["db_i.pkl"] and after["db_i.xlsx"] == before["db_i.xlsx"]
+        assert read_manifest(tmp_dir, "db_i")["crawl_params"]["delay"] == 0.5
+        print("크롤링 파라미터만 변경 시 manifest만 갱신: OK")
+
+        # 4) 새 형식 추가 → 새 형식만 기록, 기존 파일 정보 유지
+        Exporter(result, tmp_dir, "pickle,jsonl", crawl_params=PARAMS).export()
+        after = mtimes(tmp_dir)
+        assert after["db_i.pkl"] == before["db_i.pkl"]
+        assert sorted(read_manifest(tmp_dir, "db_i")["files"]) == ["excel", "jsonl", "pickle"]
+        print("새 형식만 기록: OK")
+
+        # 5) 파일 삭제 → 다시 기록
+        os.remove(os.path.join(tmp_dir, "db_i.xlsx"))
+        Exporter(result, tmp_dir, "excel", crawl_params=PARAMS).export()
+        assert os.path.exists(os.path.join(tmp_dir, "db_i.xlsx"))
+        print("삭제된 파일 다시 기록: OK")
+
+        # 5-1) 수정 시각만 바뀜 → 그대로, 크기가 같고 내용이 바뀜 → 다시 기록
+        before = mtimes(tmp_dir)
+        touched = before["db_i.pkl"] + 5_000_000_000
+        os.utime(pickle_path, ns=(touched, touched))
+        Exporter(result, tmp_dir, "pickle", crawl_params=PARAMS).export()
+        assert mtimes(tmp_dir)["db_i.pkl"] == touched
+        with open(pickle_path, "r+b") as f:
+            f.seek(-1, os.SEEK_END)
+            last = f.read(1)
+            f.seek(-1, os.SEEK_END)
+            f.write(bytes([last[0] ^ 0xFF]))
+        assert os.path.getsize(pickle_path) == pickle_stat.st_size
+        Exporter(result, tmp_dir, "pickle", crawl_params=PARAMS).export()
+        with open(pickle_path, "rb") as f:
+            assert "sha256:" + hashlib.sha256(f.read()).hexdigest() == pickle_hash
+        print("수정 시각만 바뀐 파일 유지 / 크기가 같은 변경 파일 다시 기록: OK")
+
+        # 6) late 소스 한 행만 변경 → 다시 기록, late 해시만 달라짐
+        changed = result.copy()
+        row = changed.index[changed["source"] == "late"][0]
+        changed.loc[row, "제목"] = "변경된 제목"
+        old_manifest = read_manifest(tmp_dir, "db_i")
+        Exporter(changed, tmp_dir, "pickle", crawl_params=PARAMS).export()
+        new_manifest = read_manifest(tmp_dir, "db_i")
+        assert new_manifest["content_hash"] != old_manifest["content_hash"]
+        assert mtimes(tmp_dir)["db_i.pkl"] != before["db_i.pkl"]
+        for source in ("past", "integ"):
+            assert new_manifest["sources"][source] == old_manifest["sources"][source]
+        assert new_manifest["sources"]["late"]["hash"] != old_manifest["sources"]["late"]["hash"]
+        # 이전 내용으로 저장된 다른 형식 파일은 manifest에서 제외
+        assert list(new_manifest["files"]) == ["pickle"]
+        print("내용 변경 시 다시 기록 / 소스별 해시: OK")
+
+    # 7) GUI 내보내기 경로: build_preview_dataframe 결과도 소스별 해시
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        gui_result = build_preview_dataframe(past_df, late_df, integ_df)
+        Exporter(gui_result, tmp_dir, "pickle", crawl_params=PARAMS).export()
+        assert sorted(read_manifest(tmp_dir, "db_i")["sources"]) == ["integ", "late", "past"]
+        print("GUI 결과 소스별 해시: OK")
+
+    start = time.perf_counter()
+    content_hashes(result)
+    print(f"내용 해시 계산: {(time.perf_counter() - start) * 1000:.0f}ms ({len(result)}행)")
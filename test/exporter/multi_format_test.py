@@ -0,0 +1,118 @@
+"""
+여러 형식 동시 내보내기 확인 (합성 데이터, 네트워크 불필요, pyarrow/openpyxl 필요)
+
+- format_choice(1=pickle, 2=excel, 3=js(JSONL), 4=all) / export_format('all', 'pickle,parquet', ['Pickle', 'PARQUET']) 반영
+- 한 형식만 저장해도 다른 형식 파일은 삭제하지 않음
+- 저장 실패 시 기존 파일 유지, 임시 파일 남지 않음
+- 형식별 순차 저장 대비 동시 저장 소요 시간
+
+실행: python test/exporter/multi_format_test.py [전체 행 수]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from openpyxl import load_workbook
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "test", "harmonizer"))
+
+from bench_harmonizer import make_corpus
+from exporter.exporter import EXPORT_FORMATS, Exporter, resolve_formats
+from harmonizer.main import Harmonizer
+
+
+class FailingFrame:
+    """일부만 기록한 뒤 실패하는 DataFrame 대역 (저장 중 오류 재현용)"""
+
+    def to_json(self, path, **kwargs):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"id": 1')
+        raise OSError("디스크 공간 부족 (테스트)")
+
+
+def listing(directory: str) -> list:
+    return sorted(os.listdir(directory))
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    result = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df).run()
+
+    assert resolve_formats("all") == tuple(EXPORT_FORMATS)
+    assert resolve_formats("pickle, parquet") == ("pickle", "parquet")
+    assert resolve_formats("js") == ("jsonl",)
+    try:
+        resolve_formats("csv")
+        raise AssertionError("지원하지 않는 형식이 허용됨")
+    except ValueError:
+        pass
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 1) format_choice=4: 모든 형식 저장
+        start = time.perf_counter()
+        paths = Exporter(result, tmp_dir, "pickle").export(format_choice=4)
+        parallel_seconds = time.perf_counter() - start
+        assert listing(tmp_dir) == ["db_i.db", "db_i.jsonl", "db_i.manifest.json", "db_i.parquet", "db_i.pkl", "db_i.xlsx"], listing(tmp_dir)
+        assert [p.name for p in paths] == ["db_i.pkl", "db_i.xlsx", "db_i.parquet", "db_i.jsonl", "db_i.db"]
+
+        pd.testing.assert_frame_equal(pd.read_pickle(os.path.join(tmp_dir, "db_i.pkl")), result)
+        assert len(pd.read_parquet(os.path.join(tmp_dir, "db_i.parquet"))) == len(result)
+        with open(os.path.join(tmp_dir, "db_i.jsonl"), encoding="utf-8") as f:
+            lines = f.readlines()
+        assert len(lines) == len(result)
+        first = json.loads(lines[0])
+        assert first["id"] == 1 and first["제목"] == result["제목"].iloc[0]
+        sheet = load_workbook(os.path.join(tmp_dir, "db_i.xlsx"), read_only=True).active
+        assert sum(1 for _ in sheet.iter_rows(values_only=True)) == len(result) + 1
+        print(f"format_choice=4 → {', '.join(p.name for p in paths)}: OK")
+
+        # 순차 저장 시간 비교
+        start = time.perf_counter()
+        for fmt in EXPORT_FORMATS:
+            Exporter(result, tmp_dir, fmt, skip_unchanged=False).export()
+        sequential_seconds = time.perf_counter() - start
+
+        # 2) 한 형식만 저장해도 다른 형식 파일 유지
+        before = os.path.getmtime(os.path.join(tmp_dir, "db_i.pkl"))
+        Exporter(result, tmp_dir, "excel", skip_unchanged=False).export()
+        assert os.path.getmtime(os.path.join(tmp_dir, "db_i.pkl")) == before
+        assert listing(tmp_dir) == ["db_i.db", "db_i.jsonl", "db_i.manifest.json", "db_i.parquet", "db_i.pkl", "db_i.xlsx"]
+        assert [p.name for p in Exporter(result, tmp_dir, "pickle").export(format_choice=3)] == ["db_i.jsonl"]
+        print("단일 형식 저장 시 다른 형식 파일 유지: OK")
+
+        # 형식 목록 (대소문자 무관, 문자열과 같은 결과)
+        for export_format in (["Pickle", "PARQUET"], ("pickle", "Parquet"), "PICKLE,parquet"):
+            exporter = Exporter(result, tmp_dir, export_format)
+            assert resolve_formats(exporter.export_format) == ("pickle", "parquet")
+            assert [p.name for p in exporter.export()] == ["db_i.pkl", "db_i.parquet"]
+        print("형식 목록 / 대소문자 지정: OK")
+
+        # 3) 저장 실패 시 기존 파일 유지 + 임시 파일 정리
+        size_before = os.path.getsize(os.path.join(tmp_dir, "db_i.jsonl"))
+        exporter = Exporter(result, tmp_dir, "jsonl", manifest=False)
+        exporter.df = FailingFrame()
+        try:
+            exporter.export()
+            raise AssertionError("저장 실패가 발생하지 않음")
+        except OSError:
+            pass
+        assert os.path.getsize(os.path.join(tmp_dir, "db_i.jsonl")) == size_before
+        assert listing(tmp_dir) == ["db_i.db", "db_i.jsonl", "db_i.manifest.json", "db_i.parquet", "db_i.pkl", "db_i.xlsx"], listing(tmp_dir)
+        print("저장 실패 시 기존 파일 유지, 임시 파일 없음: OK")
+
+        # 4) 파티션 디렉토리 교체
+        keep_source = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df, keep_source=True).run()
+        for _ in range(2):
+            Exporter(keep_source, tmp_dir, "parquet", partition_by=("source",), skip_unchanged=False).export()
+        assert sorted(os.listdir(os.path.join(tmp_dir, "db_i_parquet"))) == ["source=integ", "source=late", "source=past"]
+        assert not [name for name in listing(tmp_dir) if name.startswith(".")]
+        print("파티션 디렉토리 교체: OK")
+
+    print(f"형식별 순차 저장 {sequential_seconds:.2f}초 / 동시 저장 {parallel_seconds:.2f}초 ({len(result)}행)")
@@ -0,0 +1,112 @@
+"""
+Parquet 내보내기 확인 (합성 데이터, 네트워크 불필요, pyarrow 필요)
+
+- Exporter(export_format='parquet'): zstd 압축, 다시 읽으면 같은 값/dtype
+- ParquetStreamWriter: Harmonizer.run_chunked 출력 청크 / CombinedItem 항목 스트림을 row group 단위로 기록
+- 파티션(source/year) 저장 후 연도 조건 읽기 시 해당 파티션 파일만 읽는지 확인
+- Harmonizer.run() 결과 파티션: source 없는 결과는 저장 전에 ValueError, GUI 결과(build_preview_dataframe)는 source 유지
+
+실행: python test/exporter/parquet_test.py [전체 행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "test", "harmonizer"))
+
+from bench_harmonizer import make_corpus
+from exporter.exporter import Exporter
+from exporter.parquet import ParquetStreamWriter
+from gui.services import build_preview_dataframe
+from harmonizer.main import Harmonizer
+from late.models import CombinedItem
+
+
+def split(df: pd.DataFrame, size: int):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    result = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df, keep_source=True).run()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 1) 단일 파일 (zstd)
+        Exporter(result, tmp_dir, "parquet", "db_i").export()
+        Exporter(result, tmp_dir, "pickle", "db_i").export()
+        parquet_path = os.path.join(tmp_dir, "db_i.parquet")
+        metadata = pq.ParquetFile(parquet_path).metadata
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+        loaded = pd.read_parquet(parquet_path)
+        pd.testing.assert_frame_equal(loaded, result, check_dtype=False, check_categorical=False)
+        assert isinstance(loaded["구분"].dtype, pd.CategoricalDtype)
+        print(f"단일 파일: {len(loaded)}행, row group {metadata.num_row_groups}개, "
+              f"{os.path.getsize(parquet_path) / 2**20:.1f}MiB (pickle {os.path.getsize(os.path.join(tmp_dir, 'db_i.pkl')) / 2**20:.1f}MiB): OK")
+
+        # 2) 청크 스트림 → row group 이어 쓰기
+        stream_path = os.path.join(tmp_dir, "stream.parquet")
+        harmonizer = Harmonizer(past_df=None, late_df=None, integ_df=None, keep_source=True)
+        with ParquetStreamWriter(stream_path, row_group_size=4_000) as writer:
+            for chunk in harmonizer.run_chunked(split(past_df, 3_000), split(late_df, 3_000),
+                                                split(integ_df, 3_000), chunk_size=4_000):
+                writer.write_frame(chunk)
+        assert pq.ParquetFile(stream_path).metadata.num_row_groups == -(-len(result) // 4_000)
+        pd.testing.assert_frame_equal(pd.read_parquet(stream_path), loaded)
+        print("run_chunked 청크 스트림 기록: OK")
+
+        # 3) 항목 스트림 (CombinedItem) → row_group_size마다 기록
+        items_path = os.path.join(tmp_dir, "items.parquet")
+        columns = list(CombinedItem.columns())
+        items = (CombinedItem(*row) for row in late_df[columns].itertuples(index=False, name=None))
+        with ParquetStreamWriter(items_path, row_group_size=5_000) as writer:
+            writer.write_items(items, CombinedItem)
+        items_loaded = pd.read_parquet(items_path)
+        assert pq.ParquetFile(items_path).metadata.num_row_groups == -(-len(late_df) // 5_000)
+        assert items_loaded["idx"].tolist() == late_df["idx"].tolist()
+        assert items_loaded["answer"].fillna("").tolist() == late_df["answer"].fillna("").tolist()
+        print("CombinedItem 항목 스트림 기록: OK")
+
+        # 4) source/year 파티션 + 연도 조건 읽기
+        Exporter(result, tmp_dir, "parquet", "db_i", partition_by=("source", "year")).export()
+        dataset = ds.dataset(os.path.join(tmp_dir, "db_i_parquet"), format="parquet", partitioning="hive")
+        all_files = len(dataset.files)
+        condition = (ds.field("year") == 2020) & (ds.field("source") == "late")
+        pruned_files = len(list(dataset.get_fragments(filter=condition)))
+        start = time.perf_counter()
+        subset = dataset.to_table(filter=condition).to_pandas()
+        seconds = time.perf_counter() - start
+
+        expected = result[(result["회신일자"].dt.year == 2020) & (result["source"] == "late")]
+        assert len(subset) == len(expected) > 0
+        assert sorted(subset["id"]) == sorted(expected["id"])
+        assert pruned_files == 1
+        print(f"파티션 {all_files}개 중 {pruned_files}개만 읽음 ({len(subset)}행, {seconds:.3f}초): OK")
+
+        # 5) Harmonizer.run() 결과로 파티션 저장
+        plain = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df).run()
+        try:
+            Exporter(plain, tmp_dir, "parquet", "plain", partition_by=("source", "year"))
+        except ValueError as e:
+            assert "source" in str(e)
+        else:
+            raise AssertionError("source 컬럼 없이 source 파티션을 요청하면 ValueError가 나야 함")
+        assert not os.path.exists(os.path.join(tmp_dir, "plain_parquet"))
+
+        gui_result = build_preview_dataframe(past_df, late_df, integ_df)
+        Exporter(gui_result, tmp_dir, "parquet", "gui", partition_by=("source", "year")).export()
+        gui_dir = os.path.join(tmp_dir, "gui_parquet")
+        assert sorted(os.listdir(gui_dir)) == ["source=integ", "source=late", "source=past"]
+        gui_dataset = ds.dataset(gui_dir, format="parquet", partitioning="hive")
+        assert gui_dataset.count_rows() == len(gui_result)
+        assert gui_dataset.count_rows(filter=ds.field("source") == "integ") == (gui_result["source"] == "integ").sum()
+        print("Harmonizer.run() / GUI 결과 source/year 파티션: OK")
@@ -0,0 +1,109 @@
+"""
+SQLite 전문 검색 내보내기 확인 (합성 데이터, 네트워크 불필요)
+
+- Exporter(export_format='sqlite'): 문서 테이블 + FTS5(trigram) 색인, 다시 읽으면 같은 값
+- DocumentSearch.search 결과가 pandas str.contains 전체 스캔 결과와 같음
+  (3글자 이상 FTS5 / 2글자 이하 LIKE / 컬럼 지정 / 회신일자 범위)
+- 검색 1회 소요 시간 비교
+
+실행: python test/exporter/sqlite_fts_test.py [전체 행 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "test", "harmonizer"))
+
+from bench_harmonizer import make_corpus
+from exporter.exporter import Exporter
+from exporter.sqlite_fts import FTS_COLUMNS, DocumentSearch
+from harmonizer.main import Harmonizer
+
+# 본문에 섞어 넣을 검색어
+KEYWORDS = ["전자금융거래", "신용카드 발급", "보험", "투자일임업자", "퇴직연금"]
+
+
+def inject_keywords(df: pd.DataFrame, seed: int = 0) -> pd.DataFrame:
+    """일부 행의 제목/본문에 검색어 삽입"""
+    rng = random.Random(seed)
+    df = df.copy()
+    for column in FTS_COLUMNS:
+        values = df[column].astype(object).tolist()
+        for i in range(len(values)):
+            if rng.random() < 0.05:
+                values[i] = f"{values[i]} {rng.choice(KEYWORDS)}에 관한 내용"
+        df[column] = pd.Series(values, index=df.index, dtype=df[column].dtype)
+    return df
+
+
+def scan(df: pd.DataFrame, query: str, columns=FTS_COLUMNS, start_date=None, end_date=None) -> set:
+    """pandas 전체 스캔 검색 (비교 기준)"""
+    mask = pd.Series(True, index=df.index)
+    for term in query.split():
+        hit = pd.Series(False, index=df.index)
+        for column in columns:
+            hit |= df[column].str.contains(term, regex=False, na=False)
+        mask &= hit
+    if start_date:
+        mask &= df["회신일자"] >= start_date
+    if end_date:
+        mask &= df["회신일자"] <= end_date
+    return set(df.loc[mask, "id"])
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    result = inject_keywords(Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df).run())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start = time.perf_counter()
+        paths = Exporter(result, tmp_dir, "sqlite").export()
+        build_seconds = time.perf_counter() - start
+        db_path = str(paths[0])
+        assert paths[0].name == "db_i.db"
+
+        with DocumentSearch(db_path) as search:
+            assert search.fts_columns == list(FTS_COLUMNS)
+
+            # 전체 행 다시 읽기
+            loaded = search.search("", limit=None).sort_values("id", ignore_index=True)
+            assert len(loaded) == len(result)
+            assert loaded["제목"].tolist() == result["제목"].tolist()
+            assert loaded["회답"].fillna("").tolist() == result["회답"].tolist()
+            assert loaded["회신일자"].equals(result["회신일자"])
+            print(f"SQLite 저장 ({len(result)}행, {build_seconds:.2f}초, "
+                  f"{os.path.getsize(db_path) / 2**20:.1f}MiB) 및 다시 읽기: OK")
+
+            cases = [
+                ("전자금융거래", FTS_COLUMNS, None, None),
+                ("투자일임업자 관한", FTS_COLUMNS, None, None),
+                ("보험", FTS_COLUMNS, None, None),
+                ("신용카드 발급", ("제목",), None, None),
+                ("퇴직연금", ("회답", "이유"), "2010-01-01", "2015-12-31"),
+                ('"따옴표" OR', FTS_COLUMNS, None, None),
+            ]
+            for query, columns, start_date, end_date in cases:
+                start = time.perf_counter()
+                hits = search.search(query, columns=columns, limit=None, start_date=start_date, end_date=end_date)
+                search_ms = (time.perf_counter() - start) * 1000
+                start = time.perf_counter()
+                expected = scan(result, query, columns, start_date, end_date)
+                scan_ms = (time.perf_counter() - start) * 1000
+                assert set(hits["id"]) == expected, query
+                assert search.count(query, columns, start_date, end_date) == len(expected)
+                print(f"'{query}' {list(columns)}: {len(expected)}건, "
+                      f"FTS5 {search_ms:.1f}ms / str.contains {scan_ms:.1f}ms: OK")
+
+            try:
+                search.search("전자금융", columns=("담당자",))
+                raise AssertionError("색인하지 않은 컬럼 검색이 허용됨")
+            except ValueError:
+                pass
@@ -0,0 +1,69 @@
+"""
+GUI 로그 큐 일괄 처리 확인 (Tk 화면 불필요)
+
+- 64개 스레드가 QueueWriter로 tqdm 형식 줄을 쏟아내는 동안 drain_queue로 tick마다 한 번에 꺼냄
+- tick당 꺼내는 수는 한도 이하, 전체 줄은 LogFile에 순서대로 모두 기록
+
+실행: python test/gui/log_queue_test.py [스레드당 줄 수]
+"""
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from gui.runtime import LogFile, QueueWriter, drain_queue
+
+WORKERS = 64
+MAX_PER_TICK = 5000
+
+
+if __name__ == "__main__":
+    lines_per_worker = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    log_queue: queue.Queue = queue.Queue()
+
+    def produce(worker: int) -> None:
+        writer = QueueWriter(log_queue.put)
+        for i in range(lines_per_worker):
+            # tqdm처럼 \r로 다시 그리는 진행 표시
+            writer.write(f"\rworker{worker:02d} {i}")
+        writer.flush()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_file = LogFile(Path(tmp_dir) / "logs")
+        producers = [threading.Thread(target=produce, args=(worker,)) for worker in range(WORKERS)]
+        start = time.perf_counter()
+        for thread in producers:
+            thread.start()
+
+        ticks, largest_batch, slowest_tick = 0, 0, 0.0
+        while any(thread.is_alive() for thread in producers) or not log_queue.empty():
+            tick_start = time.perf_counter()
+            messages = drain_queue(log_queue, MAX_PER_TICK)
+            log_file.write_lines(messages)
+            slowest_tick = max(slowest_tick, time.perf_counter() - tick_start)
+            largest_batch = max(largest_batch, len(messages))
+            ticks += 1
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        log_file.close()
+
+        assert largest_batch <= MAX_PER_TICK
+        lines = log_file.path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == WORKERS * lines_per_worker
+        for worker in range(WORKERS):
+            own = [int(line.split()[1]) for line in lines if line.startswith(f"worker{worker:02d} ")]
+            assert own == list(range(lines_per_worker))
+        print(
+            f"{len(lines)}줄, {ticks} tick, tick당 최대 {largest_batch}줄, "
+            f"최장 tick {slowest_tick * 1000:.1f}ms, {elapsed:.2f}초: OK"
+        )
+
+    assert drain_queue(queue.Queue(), MAX_PER_TICK) == []
+    print("빈 큐: OK")
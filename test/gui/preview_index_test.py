@@ -0,0 +1,100 @@
+"""
+미리보기 검색/필터 색인(gui.preview_index) 확인 (합성 데이터, 네트워크/화면 불필요)
+
+- 검색어/구분/분야/회신일자 조건 결과가 pandas 전체 스캔 결과와 같음
+- 색인 생성 시간과 조건 1회 소요 시간
+
+실행: python test/gui/preview_index_test.py [전체 행 수]
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, "test", "harmonizer"))
+
+from bench_harmonizer import make_corpus
+from gui.preview_index import PreviewIndex
+from gui.services import build_preview_dataframe
+from gui.settings import SEARCH_TEXT_COLUMNS
+
+KEYWORDS = ["전자금융거래", "신용카드", "보험업법", "투자일임", "Fintech"]
+
+
+def inject_keywords(df: pd.DataFrame, seed: int = 0) -> pd.DataFrame:
+    rng = random.Random(seed)
+    for column in SEARCH_TEXT_COLUMNS:
+        values = df[column].astype(object).tolist()
+        for i in range(len(values)):
+            if rng.random() < 0.05:
+                values[i] = f"{values[i]} ({rng.choice(KEYWORDS)}에 관한 내용)"
+        df[column] = pd.Series(values, index=df.index, dtype=df[column].dtype)
+    return df
+
+
+def scan(df, query="", categories=None, start_date=None, end_date=None) -> np.ndarray:
+    """pandas 전체 스캔 (비교 기준)"""
+    mask = pd.Series(True, index=df.index)
+    for column, value in (categories or {}).items():
+        if value:
+            mask &= df[column].astype(object) == value
+    dates = pd.to_datetime(df["회신일자"], errors="coerce")
+    if start_date:
+        mask &= dates >= start_date
+    if end_date:
+        mask &= dates <= end_date
+    text = df[SEARCH_TEXT_COLUMNS[0]].astype(str)
+    for column in SEARCH_TEXT_COLUMNS[1:]:
+        text = text + " " + df[column].astype(str)
+    text = text.str.lower()
+    for term in query.lower().split():
+        mask &= text.str.contains(term, regex=False)
+    return np.flatnonzero(mask.to_numpy())
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    preview_df = inject_keywords(build_preview_dataframe(past_df, late_df, integ_df))
+
+    start = time.perf_counter()
+    index = PreviewIndex(preview_df)
+    build_seconds = time.perf_counter() - start
+    print(f"색인 생성: {len(preview_df)}행, 어휘 {len(index.vocabulary)}개, {build_seconds:.2f}초")
+
+    assert index.categories("구분") == sorted(set(preview_df["구분"].astype(str)) - {""})
+    assert len(index.filter()) == len(preview_df)
+
+    cases = [
+        dict(query="전자금융"),
+        dict(query="fintech"),
+        dict(query="신용카드 관한"),
+        dict(query="보험업법", categories={"구분": "법령해석"}),
+        dict(categories={"분야": "보험"}),
+        dict(start_date="2010-01-01", end_date="2012-12-31"),
+        dict(query="투자일임", categories={"구분": "비조치의견서", "분야": "금융투자"}, start_date="2015-03-01"),
+        dict(query="없는검색어"),
+        dict(categories={"구분": "없는구분"}),
+    ]
+    for case in cases:
+        start = time.perf_counter()
+        positions = index.filter(**case)
+        filter_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        expected = scan(preview_df, **case)
+        scan_ms = (time.perf_counter() - start) * 1000
+        assert np.array_equal(positions, expected), case
+        print(f"{case}: {len(positions)}건, 색인 {filter_ms:.1f}ms / 전체 스캔 {scan_ms:.1f}ms: OK")
+
+    try:
+        index.filter(start_date="2020-13-45")
+        raise AssertionError("잘못된 날짜가 허용됨")
+    except ValueError:
+        pass
+    print("잘못된 날짜 형식 오류: OK")
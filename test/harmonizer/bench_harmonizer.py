@@ -0,0 +1,150 @@
+"""
+Harmonizer 벤치마크 (합성 데이터, 네트워크 불필요)
+
+past/late/integ 합성 데이터프레임으로 Harmonizer.run() 소요 시간을 측정하고,
+행 단위 apply(combine_fields) 방식과 컬럼 단위 벡터 연산(_combine_columns) 결과가 같은지 확인한다.
+
+실행: python test/harmonizer/bench_harmonizer.py [전체 행 수]
+"""
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from harmonizer.main import Harmonizer
+
+# 각 소스 데이터프레임의 텍스트 컬럼 → 결합 대상 (행 단위 방식 비교용)
+COMBINE_SPECS = {
+    "past": [["inquiry", "fact", "baseLaw"], ["answer"], ["reason"]],
+    "late": [["answer"], ["reason"]],
+    "integ": [["answer_conclusion", "answer_content"], ["plan"]],
+}
+
+
+def _text(rng: random.Random, prefix: str, i: int):
+    """본문 텍스트 (일부는 None/빈 문자열/공백)"""
+    roll = rng.random()
+    if roll < 0.05:
+        return None
+    if roll < 0.08:
+        return "   "
+    return f"  {prefix} {i} " + "가나다라마바사 " * rng.randint(5, 40)
+
+
+def _date(rng: random.Random):
+    if rng.random() < 0.03:
+        return None
+    return f"{rng.randint(2000, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def _obj(values: list) -> pd.Series:
+    """크롤러 결과(ColumnarBuilder)와 같은 object dtype 텍스트 컬럼 (None 유지)"""
+    return pd.Series(values, dtype=object)
+
+
+def make_corpus(total_rows: int, seed: int = 0):
+    """past:late:integ = 3:5:2 비율의 합성 데이터프레임"""
+    rng = random.Random(seed)
+    n_past, n_late = total_rows * 3 // 10, total_rows // 2
+    n_integ = total_rows - n_past - n_late
+
+    past_df = pd.DataFrame({
+        "rownumber": range(n_past),
+        "pastreqIdx": range(n_past),
+        "pastreqType": "법령해석",
+        "pastreqSubject": _obj([f"과거 제목 {i}" for i in range(n_past)]),
+        "serialNum": _obj([f"P{i}" for i in range(n_past)]),
+        "regDate": _obj([_date(rng) for _ in range(n_past)]),
+        "inquiry": _obj([_text(rng, "질의", i) for i in range(n_past)]),
+        "fact": _obj([_text(rng, "사실", i) for i in range(n_past)]),
+        "baseLaw": _obj([_text(rng, "법령", i) for i in range(n_past)]),
+        "answer": _obj([_text(rng, "회답", i) for i in range(n_past)]),
+        "reason": _obj([_text(rng, "이유", i) for i in range(n_past)]),
+    })
+    late_df = pd.DataFrame({
+        "rownumber": range(n_late),
+        "idx": range(n_late),
+        "gubun": _obj([rng.choice(["법령해석", "비조치의견서"]) for _ in range(n_late)]),
+        "category": _obj([rng.choice(["은행", "보험", "금융투자", None]) for _ in range(n_late)]),
+        "list_title": _obj([f"최근 제목 {i}" for i in range(n_late)]),
+        "regDate": _obj([_date(rng) for _ in range(n_late)]),
+        "number": _obj([f"L{i}" for i in range(n_late)]),
+        "detail_title": _obj([f"최근 제목 {i}" for i in range(n_late)]),
+        "registrant": _obj([rng.choice(["은행과", "보험과", None]) for _ in range(n_late)]),
+        "reply_date": _obj([_date(rng) for _ in range(n_late)]),
+        "inquiry": _obj([_text(rng, "질의", i) for i in range(n_late)]),
+        "answer": _obj([_text(rng, "회답", i) for i in range(n_late)]),
+        "reason": _obj([_text(rng, "이유", i) for i in range(n_late)]),
+    })
+    integ_df = pd.DataFrame({
+        "rownumber": range(n_integ),
+        "dataIdx": range(n_integ),
+        "pastreqType": "현장건의 과제",
+        "list_title": _obj([f"현장 제목 {i}" for i in range(n_integ)]),
+        "replyRegDate": _obj([_date(rng) for _ in range(n_integ)]),
+        "category": _obj([rng.choice(["은행", "보험", None]) for _ in range(n_integ)]),
+        "reply_date": _obj([_date(rng) for _ in range(n_integ)]),
+        "inquiry": _obj([_text(rng, "질의", i) for i in range(n_integ)]),
+        "answer_conclusion": _obj([_text(rng, "결론", i) for i in range(n_integ)]),
+        "answer_content": _obj([_text(rng, "내용", i) for i in range(n_integ)]),
+        "plan": _obj([_text(rng, "계획", i) for i in range(n_integ)]),
+    })
+    return past_df, late_df, integ_df
+
+
+def combine_fields(fields: list) -> str:
+    """기존 행 단위 결합 (비교 기준): None/빈 값 제외 후 빈 줄로 결합"""
+    valid_fields = [str(f).strip() for f in fields if f is not None and str(f).strip()]
+    return "\n\n".join(valid_fields)
+
+
+def combine_rowwise(harmonizer: Harmonizer, frames: dict) -> list:
+    """기존 방식: df.apply(lambda row: combine_fields([...]), axis=1)"""
+    results = []
+    for name, specs in COMBINE_SPECS.items():
+        df = frames[name]
+        for columns in specs:
+            results.append(df.apply(
+                lambda row: combine_fields([row.get(c, '') for c in columns]), axis=1
+            ))
+    return results
+
+
+def combine_vectorized(harmonizer: Harmonizer, frames: dict) -> list:
+    """개선 방식: 컬럼 단위 문자열 연산"""
+    return [
+        harmonizer._combine_columns(frames[name], columns)
+        for name, specs in COMBINE_SPECS.items()
+        for columns in specs
+    ]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    frames = {"past": past_df, "late": late_df, "integ": integ_df}
+    harmonizer = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df)
+
+    rowwise, rowwise_seconds = timed(combine_rowwise, harmonizer, frames)
+    vectorized, vectorized_seconds = timed(combine_vectorized, harmonizer, frames)
+    for expected, actual in zip(rowwise, vectorized):
+        assert expected.astype(object).tolist() == actual.astype(object).tolist(), "결합 결과가 다릅니다"
+
+    result, run_seconds = timed(harmonizer.run)
+
+    print(f"합성 데이터: {total_rows}행 (past {len(past_df)}, late {len(late_df)}, integ {len(integ_df)})")
+    print(f"필드 결합 - 행 단위 apply : {rowwise_seconds:.2f}초")
+    print(f"필드 결합 - 벡터 연산     : {vectorized_seconds:.2f}초 ({rowwise_seconds / vectorized_seconds:.1f}배)")
+    print(f"Harmonizer.run() 전체    : {run_seconds:.2f}초 (결과 {len(result)}행)")
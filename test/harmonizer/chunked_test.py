@@ -0,0 +1,87 @@
+"""
+Harmonizer 청크 실행(run_chunked) 확인 (합성 데이터, 네트워크 불필요)
+
+- 청크 입력 → 외부 병합 정렬 출력 청크를 이어 붙이면 run() 결과와 같아야 함 (행 순서/id/값)
+- 회신일자 없는 행은 입력 순서대로 마지막, 출력 청크 크기 준수
+- 소스 간 중복 제거 결과(collisions)도 run()과 같아야 함
+- 출력 청크를 하나씩 소비할 때의 최대 메모리 비교 (tracemalloc)
+
+실행: python test/harmonizer/chunked_test.py [전체 행 수]
+"""
+import os
+import sys
+import tracemalloc
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_harmonizer import make_corpus
+from harmonizer.main import Harmonizer
+
+
+def split(df: pd.DataFrame, size: int):
+    """원본 데이터프레임을 size 행씩 나눈 청크 iterator"""
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+def peak_mib(func) -> float:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2 ** 20
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+
+    # 소스 간 중복 문서 일부 추가 (past 제목/날짜/일련번호를 late에 복사)
+    late_df = late_df.copy()
+    late_df.loc[:99, 'list_title'] = past_df['pastreqSubject'].iloc[:100].to_numpy()
+    late_df.loc[:99, 'reply_date'] = past_df['regDate'].iloc[:100].to_numpy()
+    late_df.loc[:99, 'number'] = past_df['serialNum'].iloc[:100].to_numpy()
+    # integ는 일련번호(dataIdx) 체계가 달라 제목 + 회신일자만 같은 문서도 중복
+    integ_df = integ_df.copy()
+    integ_df.loc[:49, 'list_title'] = late_df['list_title'].iloc[200:250].to_numpy()
+    integ_df.loc[:49, 'reply_date'] = late_df['reply_date'].iloc[200:250].to_numpy()
+
+    expected_harmonizer = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df, keep_source=True,
+                                     dedup=True)
+    expected = expected_harmonizer.run()
+
+    chunk_harmonizer = Harmonizer(past_df=None, late_df=None, integ_df=None, keep_source=True, dedup=True)
+    chunks = list(chunk_harmonizer.run_chunked(
+        past_chunks=split(past_df, 1_500),
+        late_chunks=split(late_df, 2_000),
+        integ_chunks=split(integ_df, 700),
+        chunk_size=3_000,
+    ))
+    assert all(len(chunk) == 3_000 for chunk in chunks[:-1])
+    result = pd.concat(chunks, ignore_index=True)
+
+    assert list(result["id"]) == list(range(1, len(result) + 1))
+    pd.testing.assert_frame_equal(result, expected, check_categorical=False)
+    pd.testing.assert_frame_equal(chunk_harmonizer.collisions, expected_harmonizer.collisions)
+    # 회신일자가 없는 integ 행은 제목만으로 판정하지 않음
+    assert len(chunk_harmonizer.collisions) == 100 + late_df['reply_date'].iloc[200:250].notna().sum()
+    assert (chunk_harmonizer.collisions['dropped_source'] == 'integ').sum() >= 40
+    assert result["회신일자"].isna().to_numpy()[-1]
+    print(f"청크 {len(chunks)}개 ({len(result)}행) = run() 결과, 중복 {len(chunk_harmonizer.collisions)}건 일치: OK")
+
+    # 최대 메모리: 전체 실행 vs 출력 청크를 하나씩 소비
+    def run_all():
+        Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df).run()
+
+    def run_streaming():
+        harmonizer = Harmonizer(past_df=None, late_df=None, integ_df=None)
+        for _ in harmonizer.run_chunked(split(past_df, 1_500), split(late_df, 2_000), split(integ_df, 700),
+                                        chunk_size=2_000):
+            pass
+
+    print(f"최대 메모리(입력 제외): run() {peak_mib(run_all):.1f}MiB / run_chunked() {peak_mib(run_streaming):.1f}MiB")
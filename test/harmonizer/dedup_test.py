@@ -0,0 +1,141 @@
+"""
+Harmonizer 소스 간 중복 제거 확인 (합성 데이터, 네트워크 불필요)
+
+- 정규화(공백/문장부호/전각 문자) 후 같은 제목 + 회신일자 + 일련번호는 한 건만 남김
+- 기본 우선순위(late > integ > past)와 사용자 지정 우선순위
+- 제거된 문서는 collisions 보고서에 기록
+- 기본값(dedup=False)은 기존과 같이 모든 행 반환, GUI(build_preview_dataframe)는 중복 제거 사용
+- integ(일련번호가 dataIdx)는 late/past와 정규화한 제목 + 회신일자로 판정, 소스별 제거 행 수 로깅
+
+실행: python test/harmonizer/dedup_test.py
+"""
+import logging
+import os
+import sys
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from gui.services import build_preview_dataframe
+from harmonizer.main import Harmonizer
+
+
+def make_frames():
+    past_df = pd.DataFrame({
+        "pastreqType": ["법령해석", "법령해석", "법령해석"],
+        "pastreqSubject": ["전자금융거래법 제2조 해석", "「보험업법」 시행령 관련 질의", "제목 없음 대상"],
+        "serialNum": ["130001", "130002", None],
+        "regDate": ["2013-12-30", "2014-01-02", None],
+        "inquiry": ["질의", "질의", "질의"],
+        "fact": [None, None, None],
+        "baseLaw": [None, None, None],
+        "answer": ["과거 회답", "과거 회답", "과거 회답"],
+        "reason": [None, None, None],
+    }, dtype=object)
+    late_df = pd.DataFrame({
+        "gubun": ["법령해석", "법령해석"],
+        "category": ["전자금융", "보험"],
+        # 공백/문장부호/전각 문자만 다른 같은 제목
+        "list_title": ["전자금융거래법 제2조  해석", "｢보험업법｣ 시행령 관련 질의!"],
+        "registrant": ["전자금융과", "보험과"],
+        "reply_date": ["2013.12.30", "2014-01-02"],
+        "number": ["130001", " 130002 "],
+        "inquiry": ["질의", "질의"],
+        "answer": ["최근 회답", "최근 회답"],
+        "reason": [None, None],
+    }, dtype=object)
+    return past_df, late_df
+
+
+def make_integ_frame():
+    """late/past 문서와 제목 + 회신일자가 같고 일련번호(dataIdx)는 다른 integ 문서"""
+    return pd.DataFrame({
+        "pastreqType": ["현장건의 과제", "현장건의 과제", "현장건의 과제"],
+        "category": ["전자금융", "보험", None],
+        "list_title": ["전자금융거래법 제2조 해석", "「보험업법」 시행령 관련 질의", "현장 건의만 있는 과제"],
+        "reply_date": ["2013-12-30", "2014.01.02", "2014-01-02"],
+        "dataIdx": [5001, 5002, 5003],
+        "inquiry": ["질의", "질의", "질의"],
+        "answer_conclusion": ["현장 회답", "현장 회답", "현장 회답"],
+        "answer_content": [None, None, None],
+        "plan": [None, None, None],
+    }, dtype=object)
+
+
+def check_integ_twins():
+    past_df, late_df = make_frames()
+    integ_df = make_integ_frame()
+    messages = []
+    handler = logging.Handler()
+    handler.emit = lambda record: messages.append(record.getMessage())
+    logging.getLogger("harmonizer.main").addHandler(handler)
+    try:
+        # late와 integ만: 일련번호가 달라도 같은 문서 → late 유지
+        harmonizer = Harmonizer(past_df=None, late_df=late_df.iloc[:1], integ_df=integ_df, keep_source=True, dedup=True)
+        result = harmonizer.run()
+        assert sorted(result["source"]) == ["integ", "integ", "late"], result["source"].tolist()
+        assert harmonizer.collisions[["kept_source", "kept_일련번호", "dropped_source", "dropped_일련번호"]
+                                     ].values.tolist() == [["late", "130001", "integ", 5001]]
+
+        # past와 integ만: integ가 우선
+        harmonizer = Harmonizer(past_df=past_df, late_df=None, integ_df=integ_df, keep_source=True, dedup=True)
+        result = harmonizer.run()
+        assert sorted(result["source"]) == ["integ", "integ", "integ", "past"]
+        assert set(harmonizer.collisions["kept_일련번호"]) == {5001, 5002}
+
+        # 세 소스: late/past는 일련번호로, integ는 제목 + 회신일자로 → late 2건과 나머지 1건씩만 남음
+        messages.clear()
+        harmonizer = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df, keep_source=True, dedup=True)
+        result = harmonizer.run()
+        assert sorted(result["source"]) == ["integ", "late", "late", "past"], result["source"].tolist()
+        assert set(harmonizer.collisions["kept_source"]) == {"late"}
+        summary = [message for message in messages if message.startswith("소스별 중복 제거 행 수")]
+        assert len(summary) == 1 and "past 2행" in summary[0] and "integ 2행" in summary[0], messages
+    finally:
+        logging.getLogger("harmonizer.main").removeHandler(handler)
+
+    # 같은 체계(late/past)에서 일련번호만 다르면 별개 문서
+    late_other = late_df.assign(number=["140001", "140002"])
+    result = Harmonizer(past_df=past_df, late_df=late_other, integ_df=None, dedup=True).run()
+    assert len(result) == 5
+    print("integ ↔ late/past 중복 (일련번호 체계가 다르면 제목 + 회신일자로 판정): OK")
+
+
+if __name__ == "__main__":
+    past_df, late_df = make_frames()
+
+    # 기본 우선순위: late 유지
+    harmonizer = Harmonizer(past_df=past_df, late_df=late_df, integ_df=None, keep_source=True, dedup=True)
+    result = harmonizer.run()
+    assert len(result) == 3, len(result)
+    assert sorted(result["source"]) == ["late", "late", "past"]
+    assert (result.loc[result["source"] == "late", "회답"] == "최근 회답").all()
+    assert len(harmonizer.collisions) == 2
+    assert set(harmonizer.collisions["dropped_source"]) == {"past"}
+    assert set(harmonizer.collisions["kept_source"]) == {"late"}
+    print("기본 우선순위(late 유지): OK")
+
+    # 사용자 지정 우선순위: past 유지
+    harmonizer = Harmonizer(past_df=past_df, late_df=late_df, integ_df=None, keep_source=True,
+                            source_precedence=("past", "late", "integ"), dedup=True)
+    result = harmonizer.run()
+    assert sorted(result["source"]) == ["past", "past", "past"]
+    print("사용자 지정 우선순위(past 유지): OK")
+
+    # 중복 제거 끄기 / 기본값
+    result = Harmonizer(past_df=past_df, late_df=late_df, integ_df=None, dedup=False).run()
+    assert len(result) == 5
+    default = Harmonizer(past_df=past_df, late_df=late_df, integ_df=None)
+    assert len(default.run()) == 5 and default.collisions.empty
+    print("중복 제거 끄기 / 기본값은 모든 행 반환: OK")
+
+    # GUI 결과는 중복 제거 사용
+    preview = build_preview_dataframe(past_df, late_df, None)
+    assert sorted(preview["source"]) == ["late", "late", "past"]
+    print("GUI 결과 중복 제거: OK")
+    print(harmonizer.collisions.to_string())
+
+    check_integ_twins()
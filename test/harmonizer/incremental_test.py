@@ -0,0 +1,121 @@
+"""
+Harmonizer 증분 실행(run_incremental) 확인 (합성 데이터, 네트워크 불필요)
+
+- 기존 문서의 id는 바뀌지 않아야 함
+- 같은 문서(source + 일련번호)는 내용만 갱신
+- 새 문서는 기존 최대 id 다음 번호로 끝에 추가
+- 바뀐 행만 갱신: 기존 결과 dtype 유지, 입력으로 받은 기존 결과는 바뀌지 않음
+- 새 문서도 기존 문서와 중복 판정 (우선순위가 낮으면 제거, 높으면 기존 문서의 id를 이어받음)
+- run_incremental 이후 같은 인스턴스의 run()은 keep_source 설정을 그대로 따름
+- 기존 id를 숫자로 읽을 수 없으면 새 id는 1부터
+
+실행: python test/harmonizer/incremental_test.py
+"""
+import os
+import sys
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_harmonizer import make_corpus
+from dedup_test import make_frames, make_integ_frame
+from harmonizer.main import Harmonizer
+
+
+def check_dedup_against_existing():
+    past_df, late_df = make_frames()
+    integ_df = make_integ_frame()
+
+    # 기존 결과: past 3건 + integ 중 현장 과제만 있는 1건
+    existing = Harmonizer(past_df=past_df, late_df=None, integ_df=integ_df.iloc[2:], keep_source=True, dedup=True).run()
+    past_rows = existing[existing["source"] == "past"]
+    past_ids = dict(zip(past_rows["일련번호"], past_rows["id"]))
+
+    # 증분 1: late 2건 (past와 같은 문서) → 우선순위가 높은 late가 past 문서의 id/위치를 이어받음
+    harmonizer = Harmonizer(past_df=None, late_df=late_df, integ_df=None, dedup=True)
+    result = harmonizer.run_incremental(existing)
+    assert len(result) == len(existing), (len(result), len(existing))
+    late_rows = result[result["source"] == "late"]
+    assert sorted(late_rows["id"]) == sorted([past_ids["130001"], past_ids["130002"]])
+    assert (late_rows["회답"] == "최근 회답").all()
+    assert set(harmonizer.collisions["dropped_source"]) == {"past"}
+
+    # 증분 2: integ 2건 (late와 일련번호 체계가 달라도 제목 + 회신일자가 같음) → 우선순위가 낮아 추가하지 않음
+    harmonizer = Harmonizer(past_df=None, late_df=None, integ_df=integ_df.iloc[:2], dedup=True)
+    second = harmonizer.run_incremental(result)
+    assert len(second) == len(result)
+    pd.testing.assert_frame_equal(second, result)
+    assert list(harmonizer.collisions["dropped_source"]) == ["integ", "integ"]
+
+    # 중복 제거를 끄면 그대로 추가
+    third = Harmonizer(past_df=None, late_df=None, integ_df=integ_df.iloc[:2], dedup=False).run_incremental(result)
+    assert len(third) == len(result) + 2
+    print("새 문서와 기존 문서 중복 판정 (late가 past id 이어받음, integ 제거): OK")
+
+
+def check_keep_source_scope_and_ids():
+    past_df, late_df = make_frames()
+    existing = Harmonizer(past_df=past_df, late_df=None, integ_df=None, keep_source=True, dedup=True).run()
+
+    harmonizer = Harmonizer(past_df=None, late_df=late_df.assign(number=["140001", "140002"]), integ_df=None, dedup=True)
+    assert "source" in harmonizer.run_incremental(existing).columns
+    assert harmonizer.keep_source is False
+    assert "source" not in harmonizer.run().columns
+
+    # 읽을 수 없는 id만 있는 기존 결과: 새 문서 id는 1부터
+    broken = existing.assign(id=["a", "b", "c"])
+    result = Harmonizer(past_df=None, late_df=late_df.assign(number=["140001", "140002"]),
+                        integ_df=None, dedup=True).run_incremental(broken)
+    assert [str(v) for v in result["id"].tolist()[-2:]] == ["1", "2"], result["id"].tolist()
+    print("run_incremental 후 keep_source 복원 / 읽을 수 없는 기존 id: OK")
+
+
+if __name__ == "__main__":
+    past_df, late_df, integ_df = make_corpus(3000)
+
+    # 1차: late 일부를 제외하고 전체 실행
+    base_late = late_df.iloc[:-100]
+    existing = Harmonizer(past_df=past_df, late_df=base_late, integ_df=integ_df, keep_source=True, dedup=True).run()
+    assert "source" in existing.columns
+    ids_before = dict(zip(existing["source"].astype(str) + "|" + existing["일련번호"].astype(str), existing["id"]))
+
+    # 2차: 변경된 late 10건 + 새 late 100건만 입력
+    changed = late_df.iloc[:10].copy()
+    changed["answer"] = "변경된 회답"
+    new_rows = late_df.iloc[-100:]
+    incoming_late = pd.concat([changed, new_rows])
+
+    snapshot = existing.copy()
+    result = Harmonizer(past_df=None, late_df=incoming_late, integ_df=None, dedup=True).run_incremental(existing)
+    pd.testing.assert_frame_equal(existing, snapshot)
+    assert result.dtypes.equals(existing.dtypes), (result.dtypes, existing.dtypes)
+
+    assert len(result) == len(existing) + 100, (len(result), len(existing))
+    assert result["id"].is_unique
+
+    keys = result["source"].astype(str) + "|" + result["일련번호"].astype(str)
+    for key, doc_id in zip(keys, result["id"]):
+        if key in ids_before:
+            assert ids_before[key] == doc_id, f"id 변경됨: {key}"
+
+    updated = result[keys.isin("late|" + changed["number"])]
+    assert (updated["회답"] == "변경된 회답").all()
+
+    appended = result.iloc[len(existing):]
+    assert appended["id"].min() == existing["id"].max() + 1
+    assert set(appended["일련번호"]) == set(new_rows["number"])
+
+    # 갱신하지 않은 행은 그대로
+    untouched = ~keys.isin("late|" + changed["number"]) & (result["id"] <= existing["id"].max())
+    pd.testing.assert_frame_equal(result[untouched].reset_index(drop=True),
+                                  existing[untouched.to_numpy()[:len(existing)]].reset_index(drop=True),
+                                  check_categorical=False)
+
+    print(f"기존 {len(existing)}행 → 증분 후 {len(result)}행, 갱신 10건/추가 100건, 기존 id/dtype 유지: OK")
+
+    check_dedup_against_existing()
+    check_keep_source_scope_and_ids()
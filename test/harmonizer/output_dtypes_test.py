@@ -0,0 +1,60 @@
+"""
+Harmonizer 출력 dtype 확인 (합성 데이터, 네트워크 불필요)
+
+- 구분/분야/회신부서/source: category, 텍스트 컬럼: 문자열 dtype, 회신일자: datetime
+- 결측은 텍스트/카테고리 컬럼만 빈 문자열, 회신일자는 NaT
+- pickle 저장 후에도 dtype 유지, 이전 방식(object + fillna(''))과 크기/로드 시간 비교
+
+실행: python test/harmonizer/output_dtypes_test.py [전체 행 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_harmonizer import make_corpus
+from harmonizer.main import CATEGORY_COLUMNS, TEXT_COLUMNS, TEXT_DTYPE, Harmonizer
+
+
+def pickle_stats(df: pd.DataFrame, path: str):
+    df.to_pickle(path)
+    start = time.perf_counter()
+    loaded = pd.read_pickle(path)
+    return os.path.getsize(path), time.perf_counter() - start, loaded
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+    result = Harmonizer(past_df=past_df, late_df=late_df, integ_df=integ_df, keep_source=True).run()
+
+    for column in CATEGORY_COLUMNS:
+        assert isinstance(result[column].dtype, pd.CategoricalDtype), (column, result[column].dtype)
+        assert not result[column].isna().any(), column
+    for column in TEXT_COLUMNS:
+        assert result[column].dtype == TEXT_DTYPE, (column, result[column].dtype)
+        assert not result[column].isna().any(), column
+    assert pd.api.types.is_datetime64_any_dtype(result["회신일자"])
+    assert result["회신일자"].isna().any()  # 합성 데이터의 날짜 결측은 NaT로 유지
+    assert (result["분야"] == "").any()
+    print(f"출력 dtype ({TEXT_DTYPE.storage} 문자열): OK")
+
+    # 이전 방식: 모든 컬럼 object + fillna('')
+    legacy = result.astype(object).fillna("")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        new_size, new_seconds, loaded = pickle_stats(result, os.path.join(tmp_dir, "typed.pkl"))
+        old_size, old_seconds, _ = pickle_stats(legacy, os.path.join(tmp_dir, "legacy.pkl"))
+
+    assert loaded.dtypes.equals(result.dtypes)
+    pd.testing.assert_frame_equal(loaded, result)
+    print("pickle 저장/로드 후 dtype 유지: OK")
+    print(f"pickle 크기 : object {old_size / 2**20:.1f}MiB → {new_size / 2**20:.1f}MiB")
+    print(f"pickle 로드 : object {old_seconds:.3f}초 → {new_seconds:.3f}초")
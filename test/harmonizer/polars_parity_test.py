@@ -0,0 +1,97 @@
+"""
+Harmonizer pandas/polars 엔진 결과 비교 (합성 데이터, 네트워크 불필요, polars 필요)
+
+- 같은 입력에 대해 engine='pandas'와 engine='polars'의 행 순서/id/컬럼 값이 같아야 함
+- 소스 간 중복 제거 결과(collisions)도 같아야 함 (integ와의 제목 + 회신일자 판정 포함)
+- 일련번호는 polars 엔진에서 문자열로 통일되므로 문자열로 비교
+
+실행: python test/harmonizer/polars_parity_test.py [전체 행 수]
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_harmonizer import make_corpus
+from dedup_test import make_frames, make_integ_frame
+from harmonizer.main import Harmonizer
+
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """비교용 문자열 변환 (회신일자는 YYYY-MM-DD)"""
+    result = df.astype(str)
+    if '회신일자' in df.columns:
+        dates = pd.to_datetime(df['회신일자'].replace('', None), errors='coerce')
+        result['회신일자'] = dates.dt.strftime('%Y-%m-%d').fillna('')
+    return result
+
+
+def assert_same(expected: pd.DataFrame, actual: pd.DataFrame):
+    assert list(expected.columns) == list(actual.columns), (list(expected.columns), list(actual.columns))
+    assert len(expected) == len(actual), (len(expected), len(actual))
+    pd.testing.assert_frame_equal(normalize(expected), normalize(actual), check_dtype=False)
+
+
+def run_both(**kwargs):
+    timings = {}
+    results = {}
+    harmonizers = {}
+    for engine in ('pandas', 'polars'):
+        harmonizer = Harmonizer(engine=engine, **kwargs)
+        start = time.perf_counter()
+        results[engine] = harmonizer.run()
+        timings[engine] = time.perf_counter() - start
+        harmonizers[engine] = harmonizer
+    return results, harmonizers, timings
+
+
+if __name__ == "__main__":
+    total_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    past_df, late_df, integ_df = make_corpus(total_rows)
+
+    # 합성 코퍼스: '.' 구분 날짜와 소스 간 중복 문서 일부 추가
+    late_df = late_df.copy()
+    late_df.loc[::7, 'reply_date'] = late_df.loc[::7, 'reply_date'].str.replace('-', '.')
+    duplicates = past_df.iloc[:200]
+    late_df.loc[:199, 'list_title'] = (duplicates['pastreqSubject'] + '!').to_numpy()
+    late_df.loc[:199, 'reply_date'] = duplicates['regDate'].to_numpy()
+    late_df.loc[:199, 'number'] = duplicates['serialNum'].to_numpy()
+
+    for keep_source in (False, True):
+        results, harmonizers, timings = run_both(
+            past_df=past_df, late_df=late_df, integ_df=integ_df, keep_source=keep_source, dedup=True
+        )
+        assert_same(results['pandas'], results['polars'])
+        assert_same(harmonizers['pandas'].collisions, harmonizers['polars'].collisions)
+    assert len(harmonizers['polars'].collisions) > 0
+    print(f"합성 데이터 {total_rows}행: 결과 {len(results['polars'])}행, "
+          f"중복 {len(harmonizers['polars'].collisions)}건 일치: OK")
+    print(f"pandas {timings['pandas']:.2f}초 / polars {timings['polars']:.2f}초")
+
+    # 정규화 규칙(공백/문장부호/전각 문자)과 우선순위
+    past_small, late_small = make_frames()
+    for precedence in (("late", "integ", "past"), ("past", "late", "integ")):
+        results, harmonizers, _ = run_both(past_df=past_small, late_df=late_small, integ_df=None,
+                                           keep_source=True, dedup=True, source_precedence=precedence)
+        assert_same(results['pandas'], results['polars'])
+        assert_same(harmonizers['pandas'].collisions, harmonizers['polars'].collisions)
+    # integ(일련번호 체계가 다른 소스)와의 제목 + 회신일자 판정
+    results, harmonizers, _ = run_both(past_df=past_small, late_df=late_small, integ_df=make_integ_frame(),
+                                       keep_source=True, dedup=True)
+    assert_same(results['pandas'], results['polars'])
+    assert_same(harmonizers['pandas'].collisions, harmonizers['polars'].collisions)
+    assert set(harmonizers['polars'].collisions['dropped_source']) == {'past', 'integ'}
+    print("중복 제거 정규화/우선순위 일치: OK")
+
+    # 중복 제거 끄기, 빈 입력
+    results, _, _ = run_both(past_df=past_small, late_df=late_small, integ_df=None, dedup=False)
+    assert_same(results['pandas'], results['polars'])
+    results, _, _ = run_both(past_df=None, late_df=None, integ_df=None)
+    assert_same(results['pandas'], results['polars'])
+    print("중복 제거 끄기/빈 입력 일치: OK")
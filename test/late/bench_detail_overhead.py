@@ -0,0 +1,78 @@
+"""
+상세 크롤링 항목당 오버헤드 벤치마크 (네트워크 제외)
+
+detail_test.html 을 응답으로 돌려주는 stub fetcher를 사용하여
+항목마다 fetcher/parser를 새로 만드는 기존 방식과
+스레드별 인스턴스를 재사용하는 DetailCrawler 방식을 비교한다.
+
+실행: python test/late/bench_detail_overhead.py [반복 횟수]
+"""
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from late.detail_crawler import DetailCrawler
+from late.detail.law.fetcher import LawFetcher
+from late.detail.law.parser import LawParser
+
+HTML_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "detail_test.html")
+with open(HTML_PATH, encoding="utf-8") as f:
+    HTML_CONTENT = f.read()
+
+
+class StubLawFetcher(LawFetcher):
+    """네트워크 요청 없이 저장된 HTML을 반환하는 fetcher"""
+
+    def fetch(self, idx: int):
+        return HTML_CONTENT
+
+
+def bench_fresh_instances(crawler: DetailCrawler, iterations: int) -> float:
+    """기존 방식: 항목마다 fetcher/parser 생성"""
+    start = time.perf_counter()
+    for idx in range(iterations):
+        fetcher = StubLawFetcher(delay_seconds=0, session=crawler.session)
+        parser = LawParser()
+        parser.parse(fetcher.fetch(idx), idx, "법령해석")
+    return time.perf_counter() - start
+
+
+def bench_reused_instances(crawler: DetailCrawler, iterations: int) -> float:
+    """개선 방식: DetailCrawler.get_detail_item (스레드별 인스턴스 재사용)"""
+    start = time.perf_counter()
+    for idx in range(iterations):
+        crawler.get_detail_item(idx, "법령해석")
+    return time.perf_counter() - start
+
+
+def bench_construction_only(crawler: DetailCrawler, iterations: int) -> float:
+    """파싱을 제외한 인스턴스 생성 비용만 측정"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        StubLawFetcher(delay_seconds=0, session=crawler.session)
+        LawParser()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    crawler = DetailCrawler(delay_seconds=0, max_workers=1)
+    crawler.fetcher_map["법령해석"] = StubLawFetcher
+
+    # 워밍업 (import, 정규식 캐시 등)
+    bench_reused_instances(crawler, 5)
+
+    fresh = bench_fresh_instances(crawler, iterations)
+    reused = bench_reused_instances(crawler, iterations)
+    construction = bench_construction_only(crawler, iterations * 10)
+
+    print(f"반복 횟수: {iterations}")
+    print(f"항목마다 생성 : {fresh / iterations * 1000:.3f} ms/item")
+    print(f"스레드별 재사용: {reused / iterations * 1000:.3f} ms/item")
+    print(f"인스턴스 생성 비용: {construction / (iterations * 10) * 1_000_000:.1f} us/item")
+    print(f"실패 항목: {len(crawler.failed_items)}건")